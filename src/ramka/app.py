@@ -1,9 +1,25 @@
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+import warnings
+from inspect import isclass
+from threading import local
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
-from ramka.middleware import Middleware
-from ramka.request import Request
+from ramka.middleware import Middleware, run_hooks
+from ramka.request import BodyTooLargeError, Request
 from ramka.response import Response
-from ramka.routing import BaseRouter, SimpleRouter
+from ramka.routing import BaseRouter, ResolvedRoute, Route, SimpleRouter
 from ramka.static import BaseStaticFilesEngine, WhiteNoiseEngine
 from ramka.templates import BaseTemplateEngine, JinjaTemplateEngine
 from ramka.views import (
@@ -14,10 +30,13 @@ from ramka.views import (
 )
 
 
-class App:
+class App:  # pylint: disable=too-many-instance-attributes
     """The main application class.
 
     This is the entrypoint for the application.
+
+    Other applications can be mounted under path prefixes (see the `mount` method), so
+    multiple applications can be served using a single WSGI entry point.
     """
 
     def __init__(
@@ -35,6 +54,8 @@ class App:
         http_405_method_not_allowed_handler: Optional[Callable] = None,
         error_handler: Optional[Callable] = None,
         middleware_classes: Optional[List[Type[Middleware]]] = None,
+        max_body_size: Optional[int] = None,
+        response_kwargs: Optional[Dict] = None,
     ):
         """Initialize the application.
 
@@ -54,9 +75,17 @@ class App:
                 HTTP 404 error (Not found).
             http_405_method_not_allowed_handler (Optional[Callable]): The handler to use
                 for HTTP 405 error (Method not allowed).
-            error_handler (Optional[Callable]): The handler to use for errors.
+            error_handler (Optional[Callable]): The handler to use for errors,
+                including `BodyTooLargeError` raised for too large request bodies.
             middleware_classes (Optional[List[Type[Middleware]]]): The list of
                 middleware classes to use.
+            max_body_size (Optional[int]): The maximum size of request bodies in bytes,
+                None if the size is not limited. Routes can override it.
+            response_kwargs (Optional[Dict]): The kwargs to pass to the responses
+                given to views (e.g. `json_serializer`).
+
+        Raises:
+            (ValueError): If the maximum size of request bodies is negative.
 
         """
         self._router = router or SimpleRouter(**(router_kwargs or {}))
@@ -74,7 +103,31 @@ class App:
         )
         self._error_handler = error_handler or default_error_handler
 
+        if max_body_size is not None and max_body_size < 0:
+            raise ValueError(
+                f"Maximum body size can't be negative, {max_body_size} given."
+            )
+
+        self._max_body_size = max_body_size
+        self._response_kwargs = response_kwargs or {}
+
+        self._mounts: Dict[str, "App"] = {}
+        self._max_mount_length = 0
+
+        # The route resolved for the request that is handled by the current thread,
+        # passed from the chain of middleware to `handle_request`.
+        self._pending = local()
+
     def __call__(self, environ, start_response):
+        if self._mounts:
+            path = environ.get("PATH_INFO", "")
+            mount = self._find_mount(path)
+            if mount is not None:
+                prefix, app = mount
+                environ["SCRIPT_NAME"] = environ.get("SCRIPT_NAME", "") + prefix
+                environ["PATH_INFO"] = path[len(prefix) :] or "/"
+                return app(environ, start_response)
+
         if self._static_files_engine:
             return self._static_files_engine(environ, start_response)
 
@@ -133,47 +186,285 @@ class App:
         Returns:
             Middleware: The initialized middleware.
         """
-        middleware = Middleware(self)
+        middleware = Middleware(self, dispatch=self._dispatch)
         if middleware_classes:
             for middleware_class in middleware_classes:
                 middleware.add(middleware_class)
 
         return middleware
 
+    def mount(self, prefix: str, app: "App") -> None:
+        """Mount another application under the path prefix.
+
+        Requests with paths that start with the prefix (e.g. `/shop/` and `/shop/cart/`
+        for the prefix `/shop`) are handled by the mounted application, using its router
+        and middleware. The prefix is moved from the path to the script name, so routes
+        of the mounted application are defined without the prefix. Middleware and
+        routes of this application are not used for such requests.
+
+        Arguments:
+            prefix (str): The path prefix, e.g. `/shop`.
+            app (App): The application to mount.
+
+        Raises:
+            (ValueError): If the prefix is not valid or the application is mounted
+                in itself.
+            (AttributeError): If an application is already mounted under the prefix.
+        """
+        if not prefix.startswith("/") or not prefix.strip("/"):
+            raise ValueError(
+                f"Mount prefix {prefix!r} must start with a forward slash and can't be "
+                "the root path."
+            )
+
+        prefix = prefix.rstrip("/")
+
+        if app is self:
+            raise ValueError("Application can't be mounted in itself.")
+
+        if prefix in self._mounts:
+            raise AttributeError(f"Application is already mounted under {prefix}.")
+
+        self._mounts[prefix] = app
+        self._max_mount_length = max(self._max_mount_length, len(prefix))
+
+    def _find_mount(self, path: str) -> Optional[Tuple[str, "App"]]:
+        """Find the mounted application that should handle the path.
+
+        Prefixes of the path that end at segment boundaries are checked from the
+        longest one, so the most specific mount is used. Each check is a single
+        dictionary lookup.
+
+        Arguments:
+            path (str): The path of the request.
+
+        Returns:
+            Optional[Tuple[str, App]]: The prefix and the mounted application or None
+                if the path is not handled by any mounted application.
+        """
+        end = len(path)
+        if end > self._max_mount_length:
+            end = path.rfind("/", 0, self._max_mount_length + 1)
+
+        while end > 0:
+            app = self._mounts.get(path[:end])
+            if app is not None:
+                return path[:end], app
+
+            end = path.rfind("/", 0, end)
+
+        return None
+
+    def _dispatch(
+        self, request: Request, process: Callable[[Request], Response]
+    ) -> Response:
+        """Handle the request with the chain of middleware of its route.
+
+        The route is resolved once, before the middleware is called, to select its
+        chain of middleware. The chain of middleware of the route is compiled when
+        the route handles a request for the first time (or when views are preloaded),
+        and it's kept with the route. Errors raised while compiling it (e.g. when
+        the view can't be imported) are handled by the error handler. Requests for
+        paths without routes are handled by the chain of middleware of the application.
+
+        The limit of the request body size is set before the middleware is called, so
+        middleware that reads the body can't read more than the limit. Too large
+        bodies are handled by the error handler (the default one sends the 413 error
+        page).
+
+        The resolved route is passed to `handle_request`, so it's not resolved again
+        unless middleware changes the path of the request.
+
+        Arguments:
+            request (Request): The request to handle.
+            process (Callable[[Request], Response]): The function that handles
+                the request with the chain of middleware of the application.
+
+        Returns:
+            Response: The response.
+        """
+        path = request.path_info
+        resolved_route = self._router.resolve(path)
+        pending = self._pending
+        pending.route = (request, path, resolved_route)
+        try:
+            self._limit_body_size(request, resolved_route)
+            if resolved_route is None:
+                return process(request)
+
+            pipeline = resolved_route.middleware_pipelines.get(self)
+            if pipeline is None:
+                try:
+                    pipeline = self._compile_route_middleware(resolved_route)
+                # Using `Exception` class as we want to catch all exception here.
+                except Exception as error:  # pylint: disable=broad-except
+                    return self._handle_error(
+                        request, Response(**self._response_kwargs), error
+                    )
+
+            request_hooks, handler, response_hooks = pipeline
+            return run_hooks(
+                request, request_hooks, response_hooks, handler.handle_request
+            )
+        except BodyTooLargeError as error:
+            return self._handle_error(request, Response(**self._response_kwargs), error)
+        finally:
+            pending.route = None
+
+    def _compile_route_middleware(self, route: Route) -> Tuple:
+        """Compile the chain of middleware of the route and keep it with the route.
+
+        The middleware of the route and of its view is added to the middleware of
+        the application, and the excluded middleware is removed from it.
+
+        Arguments:
+            route (Route): The route.
+
+        Returns:
+            Tuple: The `process_request` hooks, the object that handles the request
+                and the `process_response` hooks.
+
+        Raises:
+            (ImportError): If the module of the view can't be imported.
+            (AttributeError): If the module doesn't have the view.
+            (ValueError): If the lifecycle of the view is not supported.
+        """
+        view = route.view
+        exclude, extra = route.exclude_middleware, route.middleware
+        if isclass(view):
+            exclude += tuple(getattr(view, "exclude_middleware", ()))
+            extra = tuple(getattr(view, "middleware", ())) + extra
+
+        return route.middleware_pipelines.setdefault(
+            self, self._middleware.scope(exclude, extra)
+        )
+
     def handle_request(self, request: Request) -> Response:
         """Handle a request.
 
+        The route resolved by the chain of middleware for the request is used, unless
+        middleware has changed the path of the request.
+
         Arguments:
             request (Request): The request to handle.
 
+        Returns:
+            Response: The response.
+        """
+        pending = getattr(self._pending, "route", None)
+        if pending is not None and pending[0] is request:
+            self._pending.route = None
+            _, path, resolved_route = pending
+            if request.path_info == path:
+                return self._handle_route(request, resolved_route)
+
+        return self._handle_route(request, self._router.resolve(request.path_info))
+
+    def _handle_route(
+        self, request: Request, resolved_route: Optional[ResolvedRoute]
+    ) -> Response:
+        """Handle a request with the resolved route.
+
+        Views can return an iterator (e.g. a generator) with the parts of the body
+        instead of setting it, and the body is then streamed to the client. Views can
+        also return another response (e.g. `FileResponse`), which is used instead of
+        the response given to the view. Other returned values are ignored and
+        a warning is issued.
+
+        Arguments:
+            request (Request): The request to handle.
+            resolved_route (Optional[ResolvedRoute]): The route of the request, None
+                if there is no route for the path.
+
         Returns:
             Response: The response.
 
         Raises:
             Exception: An error occurred if no handler found.
         """
-        response = Response()
-        parsed_route = self._router.resolve(request.path)
+        response = Response(**self._response_kwargs)
 
         try:
-            if parsed_route:
-                handler = parsed_route.get_handler(request.method)
-                handler(request, response, **parsed_route.params)
-            else:
+            if resolved_route is None:
                 self._http_404_handler(request, response)
+            else:
+                handler = resolved_route.find_handler(request.method)
+                if handler is None:
+                    response.headers["Allow"] = resolved_route.allow
+                    self._http_405_handler(request, response)
+                else:
+                    self._limit_body_size(request, resolved_route)
+                    body = handler(request, response, **resolved_route.params)
+                    if body is not None:
+                        if isinstance(body, Response):
+                            response = body
+                        elif isinstance(body, Iterator):
+                            response.app_iter = body
+                        else:
+                            warnings.warn(
+                                "The value returned by the view of "
+                                f"{resolved_route.path} is ignored, "
+                                f"{type(body).__name__} returned. Views can return "
+                                "None, a response or an iterator of bytes."
+                            )
 
         except NotImplementedError:
             self._http_405_handler(request, response)
 
         # Using `Exception` class as we want to catch all exception here.
         except Exception as error:  # pylint: disable=broad-except
-            if self._error_handler is None:
-                raise error
+            self._handle_error(request, response, error)
+
+        return response
+
+    def _handle_error(
+        self, request: Request, response: Response, error: Exception
+    ) -> Response:
+        """Handle an error raised while handling a request with the error handler.
+
+        Arguments:
+            request (Request): The request.
+            response (Response): The response to set by the error handler.
+            error (Exception): The error.
 
-            self._error_handler(request, response, error)
+        Returns:
+            Response: The response.
 
+        Raises:
+            Exception: The error if there is no error handler.
+        """
+        if self._error_handler is None:
+            raise error
+
+        self._error_handler(request, response, error)
         return response
 
+    def _limit_body_size(
+        self, request: Request, route: Optional[ResolvedRoute]
+    ) -> None:
+        """Set the maximum size of the request body and check the declared length.
+
+        The limit of the route is used if it's set, the limit of the application
+        otherwise. Bodies without declared length are checked while they are read.
+
+        Arguments:
+            request (Request): The request.
+            route (Optional[ResolvedRoute]): The route that handles the request, None
+                if there is no route for the path.
+
+        Raises:
+            (BodyTooLargeError): If the declared length of the body exceeds the limit.
+        """
+        limit = None if route is None else route.max_body_size
+        if limit is None:
+            limit = self._max_body_size
+            if limit is None:
+                return
+
+        request.max_body_size = limit
+        if request.is_body_too_large():
+            raise BodyTooLargeError(f"Request body is larger than {limit} bytes.")
+
     def has_route(self, path: str) -> bool:
         """Check if the router has a route for the given path.
 
@@ -185,24 +476,125 @@ class App:
         """
         return self._router.has_route(path)
 
-    def add_route(
+    def add_route(  # pylint: disable=too-many-arguments
         self,
         path: str,
-        view: Union[BaseView, Callable],
+        view: Union[BaseView, Callable, str],
         methods: Optional[List[str]] = None,
+        lifecycle: Optional[str] = None,
+        max_body_size: Optional[int] = None,
+        middleware: Optional[Sequence[Type[Middleware]]] = None,
+        exclude_middleware: Optional[Sequence[Type[Middleware]]] = None,
     ) -> None:
         """Add a route to the router.
 
         It's supposed to be used as a method.
 
+        Middleware can be added to the route, inside the middleware of the application,
+        and middleware of the application can be excluded from the route. Class-based
+        views can do the same with their `middleware` and `exclude_middleware`
+        attributes. The chain of middleware of each route is compiled once, so
+        the middleware used for the route is not selected for each request.
+
         Arguments:
             path (str): The path to add the route to.
-            view (Union[BaseView, Callable]): The view to add the route to.
+            view (Union[BaseView, Callable, str]): The view to add the route to or its
+                dotted path (e.g. `billing.views:InvoiceView`), imported when the route
+                is used for the first time.
             methods (Optional[List[str]]): The list of methods to add the route to.
+            lifecycle (Optional[str]): The lifecycle of the instances of the
+                class-based view (see `ramka.views.VIEW_LIFECYCLES`).
+            max_body_size (Optional[int]): The maximum size of the request body in
+                bytes, overriding the limit of the application.
+            middleware (Optional[Sequence[Type[Middleware]]]): The middleware classes
+                to add to the route.
+            exclude_middleware (Optional[Sequence[Type[Middleware]]]): The middleware
+                classes of the application that should not be used for the route.
+        """
+        self._router.add_route(
+            path,
+            view,
+            methods,
+            lifecycle,
+            max_body_size,
+            middleware,
+            exclude_middleware,
+        )
+
+    def preload_views(self) -> None:
+        """Import all views given as dotted paths, also in the mounted applications.
+
+        The chains of middleware of the routes are compiled as well. It can be used to
+        import the views before the application is forked into worker processes.
+        """
+        self._router.preload_views()
+        for route in self._router.routes:
+            if self not in route.middleware_pipelines:
+                self._compile_route_middleware(route)
+
+        for app in self._mounts.values():
+            app.preload_views()
+
+    def add_routes(self, routes: Iterable[Union[Sequence, Mapping]]) -> None:
+        """Add multiple routes to the router.
+
+        Each item is either a tuple of arguments of the `add_route` method or
+        a dictionary of its keyword arguments. All routes are validated before any of
+        them is added.
+
+        Arguments:
+            routes (Iterable[Union[Sequence, Mapping]]): The routes to add.
+        """
+        self._router.add_routes(routes)
+
+    def remove_route(self, path: str) -> Route:
+        """Remove the route from the router.
+
+        Paths can be resolved by other threads while the route is being removed.
+
+        Arguments:
+            path (str): The path of the route to remove.
+
+        Returns:
+            Route: The removed route.
+        """
+        return self._router.remove_route(path)
+
+    def save_routes_snapshot(self, file_path: str) -> str:
+        """Save the router with all its routes to a snapshot file.
+
+        Arguments:
+            file_path (str): The path of the snapshot file.
+
+        Returns:
+            str: The hash of the route definitions, stored in the snapshot.
+        """
+        return self._router.save_snapshot(file_path)
+
+    def load_routes_snapshot(
+        self,
+        file_path: str,
+        routes: Optional[Iterable[Union[Sequence, Mapping]]] = None,
+    ) -> None:
+        """Replace the router with the one loaded from a snapshot file.
+
+        Arguments:
+            file_path (str): The path of the snapshot file.
+            routes (Optional[Iterable[Union[Sequence, Mapping]]]): The current route
+                definitions used to check if the snapshot is not stale. A warning is
+                issued if they are not given.
         """
-        self._router.add_route(path, view, methods)
+        self._router = BaseRouter.load_snapshot(file_path, routes)
 
-    def route(self, path: str, methods: Optional[List[str]] = None) -> Callable:
+    def route(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        methods: Optional[List[str]] = None,
+        lifecycle: Optional[str] = None,
+        max_body_size: Optional[int] = None,
+        middleware: Optional[Sequence[Type[Middleware]]] = None,
+        exclude_middleware: Optional[Sequence[Type[Middleware]]] = None,
+    ) -> Callable:
         """Add a route to the router.
 
         It's supposed to be used as a decorator.
@@ -210,8 +602,18 @@ class App:
         Arguments:
             path (str): The path to add the route to.
             methods (Optional[List[str]]): The list of methods to add the route to.
+            lifecycle (Optional[str]): The lifecycle of the instances of the
+                class-based view (see `ramka.views.VIEW_LIFECYCLES`).
+            max_body_size (Optional[int]): The maximum size of the request body in
+                bytes, overriding the limit of the application.
+            middleware (Optional[Sequence[Type[Middleware]]]): The middleware classes
+                to add to the route.
+            exclude_middleware (Optional[Sequence[Type[Middleware]]]): The middleware
+                classes of the application that should not be used for the route.
         """
-        return self._router.route(path, methods)
+        return self._router.route(
+            path, methods, lifecycle, max_body_size, middleware, exclude_middleware
+        )
 
     def template(self, template_name, context: Dict[str, Any] = None) -> Any:
         """Render a template using defined template engine.
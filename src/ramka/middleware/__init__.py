@@ -1,3 +1,11 @@
-from ramka.middleware.base_middleware import Middleware
+from ramka.middleware.base_middleware import Middleware, compile_hooks, run_hooks
+from ramka.middleware.compression import CompressionMiddleware
+from ramka.middleware.conditional_get import ConditionalGetMiddleware
 
-__all__ = ["Middleware"]
+__all__ = [
+    "CompressionMiddleware",
+    "ConditionalGetMiddleware",
+    "Middleware",
+    "compile_hooks",
+    "run_hooks",
+]
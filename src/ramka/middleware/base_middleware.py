@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Tuple, Type
 
 from ramka.request import Request
 from ramka.response import Response
@@ -6,6 +6,118 @@ from ramka.response import Response
 if TYPE_CHECKING:
     from ramka.app import App
 
+ResponseHook = Callable[[Request, Response], Any]
+# `process_request` hooks with the `process_response` hooks of the middleware that wrap
+# them, called if the request hook returns a response.
+RequestHooks = Tuple[
+    Tuple[Callable[[Request], Optional[Response]], Tuple[ResponseHook, ...]], ...
+]
+ResponseHooks = Tuple[ResponseHook, ...]
+
+
+def _overrides(middleware: "Middleware", name: str) -> bool:
+    """Check if the middleware overrides the method of the base middleware.
+
+    Arguments:
+        middleware (Middleware): The middleware.
+        name (str): The name of the method.
+
+    Returns:
+        bool: True if the method is overridden, False otherwise.
+    """
+    return name in vars(middleware) or getattr(type(middleware), name) is not getattr(
+        Middleware, name
+    )
+
+
+def _flatten(handler: Any) -> Tuple[List["Middleware"], Any]:
+    """Collect the middleware of the chain that can be compiled.
+
+    The chain is followed until the application or a middleware that overrides
+    `handle_request`, which handles the request with the rest of the chain.
+
+    Arguments:
+        handler (Any): The outermost middleware of the chain.
+
+    Returns:
+        Tuple[List[Middleware], Any]: The middleware from the outermost one, and
+            the object that handles the request after them.
+    """
+    chain = []
+    while (
+        isinstance(handler, Middleware)
+        and type(handler).handle_request is Middleware.handle_request
+    ):
+        chain.append(handler)
+        handler = handler._app  # pylint: disable=protected-access
+
+    return chain, handler
+
+
+def compile_hooks(
+    chain: Iterable["Middleware"],
+) -> Tuple[RequestHooks, ResponseHooks]:
+    """Compile the middleware into flat lists of the overridden hooks.
+
+    `process_request` methods are called from the outermost middleware (added
+    as the last one), and `process_response` methods in the reverse order, the
+    same as if the middleware handled the request one by one. Each
+    `process_request` method is stored with the `process_response` methods of
+    the middleware that wrap it, which are called if it returns a response.
+
+    Arguments:
+        chain (Iterable[Middleware]): The middleware, from the outermost one.
+
+    Returns:
+        Tuple[RequestHooks, ResponseHooks]: The `process_request` and
+            `process_response` hooks.
+    """
+    request_hooks = []
+    response_hooks: List[ResponseHook] = []
+    for middleware in chain:
+        if _overrides(middleware, "process_request"):
+            request_hooks.append(
+                (middleware.process_request, tuple(reversed(response_hooks)))
+            )
+
+        if _overrides(middleware, "process_response"):
+            response_hooks.append(middleware.process_response)
+
+    response_hooks.reverse()
+    return tuple(request_hooks), tuple(response_hooks)
+
+
+def run_hooks(
+    request: Request,
+    request_hooks: RequestHooks,
+    response_hooks: ResponseHooks,
+    handle_request: Callable[[Request], Response],
+) -> Response:
+    """Handle the request with the compiled hooks of middleware.
+
+    Arguments:
+        request (Request): The request.
+        request_hooks (RequestHooks): The `process_request` hooks.
+        response_hooks (ResponseHooks): The `process_response` hooks.
+        handle_request (Callable[[Request], Response]): The function that handles
+            the request.
+
+    Returns:
+        Response: The response.
+    """
+    for process_request, outer_response_hooks in request_hooks:
+        response = process_request(request)
+        if response is not None:
+            response_hooks = outer_response_hooks
+            break
+    else:
+        response = handle_request(request)
+
+    for process_response in response_hooks:
+        process_response(request, response)
+
+    return response
+
 
 class Middleware:
     """Base middleware class.
@@ -19,22 +131,106 @@ class Middleware:
     Subclass this class and override the `process_request` and `process_response`
     methods to implement custom middleware. Each middleware can override one of those
     methods or both.
+
+    The chain of middleware is compiled when middleware is added, into flat lists of
+    the `process_request` and `process_response` methods that are overridden, so
+    requests don't go through nested calls and methods that don't do anything are
+    not called. Middleware that overrides `handle_request` ends the flat part of
+    the chain, and it calls the rest of the chain itself.
+
+    `process_request` can return a response to end the chain, e.g. to return
+    a cached response or to reject the request. In that case the request is not
+    handled by the application, and only the `process_response` methods of the
+    middleware that wrap the middleware that returned the response are called.
     """
 
-    def __init__(self, app: "App") -> None:
+    def __init__(
+        self,
+        app: "App",
+        dispatch: Optional[
+            Callable[[Request, Callable[[Request], Response]], Response]
+        ] = None,
+    ) -> None:
         """Initialize the middleware.
 
         Arguments:
             app (App): The application to wrap.
+            dispatch (Optional[Callable[[Request, Callable[[Request], Response]],
+                Response]]): The function that handles requests instead of the
+                compiled chain, e.g. to use other chains for some requests. It's called
+                with the request and the function that handles the request with
+                the compiled chain.
         """
         self._app = app
+        self._dispatch = dispatch
+        self._compile()
 
     def __call__(self, environ, start_response) -> Response:
         request = Request(environ)
-        response = self._app.handle_request(request)
+        dispatch = self._dispatch
+        if dispatch is None:
+            response = self._process(request)
+        else:
+            response = dispatch(request, self._process)
 
         return response(environ, start_response)
 
+    def _process(self, request: Request) -> Response:
+        """Process the request with the compiled chain of middleware.
+
+        Arguments:
+            request (Request): The request to process.
+
+        Returns:
+            Response: The response.
+        """
+        request_hooks, handler, response_hooks = self._pipeline
+        return run_hooks(request, request_hooks, response_hooks, handler.handle_request)
+
+    def _compile(self) -> None:
+        """Compile the chain of middleware into flat lists of hooks.
+
+        See `compile_hooks` for the order of the hooks.
+        """
+        chain, handler = _flatten(self._app)
+        request_hooks, response_hooks = compile_hooks(chain)
+        self._chain = tuple(chain)
+        self._pipeline = (request_hooks, handler, response_hooks)
+
+    def scope(
+        self,
+        exclude: Tuple[Type["Middleware"], ...] = (),
+        extra: Tuple[Type["Middleware"], ...] = (),
+    ) -> Tuple[RequestHooks, Any, ResponseHooks]:
+        """Compile the chain of middleware for a single route.
+
+        Middleware that is an instance of one of the excluded classes is removed from
+        the compiled part of the chain, and the extra middleware is added inside it,
+        the same way as it would be added with the `add` method. Instances of the
+        middleware of the chain are shared by all routes.
+
+        Arguments:
+            exclude (Tuple[Type[Middleware], ...]): The middleware classes to exclude.
+            extra (Tuple[Type[Middleware], ...]): The middleware classes to add.
+
+        Returns:
+            Tuple[RequestHooks, Any, ResponseHooks]: The `process_request` hooks, the
+                object that handles the request and the `process_response` hooks.
+        """
+        chain = [
+            middleware
+            for middleware in self._chain
+            if not isinstance(middleware, exclude)
+        ]
+
+        handler = self._pipeline[1]
+        for middleware_cls in extra:
+            handler = middleware_cls(handler)
+
+        extra_chain, handler = _flatten(handler)
+        request_hooks, response_hooks = compile_hooks(chain + extra_chain)
+        return request_hooks, handler, response_hooks
+
     def add(self, middleware_cls: Type["Middleware"]):
         """Add another middleware to the execution chain.
 
@@ -42,31 +238,44 @@ class Middleware:
             middleware_cls (Type[Middleware]): The middleware class to add.
         """
         self._app = middleware_cls(self._app)
+        self._compile()
 
     def handle_request(self, request: Request) -> Response:
         """Handle the request.
 
         This method is called by the application. It calls the `process_request`
         method before the request is handled, and then the `process_response` method
-        after the request is handled.
+        after the request is handled. If `process_request` returns a response, it's
+        returned without handling the request.
 
         Arguments:
             request (Request): The request to handle.
         """
-        self.process_request(request)
+        # pylint: disable=assignment-from-no-return
+        response = self.process_request(request)
+        if response is not None:
+            return response
+
         response = self._app.handle_request(request)
         self.process_response(request, response)
 
         return response
 
-    def process_request(self, request: Request) -> None:  # pylint: disable=no-self-use
+    def process_request(  # pylint: disable=no-self-use
+        self, request: Request
+    ) -> Optional[Response]:
         """Process the request.
 
         This method is called by the application before the request is handled. It
-        can be overridden to add custom logic to the request.
+        can be overridden to add custom logic to the request. If it returns
+        a response, the request is not handled and the response is returned instead.
 
         Arguments:
             request (Request): The request to process.
+
+        Returns:
+            Optional[Response]: The response that ends the chain, or None to handle
+                the request.
         """
 
     def process_response(  # pylint: disable=no-self-use
@@ -79,6 +288,9 @@ class Middleware:
         as one of the arguments but modifying it won't have any effect as the request
         is already handled.
 
+        Streamed bodies (see `Response.is_streaming`) have not been read yet, and they
+        can be transformed without reading them with `Response.wrap_app_iter`.
+
         Arguments:
             request (Request): The request object.
             response (Response): The response to process.
@@ -0,0 +1,237 @@
+import zlib
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import Iterable, Iterator, Optional, Tuple
+
+from ramka.middleware.base_middleware import Middleware
+from ramka.request import Request
+from ramka.response import Response
+
+# Window bits of `zlib` for the supported encodings, in the order of preference.
+_ENCODINGS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def parse_accept_encoding(value: str) -> Optional[str]:
+    """Select the supported encoding that is preferred by the client.
+
+    Arguments:
+        value (str): The value of the `Accept-Encoding` header.
+
+    Returns:
+        Optional[str]: The encoding or None if the client doesn't accept any of the
+            supported encodings.
+    """
+    qualities = {}
+    for item in value.split(","):
+        coding, *parameters = item.split(";")
+        quality = 1.0
+        for parameter in parameters:
+            name, _, parameter_value = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(parameter_value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[coding.strip().lower()] = quality
+
+    default = qualities.get("*", 0.0)
+    best = max(_ENCODINGS, key=lambda coding: qualities.get(coding, default))
+    return best if qualities.get(best, default) > 0 else None
+
+
+def _compressor(encoding: str, level: int):
+    """Create a compressor for the encoding.
+
+    Arguments:
+        encoding (str): The encoding, `gzip` or `deflate`.
+        level (int): The compression level.
+
+    Returns:
+        zlib.Compress: The compressor.
+    """
+    return zlib.compressobj(level, zlib.DEFLATED, _ENCODINGS[encoding])
+
+
+def _compress_stream(
+    parts: Iterable[bytes], encoding: str, level: int
+) -> Iterator[bytes]:
+    """Compress the parts of the body while they are produced.
+
+    Each part is flushed, so it's sent to the client as soon as it's produced.
+
+    Arguments:
+        parts (Iterable[bytes]): The parts of the body.
+        encoding (str): The encoding, `gzip` or `deflate`.
+        level (int): The compression level.
+
+    Returns:
+        Iterator[bytes]: The compressed parts of the body.
+    """
+    compressor = _compressor(encoding, level)
+    for part in parts:
+        if part:
+            yield compressor.compress(part) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    yield compressor.flush()
+
+
+class CompressionMiddleware(Middleware):
+    """Middleware that compresses response bodies with gzip or deflate.
+
+    The encoding is selected using the `Accept-Encoding` header of the request. Only
+    text bodies (see `compressible_types`) that are not already encoded are
+    compressed, and bodies smaller than `minimum_size` are sent as they are.
+    Streamed bodies are compressed while they are sent.
+
+    Compressed bodies are kept in a LRU cache, keyed by the digest of the body, so
+    the same body (e.g. a page rendered from a template) is compressed only once.
+
+    The middleware can be configured by subclassing it and changing its fields.
+
+    Fields:
+        minimum_size (int): The minimum size of compressed bodies in bytes.
+        compress_level (int): The compression level, from 1 to 9.
+        compressible_types (Tuple[str, ...]): The content types that are compressed,
+            types that end with `/` match all subtypes.
+        cache_size (int): The maximum number of cached bodies, 0 disables the cache.
+        max_cached_body_size (int): The maximum size of cached bodies in bytes.
+    """
+
+    minimum_size = 500
+    compress_level = 6
+    compressible_types: Tuple[str, ...] = (
+        "text/",
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "application/xhtml+xml",
+        "image/svg+xml",
+    )
+    cache_size = 128
+    max_cached_body_size = 256 * 1024
+
+    def __init__(self, app) -> None:
+        """Initialize the middleware.
+
+        Arguments:
+            app (App): The application to wrap.
+        """
+        super().__init__(app)
+        self._cache: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._cache_lock = Lock()
+
+    def _is_compressible(self, response: Response) -> bool:
+        """Check if the content type of the response can be compressed.
+
+        Arguments:
+            response (Response): The response.
+
+        Returns:
+            bool: True if the content type can be compressed, False otherwise.
+        """
+        content_type = (response.content_type or "").lower()
+        return any(
+            (
+                content_type.startswith(compressible_type)
+                if compressible_type.endswith("/")
+                else content_type == compressible_type
+            )
+            for compressible_type in self.compressible_types
+        ) or content_type.endswith(("+json", "+xml"))
+
+    def process_response(self, request: Request, response: Response) -> None:
+        """Compress the body of the response.
+
+        Partial responses (with the 206 status or the `Content-Range` header) are
+        not compressed, as the ranges refer to the uncompressed body.
+
+        Arguments:
+            request (Request): The request.
+            response (Response): The response to compress.
+        """
+        status_code = response.status_code
+        headers = response.headers
+        if (
+            status_code < 200
+            or status_code in (204, 206, 304)
+            or "Content-Encoding" in headers
+            or "Content-Range" in headers
+            or not self._is_compressible(response)
+        ):
+            return
+
+        if "accept-encoding" not in headers.get("Vary", "").lower():
+            headers.add("Vary", "Accept-Encoding")
+
+        if "no-transform" in headers.get("Cache-Control", ""):
+            return
+
+        encoding = parse_accept_encoding(
+            request.environ.get("HTTP_ACCEPT_ENCODING", "")
+        )
+        if encoding is None:
+            return
+
+        content_length = response.content_length
+        if content_length is not None and content_length < self.minimum_size:
+            return
+
+        if response.is_streaming:
+            level = self.compress_level
+            response.wrap_app_iter(
+                lambda parts: _compress_stream(parts, encoding, level)
+            )
+        else:
+            response.body = self._compress(response.body, encoding)
+
+        headers["Content-Encoding"] = encoding
+        headers.pop("Accept-Ranges", None)
+        etag = headers.get("ETag")
+        if etag is not None and etag.startswith('"'):
+            headers["ETag"] = f"W/{etag}"
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress the body, using the cache if it's possible.
+
+        Arguments:
+            body (bytes): The body.
+            encoding (str): The encoding, `gzip` or `deflate`.
+
+        Returns:
+            bytes: The compressed body.
+        """
+        if not self.cache_size or len(body) > self.max_cached_body_size:
+            return self._compress_body(body, encoding)
+
+        key = (encoding, blake2b(body, digest_size=16).digest())
+        with self._cache_lock:
+            compressed = self._cache.get(key)
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                return compressed
+
+        compressed = self._compress_body(body, encoding)
+        with self._cache_lock:
+            self._cache[key] = compressed
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return compressed
+
+    def _compress_body(self, body: bytes, encoding: str) -> bytes:
+        """Compress the whole body.
+
+        Arguments:
+            body (bytes): The body.
+            encoding (str): The encoding, `gzip` or `deflate`.
+
+        Returns:
+            bytes: The compressed body.
+        """
+        compressor = _compressor(encoding, self.compress_level)
+        return compressor.compress(body) + compressor.flush()
+
+
+__all__ = ["CompressionMiddleware", "parse_accept_encoding"]
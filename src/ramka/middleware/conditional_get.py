@@ -0,0 +1,45 @@
+from ramka.middleware.base_middleware import Middleware
+from ramka.request import Request
+from ramka.response import Response
+from ramka.response.conditional import is_not_modified, make_etag, make_not_modified
+
+
+class ConditionalGetMiddleware(Middleware):
+    """Middleware that adds ETags to responses and answers conditional requests.
+
+    The ETag is computed from the body of successful responses to GET and HEAD
+    requests, unless the view has set it already. Streamed bodies are not read, so
+    they get the ETag only if the view sets it. If the ETag matches `If-None-Match`
+    (or `Last-Modified` matches `If-Modified-Since`), the response is turned into
+    the 304 response without body.
+
+    Views can set the validators with `ramka.response.not_modified` before the body
+    is created, so the body is not created at all if the client has the current
+    version.
+
+    Fields:
+        weak_etags (bool): True if computed ETags should be weak, False otherwise.
+    """
+
+    weak_etags = False
+
+    def process_response(self, request: Request, response: Response) -> None:
+        """Add the ETag to the response and check if the client has that version.
+
+        Arguments:
+            request (Request): The request.
+            response (Response): The response to process.
+        """
+        if response.status_code != 200 or request.method not in ("GET", "HEAD"):
+            return
+
+        headers = response.headers
+        etag = headers.get("ETag")
+        if etag is None and not response.is_streaming:
+            etag = headers["ETag"] = make_etag(response.body, self.weak_etags)
+
+        if is_not_modified(request.environ, etag, headers.get("Last-Modified")):
+            make_not_modified(response)
+
+
+__all__ = ["ConditionalGetMiddleware"]
@@ -1,3 +1,16 @@
-from ramka.request.request import Request
+from ramka.request.multipart import (
+    MultipartError,
+    MultipartParser,
+    MultipartPart,
+    UploadedFile,
+)
+from ramka.request.request import BodyTooLargeError, Request
 
-__all__ = ["Request"]
+__all__ = [
+    "BodyTooLargeError",
+    "MultipartError",
+    "MultipartParser",
+    "MultipartPart",
+    "Request",
+    "UploadedFile",
+]
@@ -0,0 +1,381 @@
+import re
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+# The default maximum size of the headers of a single part.
+DEFAULT_MAX_HEADER_SIZE = 16 * 1024
+
+_OPTION_RE = re.compile(r';\s*([^\s=;]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+
+
+class MultipartError(ValueError):
+    """The multipart body is not valid."""
+
+
+def parse_options_header(value: str) -> Tuple[str, Dict[str, str]]:
+    """Parse a header with options (e.g. `Content-Disposition` or `Content-Type`).
+
+    Arguments:
+        value (str): The value of the header, e.g. `form-data; name="file"`.
+
+    Returns:
+        Tuple[str, Dict[str, str]]: The lowercase value without options and the
+            options by their lowercase names.
+    """
+    main_value, _, rest = value.partition(";")
+    options = {}
+    for name, option in _OPTION_RE.findall(f";{rest}"):
+        option = option.strip()
+        if option[:1] == '"':
+            option = re.sub(r"\\(.)", r"\1", option[1:-1])
+
+        options[name.lower()] = option
+
+    return main_value.strip().lower(), options
+
+
+def _write_to(sink: Any, chunk: memoryview) -> None:
+    """Write the chunk of data to the sink.
+
+    Arguments:
+        sink (Any): A file-like object (with `write` method), a hash (with `update`
+            method) or a callable.
+        chunk (memoryview): The chunk of data.
+    """
+    write = getattr(sink, "write", None) or getattr(sink, "update", None) or sink
+    write(chunk)
+
+
+class MultipartPart:
+    """A single part of a multipart body.
+
+    The data of the part is not read when the part is created. It needs to be read,
+    using one of the methods of the part, before the next part is taken from the
+    parser. Data that has not been read is skipped when the parser moves to the next
+    part, and it can't be read afterwards.
+
+    Fields:
+        headers (Dict[str, str]): The headers of the part by their lowercase names.
+        name (Optional[str]): The name of the form field.
+        filename (Optional[str]): The name of the uploaded file, None for fields.
+        content_type (str): The content type of the data (`text/plain` by default).
+        charset (str): The charset of the data (`utf-8` by default).
+    """
+
+    __slots__ = (
+        "headers",
+        "name",
+        "filename",
+        "content_type",
+        "charset",
+        "_data",
+    )
+
+    def __init__(self, headers: Dict[str, str], data: Iterator[memoryview]) -> None:
+        """Initialize the part.
+
+        Arguments:
+            headers (Dict[str, str]): The headers of the part by their lowercase names.
+            data (Iterator[memoryview]): The iterator over the chunks of the data.
+        """
+        _, disposition = parse_options_header(headers.get("content-disposition", ""))
+        content_type, options = parse_options_header(
+            headers.get("content-type", "text/plain")
+        )
+
+        self.headers = headers
+        self.name: Optional[str] = disposition.get("name")
+        self.filename: Optional[str] = disposition.get("filename")
+        self.content_type = content_type
+        self.charset = options.get("charset", "utf-8")
+        self._data = data
+
+    def iter_data(self) -> Iterator[memoryview]:
+        """Iterate over the chunks of the data, as they arrive.
+
+        The chunks are views of the data received from the client, so they are not
+        copied. They can be passed to functions that accept bytes-like objects (e.g.
+        `file.write` or `hash.update`), or turned into bytes with `bytes(chunk)`.
+
+        Returns:
+            Iterator[memoryview]: The chunks of the data.
+        """
+        return self._data
+
+    def save(self, sink: Any) -> int:
+        """Write the data of the part to the sink, chunk by chunk.
+
+        Arguments:
+            sink (Any): A file-like object (with `write` method), a hash (with
+                `update` method) or a callable that accepts the chunks.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        size = 0
+        for chunk in self._data:
+            _write_to(sink, chunk)
+            size += len(chunk)
+
+        return size
+
+    def read(self) -> bytes:
+        """Read the whole data of the part into memory.
+
+        Returns:
+            bytes: The data of the part.
+        """
+        return b"".join(self._data)
+
+    def text(self) -> str:
+        """Read the whole data of the part and decode it using its charset.
+
+        Returns:
+            str: The decoded data of the part.
+        """
+        return self.read().decode(self.charset)
+
+    def __repr__(self) -> str:
+        return f"MultipartPart(name={self.name!r}, filename={self.filename!r})"
+
+
+class UploadedFile:  # pylint: disable=too-few-public-methods
+    """A file uploaded in a form.
+
+    The data of the file is kept in a temporary file that is moved to disk when it
+    gets large.
+
+    Fields:
+        name (Optional[str]): The name of the form field.
+        filename (str): The name of the uploaded file.
+        content_type (str): The content type of the file.
+        headers (Dict[str, str]): The headers of the part by their lowercase names.
+        file (IO[bytes]): The data of the file, rewound to the start.
+    """
+
+    __slots__ = ("name", "filename", "content_type", "headers", "file")
+
+    def __init__(self, part: MultipartPart, file: IO[bytes]) -> None:
+        """Initialize the uploaded file.
+
+        Arguments:
+            part (MultipartPart): The part of the file, with the data already read.
+            file (IO[bytes]): The file with the data of the part.
+        """
+        self.name = part.name
+        self.filename = part.filename
+        self.content_type = part.content_type
+        self.headers = part.headers
+        self.file = file
+
+    @property
+    def value(self) -> bytes:
+        """The whole data of the file, read into memory."""
+        self.file.seek(0)
+        value = self.file.read()
+        self.file.seek(0)
+        return value
+
+    def __repr__(self) -> str:
+        return f"UploadedFile(name={self.name!r}, filename={self.filename!r})"
+
+
+class MultipartParser:
+    """Incremental parser of `multipart/form-data` bodies.
+
+    The parser takes the body in chunks, as it's received, and yields the parts as soon
+    as their headers are parsed. The data of each part is yielded in chunks as well,
+    so the memory used by the parser doesn't depend on the size of the body.
+
+    The parser keeps the chunk that is currently parsed, and the data is yielded as
+    views of that chunk. A chunk is joined with the next one only when it ends with
+    the beginning of the boundary.
+
+    Fields:
+        boundary (bytes): The boundary of the parts.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        boundary: Union[str, bytes],
+        max_header_size: int = DEFAULT_MAX_HEADER_SIZE,
+    ) -> None:
+        """Initialize the parser.
+
+        Arguments:
+            chunks (Iterable[bytes]): The chunks of the body.
+            boundary (Union[str, bytes]): The boundary of the parts, taken from the
+                `Content-Type` header.
+            max_header_size (int): The maximum size of the headers of a single part.
+
+        Raises:
+            (MultipartError): If the boundary is not valid.
+        """
+        if isinstance(boundary, str):
+            boundary = boundary.encode("latin-1")
+
+        if not boundary or len(boundary) > 200:
+            raise MultipartError(f"Invalid multipart boundary {boundary!r}.")
+
+        self.boundary = boundary
+        self._chunks = iter(chunks)
+        self._max_header_size = max_header_size
+        self._separator = b"\r\n--" + boundary
+        self._buffer = b""
+        self._position = 0
+
+    def _fill(self) -> None:
+        """Append the next chunk of the body to the unparsed data.
+
+        Raises:
+            (MultipartError): If there are no more chunks.
+        """
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            raise MultipartError("Unexpected end of multipart body.")
+
+        rest = self._buffer[self._position :]
+        self._buffer = rest + chunk if rest else chunk
+        self._position = 0
+
+    def _partial_separator(self) -> int:
+        """Find the position of the beginning of the separator at the end of the data.
+
+        Returns:
+            int: The position where the separator could start, or the length of the
+                data if it doesn't end with the beginning of the separator.
+        """
+        buffer = self._buffer
+        separator = self._separator
+        index = buffer.find(
+            b"\r", max(self._position, len(buffer) - len(separator) + 1)
+        )
+        while index >= 0:
+            if separator.startswith(buffer[index:]):
+                return index
+
+            index = buffer.find(b"\r", index + 1)
+
+        return len(buffer)
+
+    def _read_data(self) -> Iterator[memoryview]:
+        """Read the data of the current part, up to the next separator.
+
+        Returns:
+            Iterator[memoryview]: The chunks of the data.
+        """
+        separator = self._separator
+        while True:
+            buffer = self._buffer
+            index = buffer.find(separator, self._position)
+            if index >= 0:
+                if index > self._position:
+                    yield memoryview(buffer)[self._position : index]
+
+                self._position = index + len(separator)
+                return
+
+            end = self._partial_separator()
+            if end > self._position:
+                yield memoryview(buffer)[self._position : end]
+                self._position = end
+
+            self._fill()
+
+    def _read_headers(self) -> Dict[str, str]:
+        """Read the headers of the current part.
+
+        Returns:
+            Dict[str, str]: The headers by their lowercase names.
+
+        Raises:
+            (MultipartError): If the headers are too large or not valid.
+        """
+        while True:
+            end = self._buffer.find(b"\r\n\r\n", self._position)
+            if end >= 0:
+                break
+
+            if len(self._buffer) - self._position > self._max_header_size:
+                raise MultipartError("Headers of a multipart part are too large.")
+
+            self._fill()
+
+        if end - self._position > self._max_header_size:
+            raise MultipartError("Headers of a multipart part are too large.")
+
+        headers = {}
+        lines = self._buffer[self._position : end].decode("utf-8", "replace")
+        for line in lines.split("\r\n"):
+            name, separator, value = line.partition(":")
+            if not separator:
+                raise MultipartError(f"Invalid header of a multipart part: {line!r}.")
+
+            headers[name.strip().lower()] = value.strip()
+
+        self._position = end + 4
+        return headers
+
+    def _skip_preamble(self) -> None:
+        """Skip everything before the first delimiter."""
+        delimiter = self._separator[2:]
+        while len(self._buffer) < len(delimiter) and delimiter.startswith(self._buffer):
+            self._fill()
+
+        if self._buffer.startswith(delimiter):
+            self._position = len(delimiter)
+        else:
+            # The first delimiter is not preceded by a line break when there is no
+            # preamble, so the line break is added only here.
+            self._buffer = b"\r\n" + self._buffer
+            for _ in self._read_data():
+                pass
+
+    def _read_delimiter_end(self) -> bytes:
+        """Read the two bytes after the delimiter.
+
+        Returns:
+            bytes: `--` after the last delimiter, a line break otherwise.
+
+        Raises:
+            (MultipartError): If the bytes are neither of those.
+        """
+        while len(self._buffer) - self._position < 2:
+            self._fill()
+
+        end = self._buffer[self._position : self._position + 2]
+        if end not in (b"--", b"\r\n"):
+            raise MultipartError("Invalid multipart delimiter.")
+
+        self._position += 2
+        return end
+
+    def __iter__(self) -> Iterator[MultipartPart]:
+        """Iterate over the parts of the body.
+
+        Returns:
+            Iterator[MultipartPart]: The parts, yielded as soon as their headers are
+                parsed.
+
+        Raises:
+            (MultipartError): If the body is not valid.
+        """
+        self._skip_preamble()
+
+        while self._read_delimiter_end() != b"--":
+            data = self._read_data()
+            yield MultipartPart(self._read_headers(), data)
+
+            # Data that has not been read by the caller is skipped.
+            for _ in data:
+                pass
+
+
+__all__ = [
+    "DEFAULT_MAX_HEADER_SIZE",
+    "MultipartError",
+    "MultipartParser",
+    "MultipartPart",
+    "UploadedFile",
+    "parse_options_header",
+]
@@ -1,8 +1,657 @@
-from webob import Request as BaseRequest
+import json
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl, quote
 
+from webob import Request as WebObRequest
+from webob.cookies import RequestCookies
+from webob.headers import EnvironHeaders
+from webob.multidict import MultiDict, NestedMultiDict, NoVars
 
-class Request(BaseRequest):
+from ramka.request.multipart import (
+    DEFAULT_MAX_HEADER_SIZE,
+    MultipartError,
+    MultipartParser,
+    UploadedFile,
+    parse_options_header,
+)
+
+# Slots of requests are set the first time the values are used.
+# pylint: disable=attribute-defined-outside-init
+
+# Characters that are not quoted in paths, the same as in WebOb.
+PATH_SAFE = "/~!$&'()*+,;=:@"
+
+# Default ports of the URL schemes, omitted in the URLs.
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+_FORM_CONTENT_TYPES = ("application/x-www-form-urlencoded", "multipart/form-data")
+
+# The default size of the chunks the body is read in.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# The default size of the body above which the spooled body is moved to a temporary
+# file.
+DEFAULT_SPOOL_SIZE = 1024 * 1024
+
+
+class BodyTooLargeError(ValueError):
+    """The body of the request is larger than its maximum size."""
+
+
+def _decode_path(value: str) -> str:
+    """Decode the path from the WSGI environment.
+
+    WSGI servers decode paths using latin-1, so the path needs to be encoded back
+    and decoded using UTF-8.
+
+    Arguments:
+        value (str): The path from the WSGI environment.
+
+    Returns:
+        str: The decoded path.
+    """
+    if value.isascii():
+        return value
+
+    return value.encode("latin-1").decode("utf-8")
+
+
+def _encode_path(value: str) -> str:
+    """Encode the path, so it can be stored in the WSGI environment.
+
+    Arguments:
+        value (str): The path.
+
+    Returns:
+        str: The path encoded the same way as WSGI servers do it.
+    """
+    if value.isascii():
+        return value
+
+    return value.encode("utf-8").decode("latin-1")
+
+
+class Request:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """Application request implementation.
 
-    There is no custom logic here at the moment, but there will be in the future.
+    The request is a thin wrapper around the WSGI environment. Creating it only stores
+    the environment, and headers, cookies, the query string and the body are parsed
+    the first time they are used. Parsed values are cached in the request, so they
+    are parsed only once.
+
+    The most often used attributes of `webob.Request` are implemented directly. All
+    other attributes (e.g. `accept` or `if_modified_since`) are taken from a WebOb
+    request created for the same environment the first time such an attribute is
+    used. Custom attributes (e.g. set by middleware) are stored in the environment,
+    the same as in WebOb.
+
+    Only the environment is set when the request is created, the other slots are set
+    the first time the values are used.
+
+    The body can be read at once (`body`), in chunks (`iter_body`) or into a temporary
+    file that is kept in memory only while it's small (`spool_body`). The last two
+    don't keep the whole body in memory, but the body can be read only once. The size
+    of the body can be limited with `max_body_size`.
+
+    Fields:
+        environ (Dict[str, Any]): The WSGI environment of the request.
     """
+
+    __slots__ = (
+        "environ",
+        "_headers",
+        "_cookies",
+        "_get",
+        "_post",
+        "_body",
+        "_body_file",
+        "_body_consumed",
+        "_max_body_size",
+        "_webob",
+    )
+
+    def __init__(self, environ: Dict[str, Any]) -> None:
+        """Initialize the request.
+
+        Arguments:
+            environ (Dict[str, Any]): The WSGI environment of the request.
+        """
+        object.__setattr__(self, "environ", environ)
+
+    @classmethod
+    def blank(cls, path: str, environ: Optional[Dict] = None, **kwargs) -> "Request":
+        """Create a request for the path with a minimal WSGI environment.
+
+        It's meant to be used in tests, see `webob.Request.blank` for the arguments.
+
+        Arguments:
+            path (str): The path of the request, with an optional query string.
+            environ (Optional[Dict]): The keys to add to the environment.
+            kwargs (Dict): The attributes of the request to set.
+
+        Returns:
+            Request: The request.
+        """
+        return cls(WebObRequest.blank(path, environ, **kwargs).environ)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get the attribute of the WebOb request created for the same environment.
+
+        It's called only for the attributes that are not implemented in this class.
+
+        Arguments:
+            name (str): The name of the attribute.
+
+        Returns:
+            Any: The value of the attribute.
+
+        Raises:
+            (AttributeError): If the WebOb request doesn't have the attribute either.
+        """
+        if name.startswith("_") or name == "environ":
+            raise AttributeError(name)
+
+        return getattr(self._webob_request(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute of the request.
+
+        Attributes that are not implemented in this class are set on the WebOb
+        request, so custom attributes are stored in the environment.
+
+        Arguments:
+            name (str): The name of the attribute.
+            value (Any): The value of the attribute.
+        """
+        if hasattr(type(self), name):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._webob_request(), name, value)
+
+    def _webob_request(self) -> WebObRequest:
+        """Get the WebOb request for the same environment, created on first use.
+
+        Returns:
+            WebObRequest: The WebOb request.
+        """
+        try:
+            return self._webob
+        except AttributeError:
+            webob = self._webob = WebObRequest(self.environ)
+            return webob
+
+    @property
+    def method(self) -> str:
+        """The request method (e.g. `GET`)."""
+        return self.environ.get("REQUEST_METHOD", "GET")
+
+    @method.setter
+    def method(self, value: str) -> None:
+        self.environ["REQUEST_METHOD"] = value
+
+    @property
+    def scheme(self) -> str:
+        """The URL scheme (e.g. `http`)."""
+        return self.environ.get("wsgi.url_scheme", "http")
+
+    @property
+    def path_info(self) -> str:
+        """The part of the path handled by the application."""
+        return _decode_path(self.environ.get("PATH_INFO", ""))
+
+    @path_info.setter
+    def path_info(self, value: str) -> None:
+        self.environ["PATH_INFO"] = _encode_path(value)
+
+    @property
+    def script_name(self) -> str:
+        """The part of the path where the application is mounted."""
+        return _decode_path(self.environ.get("SCRIPT_NAME", ""))
+
+    @script_name.setter
+    def script_name(self, value: str) -> None:
+        self.environ["SCRIPT_NAME"] = _encode_path(value)
+
+    @property
+    def query_string(self) -> str:
+        """The query string, without the question mark."""
+        return self.environ.get("QUERY_STRING", "")
+
+    @property
+    def path(self) -> str:
+        """The quoted path of the request, without the host and the query string."""
+        environ = self.environ
+        return quote(
+            environ.get("SCRIPT_NAME", "").encode("latin-1"), PATH_SAFE
+        ) + quote(environ.get("PATH_INFO", "").encode("latin-1"), PATH_SAFE)
+
+    @property
+    def path_qs(self) -> str:
+        """The quoted path of the request with the query string."""
+        query_string = self.query_string
+        return f"{self.path}?{query_string}" if query_string else self.path
+
+    @property
+    def host(self) -> str:
+        """The host of the request, taken from the `Host` header or the server name."""
+        environ = self.environ
+        host = environ.get("HTTP_HOST")
+        if host is not None:
+            return host
+
+        return f"{environ['SERVER_NAME']}:{environ['SERVER_PORT']}"
+
+    @property
+    def host_url(self) -> str:
+        """The URL of the host, without the path."""
+        host = self.host
+        default_port = _DEFAULT_PORTS.get(self.scheme)
+        if default_port is not None and host.endswith(f":{default_port}"):
+            host = host[: -len(default_port) - 1]
+
+        return f"{self.scheme}://{host}"
+
+    @property
+    def url(self) -> str:
+        """The full URL of the request, with the query string."""
+        return self.host_url + self.path_qs
+
+    @property
+    def remote_addr(self) -> Optional[str]:
+        """The IP address of the client."""
+        return self.environ.get("REMOTE_ADDR")
+
+    @property
+    def user_agent(self) -> Optional[str]:
+        """The value of the `User-Agent` header."""
+        return self.environ.get("HTTP_USER_AGENT")
+
+    @property
+    def content_type(self) -> str:
+        """The content type of the body, without parameters (e.g. `charset`)."""
+        return self.environ.get("CONTENT_TYPE", "").split(";", 1)[0].strip().lower()
+
+    @content_type.setter
+    def content_type(self, value: str) -> None:
+        # Parameters of the current content type are kept, the same as in WebOb.
+        if ";" not in value:
+            _, separator, parameters = self.environ.get("CONTENT_TYPE", "").partition(
+                ";"
+            )
+            value += separator + parameters
+
+        self.environ["CONTENT_TYPE"] = value
+        self._reset_form()
+
+    @property
+    def charset(self) -> str:
+        """The charset of the body, taken from the `Content-Type` header."""
+        for parameter in self.environ.get("CONTENT_TYPE", "").split(";")[1:]:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "charset":
+                return value.strip().strip('"')
+
+        return "UTF-8"
+
+    @charset.setter
+    def charset(self, value: str) -> None:
+        content_type, *parameters = self.environ.get("CONTENT_TYPE", "").split(";")
+        parameters = [
+            parameter
+            for parameter in parameters
+            if parameter.partition("=")[0].strip().lower() != "charset"
+        ]
+        parameters.append(f" charset={value}")
+        self.environ["CONTENT_TYPE"] = ";".join([content_type, *parameters])
+        self._reset_form()
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """The length of the body, taken from the `Content-Length` header."""
+        value = self.environ.get("CONTENT_LENGTH")
+        return int(value) if value else None
+
+    @property
+    def headers(self) -> EnvironHeaders:
+        """The headers of the request, as a case-insensitive mapping."""
+        try:
+            return self._headers
+        except AttributeError:
+            headers = self._headers = EnvironHeaders(self.environ)
+            return headers
+
+    @headers.setter
+    def headers(self, value: Mapping[str, str]) -> None:
+        # The headers are stored in the environment, so they are replaced there.
+        headers = self.headers
+        headers.clear()
+        headers.update(value)
+        self._reset_form()
+
+    @property
+    def cookies(self) -> RequestCookies:
+        """The cookies of the request, parsed the first time they are used."""
+        try:
+            return self._cookies
+        except AttributeError:
+            cookies = self._cookies = RequestCookies(self.environ)
+            return cookies
+
+    @property
+    def GET(self) -> MultiDict:  # pylint: disable=invalid-name
+        """The parameters from the query string.
+
+        They are parsed again only if the query string has been changed.
+        """
+        query_string = self.query_string
+        cached: Optional[Tuple[str, MultiDict]] = getattr(self, "_get", None)
+        if cached is None or cached[0] != query_string:
+            cached = self._get = (
+                query_string,
+                MultiDict(parse_qsl(query_string, keep_blank_values=True)),
+            )
+
+        return cached[1]
+
+    @property
+    def POST(self) -> Union[MultiDict, NoVars]:  # pylint: disable=invalid-name
+        """The form parameters from the body.
+
+        Bodies of other types than forms are not parsed, and `NoVars` is returned
+        instead of the parameters, the same as in WebOb.
+        Multipart bodies are parsed while they are read, and uploaded files are
+        stored as `UploadedFile` objects with the data in temporary files, so the body
+        is not kept in memory. The body can't be read again after that.
+        """
+        try:
+            return self._post
+        except AttributeError:
+            content_type = self.content_type
+            if content_type not in _FORM_CONTENT_TYPES:
+                post = NoVars(
+                    f"Not an HTML form submission (Content-Type: {content_type})"
+                )
+            elif content_type == _FORM_CONTENT_TYPES[0]:
+                post = MultiDict(parse_qsl(self.text, keep_blank_values=True))
+            elif self.content_length == 0:
+                post = MultiDict()
+            else:
+                post = self._parse_multipart()
+
+            self._post = post
+            return post
+
+    def _reset_form(self) -> None:
+        """Remove the form parameters parsed from the body, so they are parsed again."""
+        try:
+            del self._post
+        except AttributeError:
+            pass
+
+    def _parse_multipart(self) -> MultiDict:
+        """Parse the multipart form, storing the uploaded files in temporary files.
+
+        Returns:
+            MultiDict: The values of the fields and the uploaded files.
+        """
+        post = MultiDict()
+        for part in self.iter_multipart():
+            if part.filename is None:
+                post.add(part.name, part.text())
+            else:
+                file = SpooledTemporaryFile(  # pylint: disable=consider-using-with
+                    max_size=DEFAULT_SPOOL_SIZE
+                )
+                part.save(file)
+                file.seek(0)
+                post.add(part.name, UploadedFile(part, file))
+
+        return post
+
+    @property
+    def params(self) -> NestedMultiDict:
+        """The parameters from both the query string and the body."""
+        return NestedMultiDict(self.GET, self.POST)
+
+    @property
+    def max_body_size(self) -> Optional[int]:
+        """The maximum size of the body in bytes, None if the size is not limited.
+
+        It's set by the application, using its own limit or the limit of the route.
+        Reading a larger body raises `BodyTooLargeError`.
+        """
+        return getattr(self, "_max_body_size", None)
+
+    @max_body_size.setter
+    def max_body_size(self, value: Optional[int]) -> None:
+        self._max_body_size = value
+
+    def is_body_too_large(self) -> bool:
+        """Check if the declared length of the body exceeds its maximum size.
+
+        It doesn't read the body, so it can be used to reject the request early.
+        Bodies without declared length are checked while they are read.
+
+        Returns:
+            bool: True if the body is too large, False otherwise.
+        """
+        limit = self.max_body_size
+        length = self.content_length
+        return limit is not None and length is not None and length > limit
+
+    def _read_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        """Read the body from the input stream in chunks.
+
+        Arguments:
+            chunk_size (int): The maximum size of a chunk in bytes.
+
+        Returns:
+            Iterator[bytes]: The chunks of the body.
+
+        Raises:
+            (BodyTooLargeError): If the body is larger than its maximum size.
+        """
+        if self.is_body_too_large():
+            raise BodyTooLargeError(
+                f"Request body is larger than {self.max_body_size} bytes."
+            )
+
+        environ = self.environ
+        stream = environ.get("wsgi.input")
+        remaining = self.content_length
+        if stream is None or (
+            remaining is None and not environ.get("wsgi.input_terminated")
+        ):
+            return
+
+        limit = self.max_body_size
+        size = 0
+        while remaining is None or remaining > 0:
+            chunk = stream.read(
+                chunk_size if remaining is None else min(chunk_size, remaining)
+            )
+            if not chunk:
+                return
+
+            size += len(chunk)
+            if limit is not None and size > limit:
+                raise BodyTooLargeError(f"Request body is larger than {limit} bytes.")
+
+            if remaining is not None:
+                remaining -= len(chunk)
+
+            yield chunk
+
+    def _consume_body(self) -> None:
+        """Mark the input stream as consumed by one of the streaming methods.
+
+        Raises:
+            (RuntimeError): If the input stream has already been consumed.
+        """
+        if getattr(self, "_body_consumed", False):
+            raise RuntimeError("Request body has already been read as a stream.")
+
+        self._body_consumed = True
+
+    def iter_body(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the chunks of the body, without keeping the body in memory.
+
+        The body is read from the input stream while the chunks are consumed, so it
+        can be read this way only once. If the body has already been read with
+        `body`, the chunks are taken from it.
+
+        Arguments:
+            chunk_size (int): The maximum size of a chunk in bytes.
+
+        Returns:
+            Iterator[bytes]: The chunks of the body.
+
+        Raises:
+            (RuntimeError): If the body has already been read as a stream.
+        """
+        try:
+            body = self._body
+        except AttributeError:
+            self._consume_body()
+            return self._read_chunks(chunk_size)
+
+        return (
+            body[start : start + chunk_size]
+            for start in range(0, len(body), chunk_size)
+        )
+
+    def spool_body(
+        self,
+        max_memory_size: int = DEFAULT_SPOOL_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> IO[bytes]:
+        """Read the body into a file that is moved to disk when it gets large.
+
+        The body is kept in memory until it's larger than `max_memory_size`, then it's
+        moved to a temporary file. The file is created the first time this method is
+        called, and the following calls return the same file. The file is rewound,
+        so it can be read from the start.
+
+        Arguments:
+            max_memory_size (int): The size of the body in bytes above which it's
+                moved to disk.
+            chunk_size (int): The maximum size of a chunk read from the input stream.
+
+        Returns:
+            IO[bytes]: The file with the body.
+
+        Raises:
+            (RuntimeError): If the body has already been read as a stream.
+        """
+        try:
+            body_file = self._body_file
+        except AttributeError:
+            body_file = SpooledTemporaryFile(  # pylint: disable=consider-using-with
+                max_size=max_memory_size
+            )
+            for chunk in self.iter_body(chunk_size):
+                body_file.write(chunk)
+
+            self._body_file = body_file
+
+        body_file.seek(0)
+        return body_file
+
+    def iter_multipart(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_header_size: int = DEFAULT_MAX_HEADER_SIZE,
+    ) -> MultipartParser:
+        """Iterate over the parts of the multipart body, as they arrive.
+
+        The body is read with `iter_body`, so it's not kept in memory. The data of
+        each part needs to be read (e.g. written to a file with `part.save(file)`)
+        before the next part is taken, otherwise it's skipped.
+
+        Arguments:
+            chunk_size (int): The maximum size of a chunk read from the input stream.
+            max_header_size (int): The maximum size of the headers of a single part.
+
+        Returns:
+            MultipartParser: The parser that yields the parts of the body.
+
+        Raises:
+            (MultipartError): If the body is not multipart or it's not valid.
+            (RuntimeError): If the body has already been read as a stream.
+        """
+        content_type, options = parse_options_header(
+            self.environ.get("CONTENT_TYPE", "")
+        )
+        if not content_type.startswith("multipart/") or "boundary" not in options:
+            raise MultipartError("Request body is not multipart.")
+
+        return MultipartParser(
+            self.iter_body(chunk_size), options["boundary"], max_header_size
+        )
+
+    @property
+    def body(self) -> bytes:
+        """The body of the request, read the first time it's used.
+
+        The input stream in the environment is replaced with the body that has been
+        read, so the body can be read again (e.g. by a WebOb request). Setting the
+        body replaces the input stream the same way.
+
+        Raises:
+            (RuntimeError): If the body has already been read as a stream.
+            (BodyTooLargeError): If the body is larger than its maximum size.
+        """
+        try:
+            return self._body
+        except AttributeError:
+            self._consume_body()
+            body = b"".join(self._read_chunks(DEFAULT_CHUNK_SIZE))
+            self._replace_input(body)
+            return body
+
+    @body.setter
+    def body(self, value: bytes) -> None:
+        self._replace_input(value)
+        try:
+            del self._body_file
+        except AttributeError:
+            pass
+
+        self._reset_form()
+
+    def _replace_input(self, body: bytes) -> None:
+        """Replace the input stream in the environment with the body.
+
+        The body can be read again this way (e.g. by a WebOb request).
+
+        Arguments:
+            body (bytes): The body of the request.
+        """
+        environ = self.environ
+        environ["wsgi.input"] = BytesIO(body)
+        environ["CONTENT_LENGTH"] = str(len(body))
+        environ["webob.is_body_seekable"] = True
+        self._body = body
+
+    @property
+    def text(self) -> str:
+        """The body of the request, decoded using its charset."""
+        return self.body.decode(self.charset)
+
+    @property
+    def json(self) -> Any:
+        """The body of the request, decoded from JSON."""
+        return json.loads(self.text)
+
+    json_body = json
+
+
+__all__ = [
+    "BodyTooLargeError",
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_SPOOL_SIZE",
+    "PATH_SAFE",
+    "Request",
+]
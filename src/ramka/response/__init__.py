@@ -1,3 +1,19 @@
-from ramka.response.response import Response
+from ramka.response.conditional import make_etag, not_modified
+from ramka.response.file_response import FileResponse
+from ramka.response.response import JSONResponse, Response
+from ramka.response.serializers import (
+    DEFAULT_JSON_SERIALIZER,
+    JSONSerializer,
+    stdlib_json_serializer,
+)
 
-__all__ = ["Response"]
+__all__ = [
+    "DEFAULT_JSON_SERIALIZER",
+    "FileResponse",
+    "JSONResponse",
+    "JSONSerializer",
+    "Response",
+    "make_etag",
+    "not_modified",
+    "stdlib_json_serializer",
+]
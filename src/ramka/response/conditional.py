@@ -0,0 +1,149 @@
+from datetime import datetime
+from email.utils import formatdate, mktime_tz, parsedate_tz
+from hashlib import blake2b
+from typing import Any, Dict, Optional, Union
+
+from ramka.request import Request
+from ramka.response.response import Response
+
+# Headers that are not sent with 304 responses, as they describe the body.
+_NOT_MODIFIED_SKIPPED_HEADERS = ("Content-Type", "Content-Length", "Content-Encoding")
+
+
+def make_etag(body: bytes, weak: bool = False) -> str:
+    """Create the ETag of the body.
+
+    Arguments:
+        body (bytes): The body.
+        weak (bool): True if the ETag should be weak, False otherwise.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    etag = f'"{blake2b(body, digest_size=16).hexdigest()}"'
+    return f"W/{etag}" if weak else etag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check if the ETag matches one of the ETags from `If-None-Match` header.
+
+    ETags are compared using the weak comparison, as required for GET requests.
+
+    Arguments:
+        if_none_match (str): The value of the `If-None-Match` header.
+        etag (str): The ETag of the response.
+
+    Returns:
+        bool: True if the ETag matches, False otherwise.
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    etag = etag[2:] if etag.startswith("W/") else etag
+    for value in if_none_match.split(","):
+        value = value.strip()
+        if (value[2:] if value.startswith("W/") else value) == etag:
+            return True
+
+    return False
+
+
+def is_not_modified(
+    environ: Dict[str, Any], etag: Optional[str], last_modified: Optional[str]
+) -> bool:
+    """Check if the client has the current version of the response.
+
+    `If-None-Match` is compared with the ETag, and `If-Modified-Since` is compared
+    with the date of the last modification only if `If-None-Match` is not sent.
+
+    Arguments:
+        environ (Dict[str, Any]): The WSGI environment of the request.
+        etag (Optional[str]): The ETag of the response.
+        last_modified (Optional[str]): The value of the `Last-Modified` header.
+
+    Returns:
+        bool: True if the client has the current version, False otherwise.
+    """
+    if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = environ.get("HTTP_IF_MODIFIED_SINCE")
+    if not if_modified_since or not last_modified:
+        return False
+
+    since = parsedate_tz(if_modified_since)
+    modified = parsedate_tz(last_modified)
+    return (
+        since is not None
+        and modified is not None
+        and mktime_tz(modified) <= mktime_tz(since)
+    )
+
+
+def make_not_modified(response: Response) -> None:
+    """Turn the response into the 304 response without body.
+
+    Streamed bodies are closed without reading them.
+
+    Arguments:
+        response (Response): The response.
+    """
+    if response.is_streaming:
+        close = getattr(response.app_iter, "close", None)
+        if close is not None:
+            close()
+
+    response.status_code = 304
+    response.app_iter = []
+    headers = response.headers
+    for name in _NOT_MODIFIED_SKIPPED_HEADERS:
+        headers.pop(name, None)
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    etag: Optional[str] = None,
+    last_modified: Optional[Union[datetime, float]] = None,
+) -> bool:
+    """Set the validators of the response and check if the client has that version.
+
+    It's meant to be used in views, before the body is created, so the body doesn't
+    need to be created if the client has the current version. In that case,
+    the response is turned into the 304 response.
+
+    Arguments:
+        request (Request): The request.
+        response (Response): The response.
+        etag (Optional[str]): The ETag of the response (e.g. a version of the
+            object), quoted if it's not quoted yet.
+        last_modified (Optional[Union[datetime, float]]): The date of the last
+            modification, as a timezone-aware datetime or a timestamp.
+
+    Returns:
+        bool: True if the client has the current version, False otherwise.
+    """
+    headers = response.headers
+    if etag is not None:
+        if not etag.startswith(('"', 'W/"')):
+            etag = f'"{etag}"'
+
+        headers["ETag"] = etag
+
+    if last_modified is not None:
+        if isinstance(last_modified, datetime):
+            last_modified = last_modified.timestamp()
+
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+
+    if request.method not in ("GET", "HEAD") or not is_not_modified(
+        request.environ, headers.get("ETag"), headers.get("Last-Modified")
+    ):
+        return False
+
+    make_not_modified(response)
+    return True
+
+
+__all__ = ["is_not_modified", "make_etag", "make_not_modified", "not_modified"]
@@ -0,0 +1,432 @@
+import mimetypes
+import os
+import re
+from email.utils import formatdate, mktime_tz, parsedate_tz
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
+from uuid import uuid4
+
+from ramka.response.response import Response
+
+# The default size of the chunks the file is read in, if the server doesn't provide
+# `wsgi.file_wrapper`.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# The maximum number of ranges in a single request, requests with more ranges get
+# the whole file.
+MAX_RANGES = 16
+
+_RANGE_RE = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
+# Headers that are not sent with the 304 response.
+_NOT_MODIFIED_SKIPPED_HEADERS = ("content-length", "content-type")
+
+FileSource = Union[str, os.PathLike, IO[bytes]]
+
+# The status line, the headers and the body that are sent.
+_SentResponse = Tuple[str, List[Tuple[str, str]], Iterable[bytes]]
+
+
+def _parse_ranges(value: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """Parse the `Range` header.
+
+    Arguments:
+        value (str): The value of the header, e.g. `bytes=0-99,-100`.
+        size (int): The size of the file.
+
+    Returns:
+        Optional[List[Tuple[int, int]]]: The ranges as pairs of the first byte and
+            the byte after the last one, empty if none of the ranges can be satisfied,
+            or None if the header is not valid and it should be ignored.
+    """
+    unit, _, specs = value.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+
+    ranges = []
+    for spec in specs.split(","):
+        match = _RANGE_RE.match(spec)
+        if match is None:
+            return None
+
+        first, last = match.groups()
+        if not first:
+            if not last:
+                return None
+
+            suffix_length = int(last)
+            if suffix_length and size:
+                ranges.append((max(size - suffix_length, 0), size))
+        elif last and int(last) < int(first):
+            return None
+        elif int(first) < size:
+            ranges.append((int(first), min(int(last) + 1, size) if last else size))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+
+    return ranges
+
+
+class _FileSlice:
+    """A part of a file that is read in chunks.
+
+    It's a file-like object, so it can be passed to `wsgi.file_wrapper`. The file is
+    opened (or moved to the start of the part) when it's read for the first time, and
+    the size of the data read from it is limited to the length of the part.
+    """
+
+    __slots__ = ("chunk_size", "_source", "_file", "_start", "_remaining")
+
+    def __init__(
+        self, source: FileSource, start: int, length: int, chunk_size: int
+    ) -> None:
+        """Initialize the part of the file.
+
+        Arguments:
+            source (FileSource): The path of the file or the file opened in binary mode.
+            start (int): The position of the first byte of the part.
+            length (int): The length of the part.
+            chunk_size (int): The size of the chunks the part is read in.
+        """
+        self._source = source
+        self._file: Optional[IO[bytes]] = None
+        self._start = start
+        self._remaining = length
+        self.chunk_size = chunk_size
+
+    def open(self) -> IO[bytes]:
+        """Open the file and move to the start of the part, if it's not done yet.
+
+        Returns:
+            IO[bytes]: The file.
+        """
+        file = self._file
+        if file is None:
+            source = self._source
+            if isinstance(source, (str, os.PathLike)):
+                file = open(source, "rb")  # pylint: disable=consider-using-with
+            else:
+                file = source
+
+            file.seek(self._start)
+            self._file = file
+
+        return file
+
+    def fileno(self) -> int:
+        """Get the file descriptor, moved to the start of the part.
+
+        Returns:
+            int: The file descriptor.
+        """
+        return self.open().fileno()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the data of the part.
+
+        Arguments:
+            size (int): The maximum size of the data, the rest of the part if it's
+                negative.
+
+        Returns:
+            bytes: The data, empty at the end of the part.
+        """
+        remaining = self._remaining
+        if remaining <= 0:
+            return b""
+
+        if size < 0 or size > remaining:
+            size = remaining
+
+        data = self.open().read(size)
+        self._remaining = remaining - len(data) if data else 0
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        chunk = self.read(self.chunk_size)
+        if not chunk:
+            raise StopIteration
+
+        return chunk
+
+    def close(self) -> None:
+        """Close the file, also if it has been given opened."""
+        file = self._file
+        if file is None and not isinstance(self._source, (str, os.PathLike)):
+            file = self._source
+
+        if file is not None:
+            file.close()
+
+
+class FileResponse(Response):
+    """Response that sends a file.
+
+    The file is not read into memory. If the WSGI server provides
+    `wsgi.file_wrapper` (e.g. gunicorn, which uses `sendfile`), the file is sent
+    by the server, otherwise it's read in chunks.
+
+    The response supports conditional requests (`If-Modified-Since`) and range
+    requests (`Range` and `If-Range`) with one or multiple byte ranges. They are
+    handled when the response is sent, and only if its status is 200 and the body
+    has not been replaced or wrapped (e.g. by middleware).
+
+    Files given as file objects are closed when the response is sent.
+    """
+
+    __slots__ = ("_file_body", "_source", "_size", "_modified", "_last_modified")
+
+    def __init__(
+        self,
+        file: FileSource,
+        content_type: Optional[str] = None,
+        filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the response.
+
+        Arguments:
+            file (FileSource): The path of the file or the file opened in binary mode.
+            content_type (Optional[str]): The content type, guessed from the name of
+                the file by default.
+            filename (Optional[str]): The name of the file to download, it's sent as
+                an attachment if it's given.
+            chunk_size (int): The size of the chunks the file is read in.
+
+        Raises:
+            (OSError): If the file doesn't exist or can't be accessed.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            stat = os.stat(file)
+            name = os.fspath(file)
+        else:
+            stat = os.fstat(file.fileno())
+            name = getattr(file, "name", "")
+
+        if content_type is None:
+            content_type = (
+                mimetypes.guess_type(filename or str(name))[0]
+                or "application/octet-stream"
+            )
+
+        self._source = file
+        self._size = stat.st_size
+        self._modified = int(stat.st_mtime)
+        self._last_modified = formatdate(self._modified, usegmt=True)
+        self._file_body = _FileSlice(file, 0, stat.st_size, chunk_size)
+
+        headerlist = [
+            ("Content-Type", content_type),
+            ("Content-Length", str(stat.st_size)),
+            ("Last-Modified", self._last_modified),
+            ("Accept-Ranges", "bytes"),
+        ]
+        if filename is not None:
+            headerlist.append(
+                (
+                    "Content-Disposition",
+                    f"attachment; filename*=UTF-8''{quote(filename)}",
+                )
+            )
+
+        super().__init__(headerlist=headerlist, app_iter=self._file_body)
+
+    def __call__(self, environ, start_response):
+        """Send the file as a WSGI application.
+
+        Arguments:
+            environ (Dict[str, Any]): The WSGI environment.
+            start_response (Callable): The function that starts the response.
+
+        Returns:
+            Iterable[bytes]: The body of the response.
+        """
+        method = environ.get("REQUEST_METHOD")
+        body = self._file_body
+        if (
+            self._app_iter is not body
+            or self._status_code != 200
+            or method not in ("GET", "HEAD")
+        ):
+            return super().__call__(environ, start_response)
+
+        if self._is_not_modified(environ):
+            body.close()
+            start_response(
+                "304 Not Modified",
+                [
+                    header
+                    for header in self.headerlist
+                    if header[0].lower() not in _NOT_MODIFIED_SKIPPED_HEADERS
+                ],
+            )
+            return []
+
+        status, headerlist, body = self._select_ranges(environ)
+
+        if method == "HEAD":
+            body.close()
+            start_response(status, headerlist)
+            return []
+
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        if file_wrapper is not None and isinstance(body, _FileSlice):
+            body = file_wrapper(body, body.chunk_size)
+
+        start_response(status, headerlist)
+        return body
+
+    def _is_not_modified(self, environ) -> bool:
+        """Check if the file has not been modified since the date from the request.
+
+        Arguments:
+            environ (Dict[str, Any]): The WSGI environment.
+
+        Returns:
+            bool: True if the file has not been modified, False otherwise.
+        """
+        value = environ.get("HTTP_IF_MODIFIED_SINCE")
+        if not value or "HTTP_IF_NONE_MATCH" in environ:
+            return False
+
+        since = parsedate_tz(value)
+        if since is None:
+            return False
+
+        return self._modified <= mktime_tz(since)
+
+    def _with_headers(self, *headers: Tuple[str, str]) -> List[Tuple[str, str]]:
+        """Copy the headers of the response, replacing the given ones.
+
+        Arguments:
+            headers (Tuple[str, str]): The headers to replace or add.
+
+        Returns:
+            List[Tuple[str, str]]: The headers.
+        """
+        names = {name.lower() for name, _ in headers}
+        return [
+            header for header in self.headerlist if header[0].lower() not in names
+        ] + list(headers)
+
+    def _select_ranges(self, environ) -> _SentResponse:
+        """Select the part of the file to send, based on the `Range` header.
+
+        Arguments:
+            environ (Dict[str, Any]): The WSGI environment.
+
+        Returns:
+            _SentResponse: The status line, the headers and the body.
+        """
+        body = self._file_body
+        value = environ.get("HTTP_RANGE")
+        if_range = environ.get("HTTP_IF_RANGE")
+        if not value or (if_range is not None and if_range != self._last_modified):
+            return self.status, self.headerlist, body
+
+        size = self._size
+        ranges = _parse_ranges(value, size)
+        if ranges is None:
+            return self.status, self.headerlist, body
+
+        if not ranges:
+            return (
+                "416 Range Not Satisfiable",
+                self._with_headers(
+                    ("Content-Range", f"bytes */{size}"), ("Content-Length", "0")
+                ),
+                _FileSlice(self._source, 0, 0, body.chunk_size),
+            )
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            return (
+                "206 Partial Content",
+                self._with_headers(
+                    ("Content-Range", f"bytes {start}-{end - 1}/{size}"),
+                    ("Content-Length", str(end - start)),
+                ),
+                _FileSlice(self._source, start, end - start, body.chunk_size),
+            )
+
+        return self._multiple_ranges(ranges)
+
+    def _multiple_ranges(self, ranges: List[Tuple[int, int]]) -> _SentResponse:
+        """Create the `multipart/byteranges` body with the ranges of the file.
+
+        Arguments:
+            ranges (List[Tuple[int, int]]): The ranges of the file.
+
+        Returns:
+            _SentResponse: The status line, the headers and the body.
+        """
+        boundary = uuid4().hex
+        content_type = self.content_type
+        size = self._size
+        part_headers = [
+            (
+                f"\r\n--{boundary}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end - 1}/{size}\r\n\r\n"
+            ).encode("latin-1")
+            for start, end in ranges
+        ]
+        closing = f"\r\n--{boundary}--\r\n".encode("latin-1")
+        length = (
+            sum(map(len, part_headers))
+            + sum(end - start for start, end in ranges)
+            + len(closing)
+        )
+
+        return (
+            "206 Partial Content",
+            self._with_headers(
+                ("Content-Type", f"multipart/byteranges; boundary={boundary}"),
+                ("Content-Length", str(length)),
+            ),
+            _MultipleRanges(self._file_body, ranges, part_headers, closing),
+        )
+
+
+class _MultipleRanges:
+    """Parts of the `multipart/byteranges` body, read from the file in chunks."""
+
+    __slots__ = ("_file", "_ranges", "_part_headers", "_closing")
+
+    def __init__(
+        self,
+        file: _FileSlice,
+        ranges: List[Tuple[int, int]],
+        part_headers: List[bytes],
+        closing: bytes,
+    ) -> None:
+        """Initialize the body.
+
+        Arguments:
+            file (_FileSlice): The whole file.
+            ranges (List[Tuple[int, int]]): The ranges of the file.
+            part_headers (List[bytes]): The delimiters and headers of the parts.
+            closing (bytes): The closing delimiter.
+        """
+        self._file = file
+        self._ranges = ranges
+        self._part_headers = part_headers
+        self._closing = closing
+
+    def __iter__(self) -> Iterator[bytes]:
+        file = self._file
+        for (start, end), headers in zip(self._ranges, self._part_headers):
+            yield headers
+            yield from _FileSlice(file.open(), start, end - start, file.chunk_size)
+
+        yield self._closing
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "FileResponse", "MAX_RANGES"]
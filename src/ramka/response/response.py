@@ -1,8 +1,465 @@
-from webob import Response as BaseResponse
+import json
+from http import HTTPStatus
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
+from webob.cookies import make_cookie
+from webob.headers import ResponseHeaders
 
-class Response(BaseResponse):
+from ramka.response.serializers import DEFAULT_JSON_SERIALIZER, JSONSerializer
+
+# Status lines of all known status codes, so they don't need to be built for each
+# response.
+_STATUS_LINES = {
+    status.value: f"{status.value} {status.phrase}" for status in HTTPStatus
+}
+
+_DEFAULT_CONTENT_TYPE = ("Content-Type", "text/html; charset=UTF-8")
+
+_JSON_CONTENT_TYPE = ("Content-Type", "application/json")
+
+
+def _has_charset(content_type: str) -> bool:
+    """Check if the charset should be added to the content type.
+
+    Arguments:
+        content_type (str): The content type, without parameters.
+
+    Returns:
+        bool: True if the content is text, False otherwise.
+    """
+    return (
+        content_type.startswith("text/")
+        or content_type.endswith("+xml")
+        or content_type in ("application/xml", "application/javascript")
+    )
+
+
+class _ClosingIterator:
+    """Iterator over the wrapped parts of the body that closes the original parts.
+
+    WSGI servers call `close` only on the iterable they get, so when the parts of the
+    body are wrapped, the original iterable needs to be closed by the wrapper.
+    """
+
+    __slots__ = ("_iterator", "_closes")
+
+    def __init__(self, wrapped: Iterable[bytes], original: Iterable[bytes]) -> None:
+        """Initialize the iterator.
+
+        Arguments:
+            wrapped (Iterable[bytes]): The wrapped parts of the body.
+            original (Iterable[bytes]): The original parts of the body.
+        """
+        self._iterator = iter(wrapped)
+        self._closes = [
+            close
+            for close in (
+                getattr(wrapped, "close", None),
+                getattr(original, "close", None),
+            )
+            if close is not None
+        ]
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        return next(self._iterator)
+
+    def close(self) -> None:
+        """Close the wrapped and the original parts of the body."""
+        for close in self._closes:
+            close()
+
+
+class Response:
     """Application response implementation.
 
-    There is no custom logic here at the moment, but there will be in the future.
+    The response only stores the status code, the list of headers and the body (or
+    an iterable with the parts of the body), and it writes them straight to
+    `start_response` when it's called as a WSGI application. Headers are kept as
+    a plain list, and the mapping returned by `headers` is a view of that list, created
+    only when it's used.
+
+    The attributes of `webob.Response` that are most often used in views are
+    supported: `status`, `status_code`, `headers`, `headerlist`, `content_type`,
+    `charset`, `body`, `text`, `json`, `app_iter`, `set_cookie` and `delete_cookie`.
+
+    The body can be streamed by setting `app_iter` to an iterable (e.g. a generator)
+    that yields the parts of the body. The parts are sent to the WSGI server as they
+    are produced, so the body is never kept in memory.
+
+    JSON bodies set with `json` are serialized straight to bytes, using the serializer
+    of the application (see `ramka.response.serializers`).
+
+    Fields:
+        headerlist (List[Tuple[str, str]]): The headers of the response.
     """
+
+    __slots__ = (
+        "headerlist",
+        "_status_code",
+        "_status",
+        "_body",
+        "_app_iter",
+        "_json_serializer",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        body: Optional[Union[bytes, str]] = None,
+        status: Union[int, str] = 200,
+        headerlist: Optional[List[Tuple[str, str]]] = None,
+        app_iter: Optional[Iterable[bytes]] = None,
+        content_type: Optional[str] = None,
+        json_serializer: Optional[JSONSerializer] = None,
+    ) -> None:
+        """Initialize the response.
+
+        Arguments:
+            body (Optional[Union[bytes, str]]): The body of the response. Text is
+                encoded using the charset of the response.
+            status (Union[int, str]): The status code or the status line (e.g.
+                `404 Not Found`).
+            headerlist (Optional[List[Tuple[str, str]]]): The headers of the
+                response, `Content-Type: text/html; charset=UTF-8` by default.
+            app_iter (Optional[Iterable[bytes]]): The parts of the body, used instead
+                of the body.
+            content_type (Optional[str]): The content type of the response.
+            json_serializer (Optional[JSONSerializer]): The function that serializes
+                JSON bodies to bytes, `DEFAULT_JSON_SERIALIZER` by default.
+        """
+        self.headerlist: List[Tuple[str, str]] = (
+            [_DEFAULT_CONTENT_TYPE] if headerlist is None else headerlist
+        )
+        self.status = status
+        self._body: Optional[bytes] = b""
+        self._app_iter: Optional[Iterable[bytes]] = None
+        self._json_serializer = json_serializer or DEFAULT_JSON_SERIALIZER
+
+        if content_type is not None:
+            self.content_type = content_type
+
+        if isinstance(body, str):
+            self._body = body.encode(self.charset or "UTF-8")
+        elif body is not None:
+            self._body = body
+        elif app_iter is not None:
+            self._body = None
+            self._app_iter = app_iter
+
+    def __call__(self, environ, start_response) -> Iterable[bytes]:
+        """Send the response as a WSGI application.
+
+        The `Content-Length` header is added if the body is known and the header is
+        not already set.
+
+        Arguments:
+            environ (Dict[str, Any]): The WSGI environment.
+            start_response (Callable): The function that starts the response.
+
+        Returns:
+            Iterable[bytes]: The body of the response.
+        """
+        headerlist = self.headerlist
+        body = self._body
+        if body is not None:
+            if self._get_header("content-length") is None:
+                headerlist = headerlist + [("Content-Length", str(len(body)))]
+
+            app_iter = [body]
+        else:
+            app_iter = self._app_iter
+
+        start_response(self.status, headerlist)
+
+        if environ.get("REQUEST_METHOD") == "HEAD":
+            close = getattr(app_iter, "close", None)
+            if close is not None:
+                close()
+
+            return []
+
+        return app_iter
+
+    def _get_header(self, name: str) -> Optional[str]:
+        """Get the value of the header without creating the view of the headers.
+
+        Arguments:
+            name (str): The lowercase name of the header.
+
+        Returns:
+            Optional[str]: The value of the first header with the name.
+        """
+        for header in self.headerlist:
+            if header[0].lower() == name:
+                return header[1]
+
+        return None
+
+    def _set_header(self, name: str, value: str) -> None:
+        """Replace the value of the header or add the header if it's missing.
+
+        Arguments:
+            name (str): The name of the header.
+            value (str): The value of the header.
+        """
+        headerlist = self.headerlist
+        lowercase_name = name.lower()
+        for index, header in enumerate(headerlist):
+            if header[0].lower() == lowercase_name:
+                headerlist[index] = (name, value)
+                return
+
+        headerlist.append((name, value))
+
+    def _remove_header(self, name: str) -> None:
+        """Remove all headers with the name.
+
+        Arguments:
+            name (str): The lowercase name of the header.
+        """
+        headerlist = self.headerlist
+        if any(header[0].lower() == name for header in headerlist):
+            headerlist[:] = [item for item in headerlist if item[0].lower() != name]
+
+    @property
+    def status(self) -> str:
+        """The status line of the response (e.g. `200 OK`).
+
+        It can be set using the status code or the status line.
+        """
+        status = self._status
+        if status is None:
+            code = self._status_code
+            status = _STATUS_LINES.get(code) or f"{code} Unknown Status"
+
+        return status
+
+    @status.setter
+    def status(self, value: Union[int, str]) -> None:
+        if isinstance(value, int):
+            self.status_code = value
+        else:
+            self._status_code = int(value.split(" ", 1)[0])
+            self._status = value
+
+    @property
+    def status_code(self) -> int:
+        """The status code of the response (e.g. `200`)."""
+        return self._status_code
+
+    @status_code.setter
+    def status_code(self, value: int) -> None:
+        self._status_code = value
+        self._status = None
+
+    @property
+    def headers(self) -> ResponseHeaders:
+        """The headers of the response, as a case-insensitive view of `headerlist`."""
+        return ResponseHeaders.view_list(self.headerlist)
+
+    @property
+    def content_type(self) -> Optional[str]:
+        """The content type of the response, without parameters (e.g. `charset`).
+
+        When the content type is changed, the charset is kept only for text types.
+        """
+        value = self._get_header("content-type")
+        if value is None:
+            return None
+
+        return value.split(";", 1)[0].strip()
+
+    @content_type.setter
+    def content_type(self, value: str) -> None:
+        charset = self.charset
+        if charset is not None and ";" not in value and _has_charset(value):
+            value = f"{value}; charset={charset}"
+
+        self._set_header("Content-Type", value)
+
+    @property
+    def charset(self) -> Optional[str]:
+        """The charset of the response, taken from the `Content-Type` header."""
+        for parameter in (self._get_header("content-type") or "").split(";")[1:]:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "charset":
+                return value.strip().strip('"')
+
+        return None
+
+    @charset.setter
+    def charset(self, value: Optional[str]) -> None:
+        content_type = self.content_type or "text/html"
+        if value is not None:
+            content_type = f"{content_type}; charset={value}"
+
+        self._set_header("Content-Type", content_type)
+
+    @property
+    def body(self) -> bytes:
+        """The body of the response.
+
+        If the response has been created with an iterable, the parts of the body are
+        joined the first time the body is used.
+        """
+        body = self._body
+        if body is None:
+            body = self._body = b"".join(self._app_iter)
+            close = getattr(self._app_iter, "close", None)
+            if close is not None:
+                close()
+
+            self._app_iter = None
+
+        return body
+
+    @body.setter
+    def body(self, value: bytes) -> None:
+        if not isinstance(value, bytes):
+            raise TypeError(
+                f"The body needs to be bytes, not {type(value).__name__}, use `text` "
+                f"to set the body from a string."
+            )
+
+        self._body = value
+        self._app_iter = None
+        self._remove_header("content-length")
+
+    @property
+    def text(self) -> str:
+        """The body of the response, decoded using its charset (UTF-8 by default)."""
+        return self.body.decode(self.charset or "UTF-8")
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.body = value.encode(self.charset or "UTF-8")
+
+    @property
+    def json(self) -> Any:
+        """The body of the response, decoded from JSON."""
+        return json.loads(self.text)
+
+    @json.setter
+    def json(self, value: Any) -> None:
+        self.body = self._json_serializer(value)
+
+    json_body = json
+
+    @property
+    def app_iter(self) -> Iterable[bytes]:
+        """The parts of the body of the response.
+
+        Setting it replaces the body, so the body can be sent in parts (e.g. read from
+        a file) and the `Content-Length` header is not added automatically.
+        """
+        if self._body is not None:
+            return [self._body]
+
+        return self._app_iter
+
+    @app_iter.setter
+    def app_iter(self, value: Iterable[bytes]) -> None:
+        if isinstance(value, (bytes, str)):
+            raise TypeError(
+                "The parts of the body need to be an iterable of bytes, use `body` or "
+                "`text` to set the whole body."
+            )
+
+        self._app_iter = value
+        self._body = None
+        self._remove_header("content-length")
+
+    @property
+    def is_streaming(self) -> bool:
+        """True if the body is sent in parts that have not been read yet."""
+        return self._body is None
+
+    def wrap_app_iter(
+        self, wrapper: Callable[[Iterable[bytes]], Iterable[bytes]]
+    ) -> None:
+        """Wrap the parts of the body without reading them.
+
+        It's meant to be used in middleware that transforms streamed bodies (e.g.
+        compresses them). The wrapper gets the current parts of the body and returns
+        the new ones, which are read only when the response is sent. The original
+        parts are closed together with the wrapped ones.
+
+        Arguments:
+            wrapper (Callable[[Iterable[bytes]], Iterable[bytes]]): The function that
+                wraps the parts of the body.
+        """
+        original = self.app_iter
+        self.app_iter = _ClosingIterator(wrapper(original), original)
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """The length of the body, if it's known."""
+        if self._body is not None:
+            return len(self._body)
+
+        value = self._get_header("content-length")
+        return int(value) if value is not None else None
+
+    def set_cookie(self, name: str, value: Optional[str], **kwargs) -> None:
+        """Add a cookie to the response.
+
+        See `webob.Response.set_cookie` for the supported arguments (e.g. `max_age`,
+        `path`, `domain`, `secure` or `httponly`).
+
+        Arguments:
+            name (str): The name of the cookie.
+            value (Optional[str]): The value of the cookie, None removes the cookie.
+            kwargs (Dict): The attributes of the cookie.
+        """
+        self.headerlist.append(("Set-Cookie", make_cookie(name, value, **kwargs)))
+
+    def delete_cookie(
+        self, name: str, path: str = "/", domain: Optional[str] = None
+    ) -> None:
+        """Remove a cookie from the client.
+
+        Arguments:
+            name (str): The name of the cookie.
+            path (str): The path of the cookie.
+            domain (Optional[str]): The domain of the cookie.
+        """
+        self.set_cookie(name, None, path=path, domain=domain)
+
+
+class JSONResponse(Response):
+    """Response with a JSON body.
+
+    The body is serialized to bytes when the response is created, and the content type
+    is set to `application/json`.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        data: Any,
+        status: Union[int, str] = 200,
+        headerlist: Optional[List[Tuple[str, str]]] = None,
+        json_serializer: Optional[JSONSerializer] = None,
+    ) -> None:
+        """Initialize the response.
+
+        Arguments:
+            data (Any): The data to serialize to JSON.
+            status (Union[int, str]): The status code or the status line.
+            headerlist (Optional[List[Tuple[str, str]]]): The headers of the
+                response, `Content-Type: application/json` by default.
+            json_serializer (Optional[JSONSerializer]): The function that serializes
+                the data to bytes, `DEFAULT_JSON_SERIALIZER` by default.
+        """
+        super().__init__(
+            status=status,
+            headerlist=([_JSON_CONTENT_TYPE] if headerlist is None else headerlist),
+            json_serializer=json_serializer,
+        )
+        self._body = self._json_serializer(data)
+
+
+__all__ = ["JSONResponse", "Response"]
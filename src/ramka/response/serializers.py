@@ -0,0 +1,45 @@
+import json
+from typing import Any, Callable
+
+# A function that serializes a value to JSON encoded using UTF-8.
+JSONSerializer = Callable[[Any], bytes]
+
+
+def stdlib_json_serializer(value: Any) -> bytes:
+    """Serialize the value to compact JSON using the standard library.
+
+    Arguments:
+        value (Any): The value to serialize.
+
+    Returns:
+        bytes: The JSON encoded using UTF-8.
+    """
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def get_default_json_serializer() -> JSONSerializer:
+    """Get the fastest JSON serializer that is installed.
+
+    `orjson` is used if it's installed, the standard library otherwise.
+
+    Returns:
+        JSONSerializer: The JSON serializer.
+    """
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return stdlib_json_serializer
+
+    return orjson.dumps  # pylint: disable=no-member
+
+
+# The JSON serializer used by responses if no other serializer is given.
+DEFAULT_JSON_SERIALIZER = get_default_json_serializer()
+
+
+__all__ = [
+    "DEFAULT_JSON_SERIALIZER",
+    "JSONSerializer",
+    "get_default_json_serializer",
+    "stdlib_json_serializer",
+]
@@ -1,4 +1,25 @@
+from ramka.routing.converters import Converter, register_converter
+from ramka.routing.references import import_view, view_reference
+from ramka.routing.regex_router import RegexRouter
 from ramka.routing.route import ResolvedRoute, Route
-from ramka.routing.router import BaseRouter, SimpleRouter
+from ramka.routing.router import BaseRouter, RouterCacheInfo, RouterStats, RouteTable
+from ramka.routing.simple_router import SimpleRouter
+from ramka.routing.snapshot import routes_hash
+from ramka.routing.trie_router import TrieRouter
 
-__all__ = ["BaseRouter", "SimpleRouter", "ResolvedRoute", "Route"]
+__all__ = [
+    "BaseRouter",
+    "SimpleRouter",
+    "TrieRouter",
+    "RegexRouter",
+    "RouterCacheInfo",
+    "RouterStats",
+    "RouteTable",
+    "ResolvedRoute",
+    "Route",
+    "Converter",
+    "register_converter",
+    "routes_hash",
+    "import_view",
+    "view_reference",
+]
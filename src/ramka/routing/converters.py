@@ -0,0 +1,106 @@
+import re
+from typing import Any, Callable, Dict, Pattern
+from uuid import UUID
+
+
+class Converter:
+    """Converter of a route parameter.
+
+    A converter defines the regular expression that the value of the parameter has to
+    match and the function that turns the matched string into the Python value (e.g.
+    `int`). Converters are used by all routers, so the same paths can be used no matter
+    which router is selected.
+
+    Values of converters that are not multi-segment never contain a forward slash,
+    so they always match a part of a single path segment.
+
+    Fields:
+        regex (str): The regular expression that matches the value of the parameter.
+            It can't contain capturing groups.
+        to_python (Callable[[str], Any]): The function that converts the matched
+            string into the value of the parameter.
+        multi_segment (bool): Whether the value can span multiple path segments.
+        matcher (Pattern): The compiled regular expression.
+    """
+
+    def __init__(
+        self,
+        regex: str,
+        to_python: Callable[[str], Any] = str,
+        multi_segment: bool = False,
+    ) -> None:
+        """Initialize the converter.
+
+        Arguments:
+            regex (str): The regular expression that matches the value.
+            to_python (Callable[[str], Any]): The function that converts the value.
+            multi_segment (bool): Whether the value can span multiple path segments.
+
+        Raises:
+            (ValueError): If the regular expression contains capturing groups.
+        """
+        self.regex = regex
+        self.to_python = to_python
+        self.multi_segment = multi_segment
+        self.matcher: Pattern = re.compile(regex)
+
+        if self.matcher.groups:
+            raise ValueError(
+                f"Regular expression of a converter can't contain capturing groups: "
+                f"{regex}."
+            )
+
+    def __repr__(self) -> str:
+        return f"Converter({self.regex!r}, {self.to_python!r})"
+
+
+_STR = Converter(r"[^/]+")
+_INT = Converter(r"[-+]?\d+", int)
+_FLOAT = Converter(r"[-+]?(?:\d+\.?\d*|\.\d+)", float)
+
+CONVERTERS: Dict[str, Converter] = {
+    "": _STR,
+    "str": _STR,
+    "int": _INT,
+    "float": _FLOAT,
+    "slug": Converter(r"[-a-zA-Z0-9_]+"),
+    "uuid": Converter(
+        r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}",
+        UUID,
+    ),
+    "path": Converter(r".+", multi_segment=True),
+    # Types of the format specification of the `parse` library, kept so the paths
+    # defined for previous versions still work.
+    "d": _INT,
+    "f": Converter(r"[-+]?\d*\.\d+", float),
+    "l": Converter(r"[a-zA-Z]+"),
+    "w": Converter(r"\w+"),
+    "W": Converter(r"[^\w/]+"),
+    "S": Converter(r"[^\s/]+"),
+}
+
+
+def register_converter(name: str, converter: Converter) -> None:
+    """Register a converter, so it can be used in route paths (e.g. `{id:name}`).
+
+    Converters are used when routes are added, so a converter needs to be registered
+    before the routes that use it.
+
+    Arguments:
+        name (str): The name of the converter.
+        converter (Converter): The converter.
+
+    Raises:
+        (ValueError): If the name is not valid or a converter with the same name is
+            already registered.
+    """
+    if not name or any(char in name for char in "{}:/"):
+        raise ValueError(f"Invalid converter name '{name}'.")
+
+    if name in CONVERTERS:
+        raise ValueError(f"Converter '{name}' is already registered.")
+
+    CONVERTERS[name] = converter
+
+
+__all__ = ["CONVERTERS", "Converter", "register_converter"]
@@ -0,0 +1,240 @@
+import re
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from ramka.routing.converters import CONVERTERS
+
+_TOKEN_RE = re.compile(r"(\{\{|\}\}|\{[^{}]*\})")
+
+
+def is_static_path(path: str) -> bool:
+    """Check if the path has no parameters.
+
+    Escaped braces (`{{` and `}}`) are not considered parameters.
+
+    Arguments:
+        path (str): The path (or a single segment of the path) to check.
+
+    Returns:
+        bool: True if the path has no parameters, False otherwise.
+    """
+    return "{" not in path.replace("{{", "")
+
+
+def unescape_path(path: str) -> str:
+    """Replace escaped braces in the path without parameters with single ones.
+
+    Arguments:
+        path (str): The path to unescape.
+
+    Returns:
+        str: The path that can be compared with the request path.
+    """
+    return path.replace("{{", "{").replace("}}", "}")
+
+
+def pattern_key(path: str) -> Tuple:
+    """Get the key that identifies the pattern of the path.
+
+    Names of the parameters are not part of the key, so paths that differ only in
+    names of the parameters (e.g. `/users/{id}/` and `/users/{name}/`) have the same
+    key. Parameters are compared using the regular expressions of their converters,
+    so aliases of the same converter (e.g. `{id:d}` and `{id:int}`) are the same too.
+    It can be used to find routes that can't be told apart.
+
+    Arguments:
+        path (str): The path to get the key for.
+
+    Returns:
+        Tuple: The key of the path pattern.
+
+    Raises:
+        (ValueError): If a parameter type is not supported.
+    """
+    key = []
+    for token in _TOKEN_RE.split(path):
+        if token.startswith("{") and token not in ("{{", "}}"):
+            type_name = token[1:-1].partition(":")[2]
+            if type_name not in CONVERTERS:
+                raise ValueError(f"Unsupported parameter type '{type_name}' in {path}.")
+
+            key.append((CONVERTERS[type_name].regex,))
+        elif key and isinstance(key[-1], str):
+            key[-1] += unescape_path(token)
+        elif token:
+            key.append(unescape_path(token))
+
+    return tuple(key)
+
+
+class PathPattern:
+    """Compiled representation of a route path.
+
+    The path format (e.g. `/users/{id:int}/`) is translated into a regular expression
+    once, when the pattern is created. Each named parameter becomes a capturing group
+    and has a converter that turns the matched string into the value of correct type
+    (see `ramka.routing.converters.CONVERTERS`). Anonymous parameters (e.g. `{}`) have
+    to match but are not returned.
+
+    Fields:
+        path (str): The path format.
+        expression (str): The regular expression that matches the path.
+        params (List[Tuple[str, Callable]]): The names and the functions converting
+            values of the named parameters, in the order of their capturing groups.
+        multi_segment (bool): Whether any of the parameters can span multiple path
+            segments.
+        regex (Pattern): The compiled regular expression. It's compiled when it's
+            used for the first time, because routers that merge expressions of
+            multiple routes don't need it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.params: List[Tuple[str, Callable]] = []
+        self.multi_segment = False
+
+        parts = []
+        for token in _TOKEN_RE.split(path):
+            if token in ("{{", "}}"):
+                parts.append(re.escape(token[0]))
+            elif token.startswith("{"):
+                parts.append(self._compile_parameter(token[1:-1]))
+            elif token:
+                parts.append(re.escape(token))
+
+        self.expression = "".join(parts)
+        self._regex: Optional[Pattern] = None
+
+    @property
+    def regex(self) -> Pattern:
+        """The compiled regular expression that matches the path.
+
+        Returns:
+            Pattern: The compiled regular expression.
+        """
+        if self._regex is None:
+            self._regex = re.compile(self.expression)
+
+        return self._regex
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the pattern that can be pickled.
+
+        The regular expression is compiled again when it's used for the first time
+        after the pattern is unpickled. Functions converting values of the parameters
+        are pickled by reference, so they need to be defined on the module level.
+
+        Returns:
+            Dict[str, Any]: The state of the pattern.
+        """
+        state = self.__dict__.copy()
+        state["_regex"] = None
+        return state
+
+    def _compile_parameter(self, field: str) -> str:
+        """Translate a single parameter into a regular expression.
+
+        Arguments:
+            field (str): The content of the parameter, without the braces.
+
+        Returns:
+            str: The regular expression matching the parameter.
+
+        Raises:
+            (ValueError): If the parameter type is not supported or the parameter is
+                defined more than once.
+        """
+        name, _, type_name = field.partition(":")
+        if type_name not in CONVERTERS:
+            raise ValueError(
+                f"Unsupported parameter type '{type_name}' in {self.path}."
+            )
+
+        converter = CONVERTERS[type_name]
+        self.multi_segment = self.multi_segment or converter.multi_segment
+        if not name:
+            return f"(?:{converter.regex})"
+
+        if any(name == param_name for param_name, _ in self.params):
+            raise ValueError(f"Parameter '{name}' is defined twice in {self.path}.")
+
+        self.params.append((name, converter.to_python))
+        return f"({converter.regex})"
+
+    def convert(self, values: Tuple[str, ...]) -> Dict[str, Any]:
+        """Convert the matched values into the route parameters.
+
+        Arguments:
+            values (Tuple[str, ...]): The values of the capturing groups.
+
+        Returns:
+            Dict[str, Any]: The parameters of the route.
+        """
+        return {
+            name: to_python(value)
+            for (name, to_python), value in zip(self.params, values)
+        }
+
+    def match(self, path: str) -> Optional[Dict[str, Any]]:
+        """Match the whole path against the pattern.
+
+        Arguments:
+            path (str): The path (or a path segment) to match.
+
+        Returns:
+            Optional[Dict[str, Any]]: The parameters of the route or None if the path
+                doesn't match the pattern.
+        """
+        matched = self.regex.fullmatch(path)
+        if matched is None:
+            return None
+
+        return self.convert(matched.groups())
+
+
+def patterns_can_overlap(first: PathPattern, second: PathPattern) -> bool:
+    """Check if there can be a path that matches both patterns.
+
+    The check is conservative: it returns False only if it's certain that no path
+    matches both patterns. Values of parameters that are not multi-segment never
+    contain a forward slash, so such patterns can only match paths with the same number
+    of segments, and the segments are compared one by one.
+
+    Arguments:
+        first (PathPattern): The first pattern.
+        second (PathPattern): The second pattern.
+
+    Returns:
+        bool: False if no path can match both patterns, True otherwise.
+    """
+    if first.multi_segment or second.multi_segment:
+        return True
+
+    first_segments = first.path.split("/")
+    second_segments = second.path.split("/")
+    if len(first_segments) != len(second_segments):
+        return False
+
+    for first_segment, second_segment in zip(first_segments, second_segments):
+        if is_static_path(first_segment):
+            first_segment, second_segment = second_segment, first_segment
+
+        if not is_static_path(second_segment):
+            continue
+
+        value = unescape_path(second_segment)
+        if is_static_path(first_segment):
+            if unescape_path(first_segment) != value:
+                return False
+        elif PathPattern(first_segment).match(value) is None:
+            return False
+
+    return True
+
+
+__all__ = [
+    "PathPattern",
+    "is_static_path",
+    "patterns_can_overlap",
+    "pattern_key",
+    "unescape_path",
+]
@@ -0,0 +1,76 @@
+from importlib import import_module
+from typing import Callable, Tuple, Union
+
+from ramka.views import BaseView
+
+
+def view_reference(view: Union[BaseView, Callable]) -> str:
+    """Get the dotted path of the view (e.g. `app.views:UsersView`).
+
+    Arguments:
+        view (Union[BaseView, Callable]): The view.
+
+    Returns:
+        str: The module and the qualified name of the view separated with a colon.
+
+    Raises:
+        (ValueError): If the view can't be imported using its dotted path, e.g. it's
+            defined inside a function.
+    """
+    module = getattr(view, "__module__", None)
+    name = getattr(view, "__qualname__", "")
+    if not module or not name or "<" in name:
+        raise ValueError(f"View {view!r} can't be referenced by its dotted path.")
+
+    return f"{module}:{name}"
+
+
+def split_reference(reference: str) -> Tuple[str, str]:
+    """Split the dotted path of a view into the module and the name of the view.
+
+    Both `app.views:UsersView` and `app.views.UsersView` formats are supported. The
+    name can be dotted as well, e.g. `app.views:Views.users`.
+
+    Arguments:
+        reference (str): The dotted path of the view.
+
+    Returns:
+        Tuple[str, str]: The module and the name of the view.
+
+    Raises:
+        (ValueError): If the reference is not a valid dotted path.
+    """
+    if ":" in reference:
+        module, _, name = reference.partition(":")
+    else:
+        module, _, name = reference.rpartition(".")
+
+    if not all(part.isidentifier() for part in f"{module}.{name}".split(".")):
+        raise ValueError(f"Invalid view reference '{reference}'.")
+
+    return module, name
+
+
+def import_view(reference: str) -> Union[BaseView, Callable]:
+    """Import the view using its dotted path.
+
+    Arguments:
+        reference (str): The dotted path of the view, e.g. `app.views:UsersView`.
+
+    Returns:
+        Union[BaseView, Callable]: The view.
+
+    Raises:
+        (ValueError): If the reference is not a valid dotted path.
+        (ImportError): If the module of the view can't be imported.
+        (AttributeError): If the module doesn't have the view.
+    """
+    module, name = split_reference(reference)
+    view = import_module(module)
+    for attribute in name.split("."):
+        view = getattr(view, attribute)
+
+    return view
+
+
+__all__ = ["import_view", "split_reference", "view_reference"]
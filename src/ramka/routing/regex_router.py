@@ -0,0 +1,137 @@
+import re
+from typing import Dict, Optional, Pattern, Sequence, Tuple
+
+from ramka.routing.patterns import PathPattern
+from ramka.routing.route import ResolvedRoute, Route
+from ramka.routing.router import BaseRouter
+
+
+class _CompiledRoutes:
+    """Routes with parameters merged into a single regular expression.
+
+    The expression is compiled the first time a path is resolved. Instances are never
+    changed after the expression is compiled, so they can be shared between threads.
+
+    Fields:
+        routes (Tuple[Tuple[Route, PathPattern], ...]): The routes with their patterns.
+    """
+
+    __slots__ = ("routes", "_compiled")
+
+    def __init__(self, routes: Tuple[Tuple[Route, PathPattern], ...]) -> None:
+        self.routes = routes
+        self._compiled: Optional[
+            Tuple[Pattern, Dict[int, Tuple[Route, PathPattern]]]
+        ] = None
+
+    def compiled(self) -> Tuple[Pattern, Dict[int, Tuple[Route, PathPattern]]]:
+        """Get the combined regular expression and the routes by their marker groups.
+
+        An empty group is added at the end of the expression of each route, so the
+        route can be found using the index of the last matched group. Wrapping whole
+        expressions in groups would be simpler, but it makes the regular expression
+        engine save the state of all groups for each alternative, so the time needed
+        to resolve a path would grow quadratically with the number of routes.
+
+        Returns:
+            Tuple[Pattern, Dict[int, Tuple[Route, PathPattern]]]: The compiled
+                regular expression and the routes by the indexes of their groups.
+        """
+        compiled = self._compiled
+        if compiled is None:
+            expressions = []
+            groups = {}
+            group_index = 0
+            for route, pattern in self.routes:
+                expressions.append(f"{pattern.expression}()")
+                group_index += len(pattern.params) + 1
+                groups[group_index] = (route, pattern)
+
+            compiled = self._compiled = (re.compile("|".join(expressions)), groups)
+
+        return compiled
+
+    def __getstate__(self) -> Tuple[Tuple[Route, PathPattern], ...]:
+        """Get the state that can be pickled, without the compiled expression.
+
+        Returns:
+            Tuple[Tuple[Route, PathPattern], ...]: The routes with their patterns.
+        """
+        return self.routes
+
+    def __setstate__(self, state: Tuple[Tuple[Route, PathPattern], ...]) -> None:
+        """Restore the unpickled routes.
+
+        Arguments:
+            state (Tuple[Tuple[Route, PathPattern], ...]): The routes with their
+                patterns.
+        """
+        self.__init__(state)  # pylint: disable=unnecessary-dunder-call
+
+
+class RegexRouter(BaseRouter):
+    """Regex router class.
+
+    This router translates each route path with parameters into a regular expression
+    when the route is added. All expressions are then merged into a single alternation,
+    so resolving a path takes one call to `re.match`, no matter how many routes are
+    defined.
+
+    Routes are checked in the order they have been added, the same as in
+    `SimpleRouter`, and the parameters are converted to the types defined in the route
+    paths (see `ramka.routing.converters.CONVERTERS` for supported types).
+
+    Fields:
+        routes (Tuple[Route, ...]): The routes that have been defined in the
+            application.
+    """
+
+    def _extend_dynamic(
+        self, dynamic: Optional[_CompiledRoutes], routes: Sequence[Tuple[int, Route]]
+    ) -> _CompiledRoutes:
+        """Add routes with parameters to the routes merged into a regular expression.
+
+        The combined regular expression is compiled again the next time a path is
+        resolved.
+
+        Arguments:
+            dynamic (Optional[_CompiledRoutes]): The routes added earlier.
+            routes (Sequence[Tuple[int, Route]]): The orders and the routes to add.
+
+        Returns:
+            _CompiledRoutes: All routes with parameters.
+        """
+        return _CompiledRoutes(
+            (dynamic.routes if dynamic is not None else ())
+            + tuple((route, PathPattern(route.path)) for _, route in routes)
+        )
+
+    def _resolve_dynamic(
+        self, dynamic: Optional[_CompiledRoutes], path: str
+    ) -> Optional[ResolvedRoute]:
+        """Resolve the route with parameters for the given path.
+
+        Arguments:
+            dynamic (Optional[_CompiledRoutes]): The routes with parameters.
+            path (str): The path to resolve the route for.
+
+        Returns:
+            Optional[ResolvedRoute]: The resolved route.
+        """
+        if dynamic is None:
+            return None
+
+        regex, groups = dynamic.compiled()
+        match = regex.fullmatch(path)
+        if match is None:
+            return None
+
+        marker = match.lastindex
+        route, pattern = groups[marker]
+        values = [
+            match.group(index) for index in range(marker - len(pattern.params), marker)
+        ]
+        return ResolvedRoute.from_route(route, pattern.convert(values))
+
+
+__all__ = ["RegexRouter"]
@@ -1,7 +1,214 @@
-from inspect import isclass
-from typing import Any, Callable, Dict, List, Optional, Union
+from inspect import getattr_static, isclass
+from threading import Lock, local
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ramka.routing.references import import_view, split_reference, view_reference
+from ramka.views import VIEW_LIFECYCLES, BaseView
+
+if TYPE_CHECKING:
+    from ramka.middleware import Middleware
+
+HTTP_METHODS = ("get", "head", "post", "put", "patch", "delete", "options", "trace")
+
+
+def _get_class_view_handlers(view: type) -> Dict[str, Callable]:
+    """Find the methods that handle HTTP methods in a class-based view.
+
+    Methods that are defined in `BaseView` but not overridden in the view only raise
+    `NotImplementedError`, so they are skipped.
+
+    Arguments:
+        view (type): The class-based view.
+
+    Returns:
+        Dict[str, Callable]: The methods of the view, as they are defined in the class
+            (not bound to any object), by the HTTP method names.
+    """
+    handlers = {}
+    for method in HTTP_METHODS:
+        handler = getattr_static(view, method, None)
+        if handler is not None and handler is not vars(BaseView).get(method):
+            handlers[method.upper()] = handler
+
+    return handlers
+
+
+def _create_view_provider(view: type, lifecycle: str) -> Callable[[], BaseView]:
+    """Create a function that returns an instance of a class-based view.
+
+    Arguments:
+        view (type): The class-based view.
+        lifecycle (str): The lifecycle of the view instances (see `VIEW_LIFECYCLES`).
+
+    Returns:
+        Callable[[], BaseView]: The function that returns the instance of the view
+            that should handle the request.
+    """
+    if lifecycle == "singleton":
+        lock = Lock()
+        instances = []
+
+        def get_singleton() -> BaseView:
+            if not instances:
+                with lock:
+                    if not instances:
+                        instances.append(view())
+
+            return instances[0]
+
+        return get_singleton
+
+    if lifecycle == "thread_local":
+        storage = local()
+
+        def get_thread_local() -> BaseView:
+            instance = getattr(storage, "instance", None)
+            if instance is None:
+                instance = storage.instance = view()
 
-from ramka.views import BaseView
+            return instance
+
+        return get_thread_local
+
+    return view
+
+
+class _ViewTarget:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """The view of a route together with its handlers.
+
+    The target is shared by the route and all routes resolved from it, so a view given
+    as a dotted path is imported only once, and the instances of class-based views are
+    shared according to their lifecycle.
+
+    Fields:
+        reference (Optional[str]): The dotted path of the view, if the view has been
+            given as a dotted path.
+        view (Union[BaseView, Callable, None]): The view, None until it's imported.
+        methods (List[str]): The HTTP methods supported by a function-based view.
+        requested_lifecycle (Optional[str]): The lifecycle given for the route.
+        lifecycle (Optional[str]): The lifecycle of the instances of the class-based
+            view.
+        is_class_view (bool): Whether the view is a class.
+        handlers (Optional[Mapping[str, Callable]]): The handlers by the upper-case
+            names of the HTTP methods, None until the view is loaded.
+        allowed_methods (FrozenSet[str]): The upper-case names of the supported
+            HTTP methods.
+        allow (str): The value of the `Allow` header.
+        view_provider (Optional[Callable[[], BaseView]]): The function that returns
+            the instance of the class-based view.
+    """
+
+    __slots__ = (
+        "reference",
+        "view",
+        "methods",
+        "requested_lifecycle",
+        "lifecycle",
+        "is_class_view",
+        "handlers",
+        "allowed_methods",
+        "allow",
+        "view_provider",
+    )
+
+    _load_lock = Lock()
+
+    def __init__(
+        self,
+        view: Union[BaseView, Callable, str],
+        methods: List[str],
+        lifecycle: Optional[str],
+    ) -> None:
+        """Initialize the target.
+
+        Views that are not given as dotted paths are loaded immediately.
+
+        Arguments:
+            view (Union[BaseView, Callable, str]): The view or its dotted path.
+            methods (List[str]): The HTTP methods supported by a function-based view.
+            lifecycle (Optional[str]): The lifecycle given for the route.
+
+        Raises:
+            (ValueError): If the lifecycle is not supported or the dotted path is not
+                valid.
+        """
+        self.methods = methods
+        self.requested_lifecycle = lifecycle
+        self.lifecycle = None
+        self.is_class_view = False
+        self.handlers: Optional[Mapping[str, Callable]] = None
+        self.allowed_methods: FrozenSet[str] = frozenset()
+        self.allow = ""
+        self.view_provider: Optional[Callable[[], BaseView]] = None
+
+        if isinstance(view, str):
+            self.reference = ":".join(split_reference(view))
+            self.view = None
+            if lifecycle is not None and lifecycle not in VIEW_LIFECYCLES:
+                raise ValueError(f"Unsupported view lifecycle '{lifecycle}'.")
+        else:
+            self.reference = None
+            self._load(view)
+
+    def load(self) -> "_ViewTarget":
+        """Import the view given as a dotted path, if it's not imported yet.
+
+        Returns:
+            _ViewTarget: The loaded target.
+        """
+        if self.handlers is None:
+            with self._load_lock:
+                if self.handlers is None:
+                    self._load(import_view(self.reference))
+
+        return self
+
+    def _load(self, view: Union[BaseView, Callable]) -> None:
+        """Find the handlers for all supported methods of the view.
+
+        Arguments:
+            view (Union[BaseView, Callable]): The view.
+
+        Raises:
+            (ValueError): If the lifecycle is not supported.
+        """
+        is_class_view = isclass(view)
+        lifecycle = self.requested_lifecycle or (
+            getattr(view, "lifecycle", "per_request")
+            if is_class_view
+            else "per_request"
+        )
+        if lifecycle not in VIEW_LIFECYCLES:
+            raise ValueError(f"Unsupported view lifecycle '{lifecycle}'.")
+
+        if is_class_view:
+            handlers = _get_class_view_handlers(view)
+            self.view_provider = _create_view_provider(view, lifecycle)
+        elif callable(view):
+            handlers = {method.upper(): view for method in self.methods}
+        else:
+            handlers = {}
+
+        self.view = view
+        self.lifecycle = lifecycle
+        self.is_class_view = is_class_view
+        self.allowed_methods = frozenset(handlers)
+        self.allow = ", ".join(sorted(self.allowed_methods))
+        self.handlers = MappingProxyType(handlers)
 
 
 class Route:
@@ -19,25 +226,204 @@ class Route:
     the view can have multiple methods (e.g. get, post, put, delete, etc.) and the
     handler will be selected based on the request method.
 
-    Each argument can have a type specified. For example, path `/users/{id:d}/` means
+    The view can also be given as a dotted path (e.g. `billing.views:InvoiceView`). In
+    that case, it's imported when the route handles a request for the first time (or
+    when `load` is called), so modules of views don't need to be imported when the
+    application starts.
+
+    Handlers for all supported methods are found once, when the view is loaded, so
+    finding the handler for a request takes a single dictionary lookup. For class-based
+    views only methods that are actually implemented in the view are supported.
+
+    For class-based views, the lifecycle of the view instances can be set for the route
+    or using the `lifecycle` attribute of the view (see `ramka.views.VIEW_LIFECYCLES`).
+    By default, a new instance of the view is created for each request.
+
+    The maximum size of the request body can be set for the route. It overrides the
+    limit of the application, and larger requests are rejected with the 413 status.
+
+    Middleware can be added to the route or excluded from it, in addition to the
+    middleware of the application. The application compiles the chain of middleware of
+    the route once and keeps it in `middleware_pipelines`, which is shared with the
+    routes resolved from the route.
+
+    Each argument can have a type specified. For example, path `/users/{id:int}/` means
     that the argument `id` should be a decimal number. For full list of supported types
-    see https://github.com/r1chardj0n3s/parse#format-specification.
+    see `ramka.routing.converters.CONVERTERS`.
 
     Fields:
         path (str): The path.
         view (Union[BaseView, Callable]): The view that will handle the path.
         methods (Optional[List[str]]): The HTTP methods supported by the view.
+        lifecycle (str): The lifecycle of the instances of the class-based view.
+        handlers (Mapping[str, Callable]): The handlers by the upper-case names of
+            the HTTP methods. For class-based views, those are unbound methods.
+        allowed_methods (FrozenSet[str]): The upper-case names of the supported
+            HTTP methods.
+        allow (str): The value of the `Allow` header for the route.
+        reference (str): The dotted path of the view.
+        requested_lifecycle (Optional[str]): The lifecycle given for the route.
+        max_body_size (Optional[int]): The maximum size of the request body in bytes,
+            None to use the limit of the application.
+        middleware (Tuple[Type[Middleware], ...]): The middleware classes added to
+            the route.
+        exclude_middleware (Tuple[Type[Middleware], ...]): The middleware classes
+            of the application that are not used for the route.
+        middleware_pipelines (Dict[Any, Any]): The compiled chains of middleware of
+            the route, by the applications that use them.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         path: str,
-        view: Union[BaseView, Callable],
+        view: Union[BaseView, Callable, str],
         methods: Optional[List[str]] = None,
+        lifecycle: Optional[str] = None,
+        max_body_size: Optional[int] = None,
+        middleware: Optional[Sequence[Type["Middleware"]]] = None,
+        exclude_middleware: Optional[Sequence[Type["Middleware"]]] = None,
     ):
+        """Initialize the route.
+
+        Arguments:
+            path (str): The path.
+            view (Union[BaseView, Callable, str]): The view that will handle the path
+                or its dotted path.
+            methods (Optional[List[str]]): The HTTP methods supported by the view.
+            lifecycle (Optional[str]): The lifecycle of the instances of the class-based
+                view. If it's not set, the `lifecycle` attribute of the view is used.
+            max_body_size (Optional[int]): The maximum size of the request body in
+                bytes. If it's not set, the limit of the application is used.
+            middleware (Optional[Sequence[Type[Middleware]]]): The middleware classes
+                to add to the route, inside the middleware of the application.
+            exclude_middleware (Optional[Sequence[Type[Middleware]]]): The middleware
+                classes of the application that should not be used for the route.
+
+        Raises:
+            (ValueError): If the lifecycle or the maximum size of the body is not
+                valid, or the dotted path of the view is not valid.
+        """
+        if max_body_size is not None and max_body_size < 0:
+            raise ValueError(
+                f"Maximum body size can't be negative, {max_body_size} given."
+            )
+
         self.path = path
-        self.view = view
         self.methods = methods or ["get", "head", "options"]
+        self.max_body_size = max_body_size
+        self.middleware: Tuple[Type["Middleware"], ...] = tuple(middleware or ())
+        self.exclude_middleware: Tuple[Type["Middleware"], ...] = tuple(
+            exclude_middleware or ()
+        )
+        self.middleware_pipelines: Dict[Any, Any] = {}
+        self._target = _ViewTarget(view, self.methods, lifecycle)
+
+    @property
+    def view(self) -> Union[BaseView, Callable]:
+        """The view of the route, imported if it's given as a dotted path."""
+        return self._target.load().view
+
+    @property
+    def lifecycle(self) -> str:
+        """The lifecycle of the instances of the class-based view."""
+        return self._target.load().lifecycle
+
+    @property
+    def handlers(self) -> Mapping[str, Callable]:
+        """The handlers by the upper-case names of the HTTP methods."""
+        return self._target.load().handlers
+
+    @property
+    def allowed_methods(self) -> FrozenSet[str]:
+        """The upper-case names of the supported HTTP methods."""
+        return self._target.load().allowed_methods
+
+    @property
+    def allow(self) -> str:
+        """The value of the `Allow` header for the route."""
+        return self._target.load().allow
+
+    @property
+    def reference(self) -> str:
+        """The dotted path of the view.
+
+        Raises:
+            (ValueError): If the view can't be referenced by its dotted path.
+        """
+        return self._target.reference or view_reference(self._target.view)
+
+    @property
+    def requested_lifecycle(self) -> Optional[str]:
+        """The lifecycle given for the route."""
+        return self._target.requested_lifecycle
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the view has been imported."""
+        return self._target.handlers is not None
+
+    def load(self) -> None:
+        """Import the view if it's given as a dotted path and it's not imported yet.
+
+        Raises:
+            (ImportError): If the module of the view can't be imported.
+            (AttributeError): If the module doesn't have the view.
+            (ValueError): If the lifecycle of the view is not supported.
+        """
+        self._target.load()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the route that can be pickled.
+
+        Handlers and instances of the view, and the compiled chains of middleware are
+        not pickled, they are created again when the route is unpickled. The view
+        itself is pickled by reference, and views given as dotted paths are not
+        imported.
+
+        Returns:
+            Dict[str, Any]: The state of the route.
+        """
+        state = self.__dict__.copy()
+        target = state.pop("_target")
+        del state["middleware_pipelines"]
+        state["_view"] = target.reference or target.view
+        state["_lifecycle"] = target.requested_lifecycle
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state of the unpickled route.
+
+        Arguments:
+            state (Dict[str, Any]): The state of the route.
+        """
+        state = state.copy()
+        view = state.pop("_view")
+        lifecycle = state.pop("_lifecycle")
+        self.__dict__.update(state)
+        self.middleware_pipelines = {}
+        self._target = _ViewTarget(view, self.methods, lifecycle)
+
+    def find_handler(self, method: Optional[str] = "GET") -> Optional[Callable]:
+        """Find handler for the given method.
+
+        Arguments:
+            method (str): Optional, the request method.
+
+        Returns:
+            Optional[Callable]: The handler or None if the method is not supported.
+        """
+        target = self._target
+        handlers = target.handlers
+        if handlers is None:
+            handlers = target.load().handlers
+
+        handler = handlers.get((method or "GET").upper())
+        if handler is None or not target.is_class_view:
+            return handler
+
+        return handler.__get__(  # pylint: disable=unnecessary-dunder-call
+            target.view_provider(), target.view
+        )
 
     def get_handler(self, method: Optional[str] = "get") -> Callable:
         """Get handler for the given method.
@@ -52,31 +438,24 @@ class Route:
             Callable: The handler.
 
         Raises:
-            (ValueError): If the method is not supported.
+            (NotImplementedError): If the method is not supported.
             (AttributeError): If the view is not a class or a function.
         """
-        method = (method or "get").lower()
+        target = self._target.load()
+        if not target.is_class_view and not callable(target.view):
+            raise AttributeError("View is not a class or a function.")
 
-        if isclass(self.view):
-            handler = getattr(self.view(), method, None)
-            if handler is None:
-                raise NotImplementedError(f"Method {method} is not allowed.")
+        handler = self.find_handler(method)
+        if handler is None:
+            raise NotImplementedError(f"Method {method} is not allowed.")
 
-            return handler
-
-        if callable(self.view):
-            if method not in self.methods:
-                raise NotImplementedError(f"Method {method} is not allowed.")
-
-            return self.view
-
-        raise AttributeError("View is not a class or a function.")
+        return handler
 
     def __str__(self) -> str:
-        return f"{self.path} -> {self.view}"
+        return f"{self.path} -> {self._target.reference or self._target.view}"
 
     def __repr__(self) -> str:
-        return f"{self.path} -> {self.view}"
+        return f"{self.path} -> {self._target.reference or self._target.view}"
 
 
 class ResolvedRoute(Route):
@@ -94,32 +473,51 @@ class ResolvedRoute(Route):
         params (Dict[str, Any]): Resolved parameters.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         path: str,
-        view: Union[BaseView, Callable],
+        view: Union[BaseView, Callable, str],
         methods: Optional[List[str]],
         params: Dict[str, Any],
+        lifecycle: Optional[str] = None,
+        max_body_size: Optional[int] = None,
+        middleware: Optional[Sequence[Type["Middleware"]]] = None,
+        exclude_middleware: Optional[Sequence[Type["Middleware"]]] = None,
     ):
-        super().__init__(path, view, methods)
+        super().__init__(
+            path,
+            view,
+            methods,
+            lifecycle,
+            max_body_size,
+            middleware,
+            exclude_middleware,
+        )
         self.params = params
 
     @staticmethod
     def from_route(route: Route, params: Dict[str, Any]) -> "ResolvedRoute":
         """Create a resolved route from a route and parameters.
 
+        The view and the handlers of the route, and the compiled chains of middleware
+        are shared with the resolved route instead of being found again, as it's done
+        for each request.
+
         Arguments:
             route (Route): The route.
             params (Dict[str, Any]): The parameters.
         """
-        return ResolvedRoute(route.path, route.view, route.methods, params)
+        resolved_route = ResolvedRoute.__new__(ResolvedRoute)
+        resolved_route.__dict__.update(route.__dict__)
+        resolved_route.params = params
+        return resolved_route
 
     def __str__(self) -> str:
         params_str = "&".join(f"{k}={v}" for k, v in self.params.items())
-        return f"{self.path} ? {params_str} -> {self.view}"
+        return f"{self.path} ? {params_str} -> {self._target.reference or self.view}"
 
     def __repr__(self) -> str:
-        return f"{self.path} ? {self.params} -> {self.view}"
+        return f"{self.path} ? {self.params} -> {self._target.reference or self.view}"
 
 
-__all__ = ["Route", "ResolvedRoute"]
+__all__ = ["HTTP_METHODS", "Route", "ResolvedRoute"]
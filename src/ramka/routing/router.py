@@ -1,13 +1,75 @@
+import pickle
+import warnings
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional, Union
-
-from parse import parse
-
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ramka.routing.patterns import is_static_path, pattern_key, unescape_path
 from ramka.routing.route import ResolvedRoute, Route
+from ramka.routing.snapshot import SNAPSHOT_VERSION, routes_hash
 from ramka.views import BaseView
 
+if TYPE_CHECKING:
+    from ramka.middleware import Middleware
+
+RouterCacheInfo = namedtuple(
+    "RouterCacheInfo", ["hits", "misses", "evictions", "max_size", "current_size"]
+)
+
+RouterStats = namedtuple("RouterStats", ["hits", "match_costs", "scan_order"])
+
+_MISSING = object()
+
+
+class RouteTable(NamedTuple):
+    """Immutable snapshot of all routes of a router.
+
+    The table is never modified after it's created (apart from the index of routes
+    without parameters, which stores results of checks done while resolving paths).
+    Routers create a new table each time routes are added or removed and swap it in,
+    so paths can be resolved without locks while the routes are being changed.
+
+    Fields:
+        routes (Tuple[Route, ...]): The routes in the order they have been added.
+        orders (Dict[str, int]): The registration orders by the route paths.
+        keys (Dict[Tuple, Route]): The routes by their pattern keys.
+        static_routes (Dict[str, ResolvedRoute]): The routes without parameters by
+            their paths.
+        unverified_paths (Set[str]): The paths of routes without parameters that
+            can also be handled by routes with parameters added earlier.
+        dynamic (Any): The structure used by the router to resolve routes with
+            parameters.
+        has_dynamic_routes (bool): Whether there are routes with parameters.
+        next_order (int): The registration order of the next route.
+    """
+
+    routes: Tuple[Route, ...]
+    orders: Dict[str, int]
+    keys: Dict[Tuple, Route]
+    static_routes: Dict[str, ResolvedRoute]
+    unverified_paths: Set[str]
+    dynamic: Any
+    has_dynamic_routes: bool
+    next_order: int
 
-class BaseRouter(ABC):
+
+class BaseRouter(ABC):  # pylint: disable=too-many-instance-attributes
     """Base router class.
 
     The responsibility of the routes is to know how to handle given request.
@@ -19,20 +81,98 @@ class BaseRouter(ABC):
     or by using the `route` decorator. It is the case to allow developers adding routes
     in a preffered way.
 
+    This class implements the behavior that is shared by all routers: handling
+    trailing slashes, checking if a route exists, and the `route` decorator. It also
+    keeps routes without parameters (e.g. `/health/`) in a dictionary, so they are
+    resolved with a single lookup. Routes with parameters are handled by subclasses
+    that need to implement `_extend_dynamic` and `_resolve_dynamic` methods.
+
+    All routes are kept in an immutable table (see `RouteTable`). Adding or removing
+    routes builds a new table that is swapped in at once, so paths can be resolved
+    by other threads without locks and they always see either the old or the new
+    routes. Changes of the routes are serialized with a lock. Added routes are kept
+    aside until the routes are used (e.g. a path is resolved), and then they are
+    all added to a new table at once, so adding routes one by one (e.g. with the
+    `route` decorator) doesn't build a table for each of them.
+
+    Results of resolving routes with parameters can be cached. The cache is disabled
+    by default and can be enabled by setting `cache_size` (e.g. using `router_kwargs`
+    in the application). When the cache is full, the least recently used path is
+    removed from it. Paths that can't be resolved are cached as well, and the whole
+    cache is cleared when a route is added or removed.
+
+    Routers can be saved to a snapshot file and loaded from it, so routes don't need to
+    be validated and compiled again each time the application starts.
+
     Fields:
-        routes (List[Route]): The list of routes that have been defined in the
+        routes (Tuple[Route, ...]): The routes that have been defined in the
             application.
     """
 
-    def __init__(self) -> None:
-        self.routes: List[Route] = []
+    def __init__(
+        self, force_trailing_slashes: bool = True, cache_size: Optional[int] = None
+    ) -> None:
+        """Initialize the router.
+
+        Arguments:
+            force_trailing_slashes (bool): Whether trailing slashes should be added to
+                the paths that don't have them.
+            cache_size (Optional[int]): The maximum number of resolved paths to cache.
+                The cache is disabled if it's not set.
 
-    @abstractmethod
-    def add_route(
+        Raises:
+            (ValueError): If the cache size is not a positive number.
+        """
+        if cache_size is not None and cache_size < 1:
+            raise ValueError("Cache size must be a positive number.")
+
+        self._force_trailing_slashes = force_trailing_slashes
+        self._table = RouteTable((), {}, {}, {}, set(), None, False, 0)
+        self._pending_routes: List[Route] = []
+        self._pending_keys: Dict[Tuple, Route] = {}
+        self._write_lock = Lock()
+
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, Optional[ResolvedRoute]]" = OrderedDict()
+        self._cache_lock = Lock()
+        self._cache_version = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
+    def _handle_trailing_slashes(self, path: str) -> str:
+        """Handle trailing slashes.
+
+        If the router is configured to force trailing slashes, the path is updated to
+        have trailing slash even if it doesn't have one.
+
+        Otherwise, the path is returned as is.
+
+        Arguments:
+            path (str): The path to handle.
+
+        Returns:
+            str: The path with trailing slash added if necessary.
+        """
+        if self._force_trailing_slashes and not path.endswith("/"):
+            return f"{path}/"
+
+        return path
+
+    @property
+    def routes(self) -> Tuple[Route, ...]:
+        """The routes in the order they have been added."""
+        return self._current_table().routes
+
+    def add_route(  # pylint: disable=too-many-arguments
         self,
         path: str,
-        view: Union[BaseView, Callable],
+        view: Union[BaseView, Callable, str],
         methods: Optional[List[str]] = None,
+        lifecycle: Optional[str] = None,
+        max_body_size: Optional[int] = None,
+        middleware: Optional[Sequence[Type["Middleware"]]] = None,
+        exclude_middleware: Optional[Sequence[Type["Middleware"]]] = None,
     ) -> None:
         """Add a route to the router.
 
@@ -40,12 +180,279 @@ class BaseRouter(ABC):
 
         Arguments:
             path (str): The path to add the route to.
-            view (Union[BaseView, Callable]): The view to add the route to.
+            view (Union[BaseView, Callable, str]): The view to add the route to or its
+                dotted path (e.g. `billing.views:InvoiceView`), imported when the route
+                is used for the first time.
             methods (Optional[List[str]]): The list of methods to add the route to.
+            lifecycle (Optional[str]): The lifecycle of the instances of the
+                class-based view (see `ramka.views.VIEW_LIFECYCLES`).
+            max_body_size (Optional[int]): The maximum size of the request body in
+                bytes, overriding the limit of the application.
+            middleware (Optional[Sequence[Type[Middleware]]]): The middleware classes
+                to add to the route.
+            exclude_middleware (Optional[Sequence[Type[Middleware]]]): The middleware
+                classes of the application that should not be used for the route.
+
+        Raises:
+            (AttributeError): If a route with the same path is already defined.
         """
+        self.add_routes(
+            [
+                (
+                    path,
+                    view,
+                    methods,
+                    lifecycle,
+                    max_body_size,
+                    middleware,
+                    exclude_middleware,
+                )
+            ]
+        )
+
+    def add_routes(self, routes: Iterable[Union[Sequence, Mapping]]) -> None:
+        """Add multiple routes to the router.
+
+        Each item is either a tuple of arguments of the `add_route` method (e.g.
+        `("/users/", UsersView)`) or a dictionary of its keyword arguments. All routes
+        are validated before any of them is added, so either all routes are added or
+        none of them.
+
+        Routes are compared using their patterns, so paths that differ only in names
+        of the parameters (e.g. `/users/{id}/` and `/users/{name}/`) are considered the
+        same. Routes with different patterns that match the same paths can be added,
+        and the one that has been added first is used for those paths.
 
-    @abstractmethod
-    def route(self, path: str, methods: Optional[List[str]] = None) -> Callable:
+        Arguments:
+            routes (Iterable[Union[Sequence, Mapping]]): The routes to add.
+
+        Raises:
+            (AttributeError): If a route with the same path is already defined.
+        """
+        created_routes = self._create_routes(routes)
+
+        with self._write_lock:
+            table_keys = self._table.keys
+            pending_keys = self._pending_keys
+            new_keys: Dict[Tuple, Route] = {}
+            for route in created_routes:
+                key = pattern_key(route.path)
+                if key in table_keys or key in pending_keys or key in new_keys:
+                    raise AttributeError(f"Route {route.path} already exists.")
+
+                new_keys[key] = route
+
+            pending_keys.update(new_keys)
+            self._pending_routes.extend(created_routes)
+
+        self.cache_clear()
+
+    def _current_table(self) -> RouteTable:
+        """Get the table of routes, with the routes added since it was built.
+
+        Returns:
+            RouteTable: The current table of routes.
+        """
+        if self._pending_routes:
+            with self._write_lock:
+                return self._publish_pending_routes()
+
+        return self._table
+
+    def _publish_pending_routes(self) -> RouteTable:
+        """Build a new table with the added routes and swap it in.
+
+        All routes added since the table was built are added at once. The write lock
+        needs to be held by the caller.
+
+        Returns:
+            RouteTable: The new table of routes.
+        """
+        table = self._table
+        new_routes = self._pending_routes
+        if not new_routes:
+            return table
+
+        keys = {**table.keys, **self._pending_keys}
+        orders = dict(table.orders)
+        for order, route in enumerate(new_routes, table.next_order):
+            orders[route.path] = order
+
+        static_routes = dict(table.static_routes)
+        unverified_paths = set(table.unverified_paths)
+        has_dynamic_routes = table.has_dynamic_routes
+        dynamic_routes = []
+        for route in new_routes:
+            if is_static_path(route.path):
+                path = unescape_path(route.path)
+                static_routes[path] = ResolvedRoute.from_route(route, {})
+                if has_dynamic_routes:
+                    unverified_paths.add(path)
+            else:
+                dynamic_routes.append((orders[route.path], route))
+                has_dynamic_routes = True
+
+        dynamic = table.dynamic
+        if dynamic_routes:
+            dynamic = self._extend_dynamic(dynamic, dynamic_routes)
+
+        table = self._table = RouteTable(
+            table.routes + tuple(new_routes),
+            orders,
+            keys,
+            static_routes,
+            unverified_paths,
+            dynamic,
+            has_dynamic_routes,
+            table.next_order + len(new_routes),
+        )
+        # The table is swapped in first, so threads that don't see pending routes
+        # always use the new table.
+        self._pending_routes = []
+        self._pending_keys = {}
+        return table
+
+    def remove_route(self, path: str) -> Route:
+        """Remove the route from the router.
+
+        The route is found using its pattern, so the names of the parameters in the
+        path don't need to match (e.g. `/users/{pk}/` removes the route `/users/{id}/`).
+
+        Arguments:
+            path (str): The path of the route to remove.
+
+        Returns:
+            Route: The removed route.
+
+        Raises:
+            (AttributeError): If there is no route with the path.
+        """
+        key = pattern_key(self._handle_trailing_slashes(path))
+
+        with self._write_lock:
+            table = self._publish_pending_routes()
+            route = table.keys.get(key)
+            if route is None:
+                raise AttributeError(f"Route {path} doesn't exist.")
+
+            keys = dict(table.keys)
+            del keys[key]
+            orders = dict(table.orders)
+            del orders[route.path]
+            routes = tuple(item for item in table.routes if item is not route)
+
+            dynamic = table.dynamic
+            if not is_static_path(route.path):
+                dynamic = self._extend_dynamic(
+                    None,
+                    [
+                        (orders[item.path], item)
+                        for item in routes
+                        if not is_static_path(item.path)
+                    ],
+                )
+
+            self._table = self._build_static_index(
+                table._replace(routes=routes, orders=orders, keys=keys, dynamic=dynamic)
+            )
+
+        self.cache_clear()
+        return route
+
+    @staticmethod
+    def _build_static_index(table: RouteTable) -> RouteTable:
+        """Build the index of routes without parameters from scratch.
+
+        Arguments:
+            table (RouteTable): The table with the routes.
+
+        Returns:
+            RouteTable: The table with the new index.
+        """
+        static_routes = {}
+        unverified_paths = set()
+        has_dynamic_routes = False
+        for route in table.routes:
+            if is_static_path(route.path):
+                path = unescape_path(route.path)
+                static_routes[path] = ResolvedRoute.from_route(route, {})
+                if has_dynamic_routes:
+                    unverified_paths.add(path)
+            else:
+                has_dynamic_routes = True
+
+        return table._replace(
+            static_routes=static_routes,
+            unverified_paths=unverified_paths,
+            has_dynamic_routes=has_dynamic_routes,
+        )
+
+    def _create_routes(self, routes: Iterable[Union[Sequence, Mapping]]) -> List[Route]:
+        """Create routes from the arguments of the `add_route` method.
+
+        Arguments:
+            routes (Iterable[Union[Sequence, Mapping]]): The tuples of arguments or
+                the dictionaries of keyword arguments.
+
+        Returns:
+            List[Route]: The created routes.
+        """
+        return [
+            (
+                self._create_route(**arguments)
+                if isinstance(arguments, Mapping)
+                else self._create_route(*arguments)
+            )
+            for arguments in routes
+        ]
+
+    def _create_route(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        view: Union[BaseView, Callable, str],
+        methods: Optional[List[str]] = None,
+        lifecycle: Optional[str] = None,
+        max_body_size: Optional[int] = None,
+        middleware: Optional[Sequence[Type["Middleware"]]] = None,
+        exclude_middleware: Optional[Sequence[Type["Middleware"]]] = None,
+    ) -> Route:
+        """Create a route with trailing slashes handled in its path.
+
+        Arguments:
+            path (str): The path of the route.
+            view (Union[BaseView, Callable, str]): The view of the route or its dotted
+                path.
+            methods (Optional[List[str]]): The list of methods of the route.
+            lifecycle (Optional[str]): The lifecycle of the instances of the
+                class-based view.
+            max_body_size (Optional[int]): The maximum size of the request body.
+            middleware (Optional[Sequence[Type[Middleware]]]): The middleware classes
+                added to the route.
+            exclude_middleware (Optional[Sequence[Type[Middleware]]]): The middleware
+                classes excluded from the route.
+
+        Returns:
+            Route: The created route.
+        """
+        return Route(
+            self._handle_trailing_slashes(path),
+            view,
+            methods,
+            lifecycle,
+            max_body_size,
+            middleware,
+            exclude_middleware,
+        )
+
+    def route(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        methods: Optional[List[str]] = None,
+        lifecycle: Optional[str] = None,
+        max_body_size: Optional[int] = None,
+        middleware: Optional[Sequence[Type["Middleware"]]] = None,
+        exclude_middleware: Optional[Sequence[Type["Middleware"]]] = None,
+    ) -> Callable:
         """Add a route to the router.
 
         It's supposed to be used as a decorator.
@@ -53,86 +460,287 @@ class BaseRouter(ABC):
         Arguments:
             path (str): The path to add the route to.
             methods (Optional[List[str]]): The list of methods to add the route to.
+            lifecycle (Optional[str]): The lifecycle of the instances of the
+                class-based view (see `ramka.views.VIEW_LIFECYCLES`).
+            max_body_size (Optional[int]): The maximum size of the request body in
+                bytes, overriding the limit of the application.
+            middleware (Optional[Sequence[Type[Middleware]]]): The middleware classes
+                to add to the route.
+            exclude_middleware (Optional[Sequence[Type[Middleware]]]): The middleware
+                classes of the application that should not be used for the route.
+
+        Returns:
+            Callable: The decorated function.
         """
 
-    @abstractmethod
+        def wrapper(view: Union[BaseView, Callable]):
+            self.add_route(
+                path,
+                view,
+                methods,
+                lifecycle,
+                max_body_size,
+                middleware,
+                exclude_middleware,
+            )
+            return view
+
+        return wrapper
+
     def resolve(self, path: str) -> ResolvedRoute:
         """Resolve the route for the given path.
 
+        Routes without parameters are checked first, using a single dictionary lookup.
+        If such a route has been added after a route with parameters, the first lookup
+        of its path also checks if the path is not handled by a route that has been
+        added earlier.
+
         Arguments:
             path (str): The path to resolve the route for.
 
         Returns:
             ResolvedRoute: The resolved route.
         """
+        path = self._handle_trailing_slashes(path)
+        table = self._current_table()
 
-    @abstractmethod
-    def has_route(self, path: str) -> bool:
-        """Check if the router has a route for the given path.
+        resolved_route = table.static_routes.get(path)
+        if resolved_route is not None:
+            if path in table.unverified_paths:
+                return self._verify_static_route(table, path, resolved_route)
+
+            return resolved_route
+
+        if self._cache_size is None:
+            return self._resolve_dynamic(table.dynamic, path)
+
+        return self._resolve_cached(path)
+
+    def _verify_static_route(
+        self, table: RouteTable, path: str, resolved_route: ResolvedRoute
+    ) -> ResolvedRoute:
+        """Check if the path of a route without parameters is handled by an older route.
+
+        The result is stored in the index of routes without parameters, so the check
+        is done only once for each path.
 
         Arguments:
-            path (str): The path to check.
+            table (RouteTable): The table of routes used to resolve the path.
+            path (str): The path of the route.
+            resolved_route (ResolvedRoute): The route without parameters.
 
         Returns:
-            bool: True if the router has a route for the given path, False otherwise.
+            ResolvedRoute: The route that should be used for the path.
         """
+        dynamic_route = self._resolve_dynamic(table.dynamic, path)
+        if dynamic_route is not None and (
+            table.orders[dynamic_route.path] < table.orders[resolved_route.path]
+        ):
+            resolved_route = dynamic_route
 
+        table.static_routes[path] = resolved_route
+        table.unverified_paths.discard(path)
+        return resolved_route
 
-class SimpleRouter(BaseRouter):
-    """Simple router class.
+    def _resolve_cached(self, path: str) -> Optional[ResolvedRoute]:
+        """Resolve the route with parameters using the cache.
 
-    The responsibility of the routes is to know how to handle given request.
+        The lock is not held while the path is resolved, so a slow lookup doesn't block
+        other threads. The result is not cached if routes have been changed in the
+        meantime. The table of routes is read after the version of the cache, so
+        results from outdated tables are never cached.
 
-    Router, on the other hand, is responsible for storing all routes that have been
-    defined in the application and finding correct routes for the requests.
+        Arguments:
+            path (str): The path to resolve the route for, with trailing slashes
+                already handled.
 
-    This router can resolve routes with or without trailing slashes (that behavior can
-    be disabled).
+        Returns:
+            Optional[ResolvedRoute]: The resolved route or None if there is no route
+                for the given path.
+        """
+        with self._cache_lock:
+            resolved_route = self._cache.get(path, _MISSING)
+            if resolved_route is not _MISSING:
+                self._cache.move_to_end(path)
+                self._cache_hits += 1
+                return resolved_route
 
-    Fields:
-        routes (List[Route]): The list of routes that have been defined in the
-            application.
-    """
+            self._cache_misses += 1
+            version = self._cache_version
 
-    def __init__(self, force_trailing_slashes: bool = True):
-        super().__init__()
-        self._force_trailing_slashes = force_trailing_slashes
+        resolved_route = self._resolve_dynamic(self._table.dynamic, path)
 
-    def _handle_trailing_slashes(self, path: str) -> str:
-        """Handle trailing slashes.
+        with self._cache_lock:
+            if version == self._cache_version:
+                self._cache[path] = resolved_route
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+                    self._cache_evictions += 1
 
-        If the router is configured to force trailing slashes, the path is updated to
-        have trailing slash even if it doesn't have one.
+        return resolved_route
 
-        Otherwise, the path is returned as is.
+    def cache_info(self) -> RouterCacheInfo:
+        """Get the statistics of the resolution cache.
+
+        Returns:
+            RouterCacheInfo: The number of cache hits, misses and evictions, the maximum
+                and the current size of the cache.
+        """
+        with self._cache_lock:
+            return RouterCacheInfo(
+                self._cache_hits,
+                self._cache_misses,
+                self._cache_evictions,
+                self._cache_size,
+                len(self._cache),
+            )
+
+    def cache_clear(self) -> None:
+        """Remove all resolved paths from the cache.
+
+        The statistics are not reset.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_version += 1
+
+    def routes_hash(
+        self, routes: Optional[Iterable[Union[Sequence, Mapping]]] = None
+    ) -> str:
+        """Calculate the hash of the route definitions.
 
         Arguments:
-            path (str): The path to handle.
+            routes (Optional[Iterable[Union[Sequence, Mapping]]]): The routes in the
+                format accepted by the `add_routes` method. If they are not given,
+                the routes of the router are used.
 
         Returns:
-            str: The path with trailing slash added if necessary.
+            str: The hash of the route definitions.
         """
-        if self._force_trailing_slashes and not path.endswith("/"):
-            return f"{path}/"
+        if routes is None:
+            return routes_hash(self.routes)
 
-        return path
+        return routes_hash(self._create_routes(routes))
 
-    def resolve(self, path: str) -> ResolvedRoute:
-        """Resolve the route for the given path.
+    def save_snapshot(self, file_path: str) -> str:
+        """Save the router with all its routes to a snapshot file.
+
+        Views and converters are saved as references (their modules and names), so
+        they need to be defined on the module level.
 
         Arguments:
-            path (str): The path to resolve the route for.
+            file_path (str): The path of the snapshot file.
 
         Returns:
-            ResolvedRoute: The resolved route.
+            str: The hash of the route definitions, stored in the snapshot.
         """
-        path = self._handle_trailing_slashes(path)
-        for route in self.routes:
-            parsed_path = parse(route.path, path)
-            if parsed_path:
-                return ResolvedRoute.from_route(route, parsed_path.named)
+        definitions_hash = self.routes_hash()
+        with open(file_path, "wb") as snapshot_file:
+            pickle.dump(
+                {"version": SNAPSHOT_VERSION, "hash": definitions_hash, "router": self},
+                snapshot_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+        return definitions_hash
+
+    @classmethod
+    def load_snapshot(
+        cls,
+        file_path: str,
+        routes: Optional[Iterable[Union[Sequence, Mapping]]] = None,
+    ) -> "BaseRouter":
+        """Load the router from a snapshot file.
+
+        Routes are not validated and their paths are not compiled again. Snapshots are
+        loaded with `pickle`, so only snapshots from trusted sources should be loaded.
+
+        Arguments:
+            file_path (str): The path of the snapshot file.
+            routes (Optional[Iterable[Union[Sequence, Mapping]]]): The current route
+                definitions, in the format accepted by the `add_routes` method. The
+                snapshot is loaded only if it has been saved for the same definitions.
+                If they are not given, it can't be checked if the snapshot is stale,
+                and a warning is issued.
+
+        Returns:
+            BaseRouter: The loaded router.
+
+        Raises:
+            (ValueError): If the snapshot is not valid or it's stale.
+        """
+        with open(file_path, "rb") as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("version") != SNAPSHOT_VERSION
+        ):
+            raise ValueError(f"File {file_path} is not a valid routes snapshot.")
+
+        router = snapshot["router"]
+        if not isinstance(router, cls):
+            raise ValueError(f"Snapshot {file_path} doesn't contain {cls.__name__}.")
+
+        if routes is None:
+            message = f"Snapshot {file_path} is loaded without route definitions."
+            warnings.warn(f"{message} It can't be checked if it's stale.", stacklevel=2)
+        elif router.routes_hash(routes) != snapshot["hash"]:
+            raise ValueError(f"Snapshot {file_path} is stale.")
+
+        return router
 
-        return None
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the router that can be pickled.
+
+        The cache, the locks and the index of routes without parameters are not
+        pickled, they are created again when the router is unpickled.
+
+        Returns:
+            Dict[str, Any]: The state of the router.
+        """
+        table = self._current_table()
+        state = self.__dict__.copy()
+        for name in (
+            "_cache",
+            "_cache_lock",
+            "_write_lock",
+            "_pending_routes",
+            "_pending_keys",
+        ):
+            del state[name]
+
+        state["_table"] = table._replace(static_routes={}, unverified_paths=set())
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state of the unpickled router.
+
+        Arguments:
+            state (Dict[str, Any]): The state of the router.
+        """
+        self.__dict__.update(state)
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
+        self._cache_version = self._cache_hits = self._cache_misses = 0
+        self._cache_evictions = 0
+        self._write_lock = Lock()
+        self._pending_routes = []
+        self._pending_keys = {}
+        self._table = self._build_static_index(self._table)
+
+    def preload_views(self) -> None:
+        """Import all views given as dotted paths.
+
+        It can be used to import the views before the application is forked into
+        worker processes, so they don't need to be imported by each worker.
+
+        Raises:
+            (ImportError): If the module of a view can't be imported.
+            (AttributeError): If the module doesn't have the view.
+        """
+        for route in self.routes:
+            route.load()
 
     def has_route(self, path: str) -> bool:
         """Check if the router has a route for the given path.
@@ -145,44 +753,44 @@ class SimpleRouter(BaseRouter):
         """
         return self.resolve(path) is not None
 
-    def add_route(
-        self,
-        path: str,
-        view: Union[BaseView, Callable],
-        methods: Optional[List[str]] = None,
-    ) -> None:
-        """Add a route to the router.
+    @abstractmethod
+    def _extend_dynamic(
+        self, dynamic: Optional[Any], routes: Sequence[Tuple[int, Route]]
+    ) -> Any:
+        """Build the structure used to resolve routes with parameters.
 
-        It's supposed to be used as a method.
+        The routes are already validated when this method is called. The given
+        structure can be still used by other threads, so it can't be modified.
 
         Arguments:
-            path (str): The path to add the route to.
-            view (Union[BaseView, Callable]): The view to add the route to.
-            methods (Optional[List[str]]): The list of methods to add the route to.
-        """
-        if self.has_route(path):
-            raise AttributeError("Route already exists.")
-
-        self.routes.append(Route(self._handle_trailing_slashes(path), view, methods))
+            dynamic (Optional[Any]): The structure with the routes added earlier or
+                None if the structure should be built from scratch.
+            routes (Sequence[Tuple[int, Route]]): The registration orders and the
+                routes to add, in the order they have been added.
 
-    def route(self, path: str, methods: Optional[List[str]] = None) -> Callable:
-        """Add a route to the router.
+        Returns:
+            Any: The new structure with all the routes.
+        """
 
-        It's supposed to be used as a decorator.
+    @abstractmethod
+    def _resolve_dynamic(self, dynamic: Any, path: str) -> Optional[ResolvedRoute]:
+        """Resolve the route with parameters for the given path.
 
         Arguments:
-            path (str): The path to add the route to.
-            methods (Optional[List[str]]): The list of methods to add the route to.
+            dynamic (Any): The structure built by the `_extend_dynamic` method or None
+                if there are no routes with parameters.
+            path (str): The path to resolve the route for, with trailing slashes
+                already handled.
 
         Returns:
-            Callable: The decorated function.
+            Optional[ResolvedRoute]: The resolved route or None if there is no route
+                for the given path.
         """
 
-        def wrapper(view: Union[BaseView, Callable]):
-            self.add_route(path, view, methods)
-            return view
-
-        return wrapper
-
 
-__all__ = ["BaseRouter", "SimpleRouter"]
+__all__ = [
+    "BaseRouter",
+    "RouteTable",
+    "RouterCacheInfo",
+    "RouterStats",
+]
@@ -0,0 +1,265 @@
+from collections import OrderedDict
+from threading import Thread
+from typing import Dict, Optional, Sequence, Tuple
+
+from ramka.routing.patterns import PathPattern, patterns_can_overlap
+from ramka.routing.route import ResolvedRoute, Route
+from ramka.routing.router import BaseRouter, RouterStats
+
+# The maximum number of stored results of comparing patterns of routes.
+_MAX_OVERLAPS = 10000
+
+
+class SimpleRouter(BaseRouter):  # pylint: disable=too-many-instance-attributes
+    """Simple router class.
+
+    The responsibility of the routes is to know how to handle given request.
+
+    Router, on the other hand, is responsible for storing all routes that have been
+    defined in the application and finding correct routes for the requests.
+
+    This router can resolve routes with or without trailing slashes (that behavior can
+    be disabled). Routes with parameters are checked one by one, in the order they
+    have been added.
+
+    The router can collect statistics of resolving routes with parameters: the number
+    of hits of each route and the histogram of match costs (the number of routes
+    checked to resolve a path). In the adaptive mode, enabled with `reorder_interval`,
+    routes with more hits are periodically moved earlier in the order in which they are
+    checked. A route is never moved before a route that can match the same path, so
+    paths are always resolved to the same routes as without reordering. Routes are
+    reordered in a background thread, so requests are not delayed by it.
+
+    Fields:
+        routes (Tuple[Route, ...]): The routes that have been defined in the
+            application.
+    """
+
+    def __init__(
+        self,
+        force_trailing_slashes: bool = True,
+        cache_size: Optional[int] = None,
+        collect_stats: bool = False,
+        reorder_interval: Optional[int] = None,
+    ):
+        """Initialize the router.
+
+        Arguments:
+            force_trailing_slashes (bool): Whether trailing slashes should be added to
+                the paths that don't have them.
+            cache_size (Optional[int]): The maximum number of resolved paths to cache.
+                The cache is disabled if it's not set.
+            collect_stats (bool): Whether statistics of resolving routes should be
+                collected.
+            reorder_interval (Optional[int]): The number of resolved paths after which
+                routes are reordered in a background thread. Routes are not reordered
+                automatically if it's not set. Statistics are always collected when
+                it's set.
+
+        Raises:
+            (ValueError): If the cache size or the reorder interval is not a positive
+                number.
+        """
+        if reorder_interval is not None and reorder_interval < 1:
+            raise ValueError("Reorder interval must be a positive number.")
+
+        super().__init__(force_trailing_slashes, cache_size)
+
+        self._collect_stats = collect_stats or reorder_interval is not None
+        self._reorder_interval = reorder_interval
+        self._resolutions = 0
+        self._hits: Dict[str, int] = {}
+        self._match_costs: Dict[int, int] = {}
+        self._overlaps: "OrderedDict[Tuple[str, str], bool]" = OrderedDict()
+
+    def _extend_dynamic(
+        self,
+        dynamic: Optional[Tuple[Tuple[Route, PathPattern], ...]],
+        routes: Sequence[Tuple[int, Route]],
+    ) -> Tuple[Tuple[Route, PathPattern], ...]:
+        """Add routes with parameters to the routes checked one by one.
+
+        The paths of the routes are compiled once, so they don't need to be compiled
+        each time a path is resolved.
+
+        Arguments:
+            dynamic (Optional[Tuple[Tuple[Route, PathPattern], ...]]): The routes
+                added earlier, together with their patterns.
+            routes (Sequence[Tuple[int, Route]]): The orders and the routes to add.
+
+        Returns:
+            Tuple[Tuple[Route, PathPattern], ...]: All routes with their patterns.
+        """
+        return (dynamic or ()) + tuple(
+            (route, PathPattern(route.path)) for _, route in routes
+        )
+
+    def _resolve_dynamic(
+        self, dynamic: Optional[Tuple[Tuple[Route, PathPattern], ...]], path: str
+    ) -> Optional[ResolvedRoute]:
+        """Resolve the route with parameters for the given path.
+
+        Arguments:
+            dynamic (Optional[Tuple[Tuple[Route, PathPattern], ...]]): The routes
+                with their patterns, in the order they are checked in.
+            path (str): The path to resolve the route for.
+
+        Returns:
+            Optional[ResolvedRoute]: The resolved route.
+        """
+        if self._collect_stats:
+            return self._resolve_dynamic_with_stats(dynamic or (), path)
+
+        for route, pattern in dynamic or ():
+            params = pattern.match(path)
+            if params is not None:
+                return ResolvedRoute.from_route(route, params)
+
+        return None
+
+    def _resolve_dynamic_with_stats(
+        self, dynamic: Tuple[Tuple[Route, PathPattern], ...], path: str
+    ) -> Optional[ResolvedRoute]:
+        """Resolve the route with parameters and update the statistics.
+
+        The statistics are not updated under a lock, so they can be slightly off when
+        paths are resolved by multiple threads at the same time.
+
+        Arguments:
+            dynamic (Tuple[Tuple[Route, PathPattern], ...]): The routes with their
+                patterns, in the order they are checked in.
+            path (str): The path to resolve the route for.
+
+        Returns:
+            Optional[ResolvedRoute]: The resolved route.
+        """
+        resolved_route = None
+        cost = 0
+        for route, pattern in dynamic:
+            cost += 1
+            params = pattern.match(path)
+            if params is not None:
+                resolved_route = ResolvedRoute.from_route(route, params)
+                self._hits[route.path] = self._hits.get(route.path, 0) + 1
+                break
+
+        self._match_costs[cost] = self._match_costs.get(cost, 0) + 1
+        self._resolutions += 1
+        if self._reorder_interval and self._resolutions % self._reorder_interval == 0:
+            Thread(target=self.reorder_routes, daemon=True).start()
+
+        return resolved_route
+
+    def remove_route(self, path: str) -> Route:
+        """Remove the route from the router.
+
+        Stored results of comparing the pattern of the route with other patterns are
+        removed as well, so they don't pile up when routes are changed.
+
+        Arguments:
+            path (str): The path of the route to remove.
+
+        Returns:
+            Route: The removed route.
+
+        Raises:
+            (AttributeError): If there is no route with the path.
+        """
+        route = super().remove_route(path)
+
+        with self._write_lock:
+            self._overlaps = OrderedDict(
+                (key, result)
+                for key, result in self._overlaps.items()
+                if route.path not in key
+            )
+
+        return route
+
+    def _can_overlap(self, first: PathPattern, second: PathPattern) -> bool:
+        """Check if there can be a path that matches both patterns.
+
+        Results are stored, so pairs of patterns are not compared again each time
+        routes are reordered. The number of stored results is limited, the oldest
+        results are removed first.
+
+        Arguments:
+            first (PathPattern): The first pattern.
+            second (PathPattern): The second pattern.
+
+        Returns:
+            bool: False if no path can match both patterns, True otherwise.
+        """
+        key = (first.path, second.path)
+        result = self._overlaps.get(key)
+        if result is None:
+            result = self._overlaps[key] = patterns_can_overlap(first, second)
+            if len(self._overlaps) > _MAX_OVERLAPS:
+                self._overlaps.popitem(last=False)
+
+        return result
+
+    def reorder_routes(self) -> None:
+        """Move routes with more hits earlier in the order they are checked in.
+
+        A route is moved only before routes that have less hits and can't match any
+        path that the route matches, so paths are resolved to the same routes as
+        before. The new order is built on a copy of the routes and then swapped in,
+        so paths can be resolved at the same time. If the routes are being changed or
+        reordered by another thread, nothing is done.
+        """
+        acquired = self._write_lock.acquire(  # pylint: disable=consider-using-with
+            blocking=False
+        )
+        if not acquired:
+            return
+
+        try:
+            hits = self._hits
+            table = self._publish_pending_routes()
+            dynamic_routes = list(table.dynamic or ())
+            for index in range(1, len(dynamic_routes)):
+                position = index
+                route, pattern = dynamic_routes[index]
+                route_hits = hits.get(route.path, 0)
+                while position > 0:
+                    previous_route, previous_pattern = dynamic_routes[position - 1]
+                    if hits.get(previous_route.path, 0) >= route_hits or (
+                        self._can_overlap(previous_pattern, pattern)
+                    ):
+                        break
+
+                    dynamic_routes[position] = dynamic_routes[position - 1]
+                    position -= 1
+
+                dynamic_routes[position] = (route, pattern)
+
+            self._table = table._replace(dynamic=tuple(dynamic_routes))
+        finally:
+            self._write_lock.release()
+
+    def route_stats(self) -> RouterStats:
+        """Get the statistics of resolving routes with parameters.
+
+        Returns:
+            RouterStats: The number of hits by route paths, the number of resolved paths
+                by the number of routes checked to resolve them, and the paths of the
+                routes with parameters in the order they are checked in.
+        """
+        return RouterStats(
+            dict(self._hits),
+            dict(sorted(self._match_costs.items())),
+            [route.path for route, _ in self._current_table().dynamic or ()],
+        )
+
+    def reset_stats(self) -> None:
+        """Reset the statistics of resolving routes.
+
+        The order in which routes are checked is not changed.
+        """
+        self._hits = {}
+        self._match_costs = {}
+        self._resolutions = 0
+
+
+__all__ = ["SimpleRouter"]
@@ -0,0 +1,42 @@
+import json
+from hashlib import sha256
+from typing import Iterable
+
+from ramka.routing.references import view_reference
+from ramka.routing.route import Route
+
+# The version of the format of the snapshots. Snapshots saved in other versions of the
+# format can't be loaded.
+SNAPSHOT_VERSION = 4
+
+
+def routes_hash(routes: Iterable[Route]) -> str:
+    """Calculate the hash of the route definitions.
+
+    The hash depends on the paths, views, methods, lifecycles, maximum body sizes and
+    middleware of the routes and on the order of the routes, so it changes whenever
+    the route definitions change. Views and middleware are compared using their dotted
+    paths, so views given as dotted paths are not imported.
+
+    Arguments:
+        routes (Iterable[Route]): The routes.
+
+    Returns:
+        str: The hexadecimal SHA-256 hash of the definitions.
+    """
+    definitions = [
+        [
+            route.path,
+            route.reference,
+            route.methods,
+            route.requested_lifecycle,
+            route.max_body_size,
+            [view_reference(middleware) for middleware in route.middleware],
+            [view_reference(middleware) for middleware in route.exclude_middleware],
+        ]
+        for route in routes
+    ]
+    return sha256(json.dumps(definitions).encode("utf-8")).hexdigest()
+
+
+__all__ = ["SNAPSHOT_VERSION", "routes_hash"]
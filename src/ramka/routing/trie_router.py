@@ -0,0 +1,253 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ramka.routing.patterns import PathPattern, is_static_path, unescape_path
+from ramka.routing.route import ResolvedRoute, Route
+from ramka.routing.router import BaseRouter
+
+
+def _is_better(order: int, best_order: Optional[int]) -> bool:
+    """Check if the registration order is better than the best one found so far.
+
+    Arguments:
+        order (int): The registration order to check.
+        best_order (Optional[int]): The best registration order found so far.
+
+    Returns:
+        bool: True if the order is lower than the best one, False otherwise.
+    """
+    return best_order is None or order < best_order
+
+
+class _TrieNode:  # pylint: disable=too-few-public-methods
+    """A single node of the routes trie.
+
+    Each node represents one segment of the path. Static children are stored in
+    a dictionary so they can be found with a single lookup, dynamic children (segments
+    with parameters) are stored in a list, in the order they have been added.
+
+    Fields:
+        static (Dict[str, _TrieNode]): Static children of the node.
+        dynamic (List[Tuple[str, PathPattern, _TrieNode]]): Dynamic children of the
+            node together with the formats of their segments and the compiled
+            patterns.
+        route (Optional[Route]): The route that ends in this node.
+        order (Optional[int]): The registration order of the route.
+        min_order (Optional[int]): The lowest registration order of all routes in
+            the subtree of this node.
+    """
+
+    __slots__ = ("static", "dynamic", "route", "order", "min_order")
+
+    def __init__(self) -> None:
+        self.static: Dict[str, "_TrieNode"] = {}
+        self.dynamic: List[Tuple[str, PathPattern, "_TrieNode"]] = []
+        self.route: Optional[Route] = None
+        self.order: Optional[int] = None
+        self.min_order: Optional[int] = None
+
+    def copy(self) -> "_TrieNode":
+        """Create a copy of the node that shares the children with the node.
+
+        Returns:
+            _TrieNode: The copy of the node.
+        """
+        node = _TrieNode()
+        node.static = dict(self.static)
+        node.dynamic = list(self.dynamic)
+        node.route = self.route
+        node.order = self.order
+        node.min_order = self.min_order
+        return node
+
+
+class TrieRouter(BaseRouter):
+    """Trie router class.
+
+    This router compiles the routes with parameters into a trie of path segments.
+    Static segments are stored in dictionaries and segments with parameters (e.g.
+    `{id:int}` or `{name}`) are compiled once, when the route is added. Because of
+    that, the cost of resolving a path depends on the depth of the path and not on the
+    number of routes.
+
+    Routes with parameters that can span multiple path segments (e.g. `{rest:path}`)
+    can't be split into segments, so they are checked one by one, in the order they
+    have been added, as in `SimpleRouter`.
+
+    When more than one route matches the path, the route that has been added first
+    is used, the same as in other routers.
+
+    The trie is never changed after it's built. Adding a route copies only the nodes
+    on the path of the route and shares all other nodes with the previous trie.
+
+    Fields:
+        routes (Tuple[Route, ...]): The routes that have been defined in the
+            application.
+    """
+
+    @staticmethod
+    def _insert(root: _TrieNode, route: Route, order: int) -> _TrieNode:
+        """Insert the route into a copy of the trie.
+
+        Arguments:
+            root (_TrieNode): The root of the trie.
+            route (Route): The route to insert.
+            order (int): The registration order of the route.
+
+        Returns:
+            _TrieNode: The root of the new trie.
+        """
+        root = node = root.copy()
+        node.min_order = order if node.min_order is None else node.min_order
+
+        for segment in route.path.split("/"):
+            if not is_static_path(segment):
+                index = next(
+                    (
+                        index
+                        for index, (fmt, _, _) in enumerate(node.dynamic)
+                        if fmt == segment
+                    ),
+                    None,
+                )
+                if index is None:
+                    child = _TrieNode()
+                    node.dynamic.append((segment, PathPattern(segment), child))
+                else:
+                    fmt, pattern, child = node.dynamic[index]
+                    child = child.copy()
+                    node.dynamic[index] = (fmt, pattern, child)
+            else:
+                key = unescape_path(segment)
+                child = node.static.get(key)
+                child = _TrieNode() if child is None else child.copy()
+                node.static[key] = child
+
+            node = child
+            node.min_order = order if node.min_order is None else node.min_order
+
+        node.route = route
+        node.order = order
+        return root
+
+    def _search(
+        self,
+        node: _TrieNode,
+        segments: List[str],
+        position: int,
+        best_order: Optional[int],
+    ) -> Optional[Tuple[int, Route, Dict[str, Any]]]:
+        """Find the route with the lowest registration order matching the segments.
+
+        Branches that only contain routes added after the best match found so far are
+        skipped.
+
+        Arguments:
+            node (_TrieNode): The node to start searching from.
+            segments (List[str]): The segments of the path.
+            position (int): The position of the current segment.
+            best_order (Optional[int]): The registration order of the best match
+                found so far.
+
+        Returns:
+            Optional[Tuple[int, Route, Dict[str, Any]]]: The registration order, the
+                route and the parameters, or None if there is no better match.
+        """
+        if position == len(segments):
+            if node.route is None or not _is_better(node.order, best_order):
+                return None
+
+            return node.order, node.route, {}
+
+        segment = segments[position]
+        best = None
+
+        child = node.static.get(segment)
+        if child is not None and _is_better(child.min_order, best_order):
+            best = self._search(child, segments, position + 1, best_order)
+            if best is not None:
+                best_order = best[0]
+
+        for _, pattern, child in node.dynamic:
+            if not _is_better(child.min_order, best_order):
+                continue
+
+            params = pattern.match(segment)
+            if params is None:
+                continue
+
+            result = self._search(child, segments, position + 1, best_order)
+            if result is not None:
+                best = result[0], result[1], {**params, **result[2]}
+                best_order = best[0]
+
+        return best
+
+    def _extend_dynamic(
+        self,
+        dynamic: Optional[Tuple[_TrieNode, Tuple[Tuple[int, Route, PathPattern], ...]]],
+        routes: Sequence[Tuple[int, Route]],
+    ) -> Tuple[_TrieNode, Tuple[Tuple[int, Route, PathPattern], ...]]:
+        """Add routes with parameters to the trie.
+
+        Routes with parameters that can span multiple path segments are stored
+        separately.
+
+        Arguments:
+            dynamic (Optional[Tuple[_TrieNode, Tuple[...]]]): The root of the trie
+                and the multi-segment routes added earlier.
+            routes (Sequence[Tuple[int, Route]]): The orders and the routes to add.
+
+        Returns:
+            Tuple[_TrieNode, Tuple[...]]: The root of the new trie and all
+                multi-segment routes with their orders and patterns.
+        """
+        root, multi_segment_routes = dynamic or (_TrieNode(), ())
+        new_multi_segment_routes = []
+        for order, route in routes:
+            pattern = PathPattern(route.path)
+            if pattern.multi_segment:
+                new_multi_segment_routes.append((order, route, pattern))
+            else:
+                root = self._insert(root, route, order)
+
+        return root, multi_segment_routes + tuple(new_multi_segment_routes)
+
+    def _resolve_dynamic(
+        self,
+        dynamic: Optional[Tuple[_TrieNode, Tuple[Tuple[int, Route, PathPattern], ...]]],
+        path: str,
+    ) -> Optional[ResolvedRoute]:
+        """Resolve the route with parameters for the given path.
+
+        Arguments:
+            dynamic (Optional[Tuple[_TrieNode, Tuple[...]]]): The root of the trie
+                and the multi-segment routes.
+            path (str): The path to resolve the route for.
+
+        Returns:
+            Optional[ResolvedRoute]: The resolved route.
+        """
+        if dynamic is None:
+            return None
+
+        root, multi_segment_routes = dynamic
+        result = self._search(root, path.split("/"), 0, None)
+        best_order = None if result is None else result[0]
+
+        for order, route, pattern in multi_segment_routes:
+            if not _is_better(order, best_order):
+                break
+
+            params = pattern.match(path)
+            if params is not None:
+                result = order, route, params
+                break
+
+        if result is None:
+            return None
+
+        _, route, params = result
+        return ResolvedRoute.from_route(route, params)
+
+
+__all__ = ["TrieRouter"]
@@ -1,13 +1,16 @@
-from ramka.views.base_view import BaseView
+from ramka.views.base_view import VIEW_LIFECYCLES, BaseView
 from ramka.views.errors import (
     default_error_handler,
     http_404_not_found,
     http_405_method_not_allowed,
+    http_413_payload_too_large,
 )
 
 __all__ = [
     "BaseView",
+    "VIEW_LIFECYCLES",
     "default_error_handler",
     "http_404_not_found",
     "http_405_method_not_allowed",
+    "http_413_payload_too_large",
 ]
@@ -1,16 +1,42 @@
 from abc import ABC
+from typing import Tuple
 
 from ramka.request import Request
 from ramka.response import Response
 
+# Supported lifecycles of class-based views. With `per_request` a new instance of the
+# view is created for each request, with `singleton` a single instance is shared by all
+# requests, and with `thread_local` each thread has its own instance.
+VIEW_LIFECYCLES = ("per_request", "singleton", "thread_local")
+
 
 class BaseView(ABC):  # pylint: disable=too-few-public-methods
     """Base class for all class-based views.
 
     A class-based view is a view that is defined by a class. It defines methods for all
     supported request methods.
+
+    By default, a new instance of the view is created for each request. Views that
+    prepare expensive state in `__init__` can set `lifecycle` to `singleton` or
+    `thread_local` (see `VIEW_LIFECYCLES`), so their instances are reused. Such views
+    should not keep the state of a single request in their attributes.
+
+    Views can add middleware to their routes with `middleware` and exclude middleware
+    of the application with `exclude_middleware`, e.g. to skip loading sessions in
+    a health check view.
+
+    Fields:
+        lifecycle (str): The lifecycle of the view instances.
+        middleware (Tuple[type, ...]): The middleware classes added to the routes of
+            the view.
+        exclude_middleware (Tuple[type, ...]): The middleware classes of
+            the application that are not used for the routes of the view.
     """
 
+    lifecycle = "per_request"
+    middleware: Tuple[type, ...] = ()
+    exclude_middleware: Tuple[type, ...] = ()
+
     def get(  # pylint: disable=no-self-use,unused-argument
         self, request: Request, response: Response, **kwargs
     ) -> None:
@@ -85,4 +111,4 @@ class BaseView(ABC):  # pylint: disable=too-few-public-methods
         raise NotImplementedError()
 
 
-__all__ = ["BaseView"]
+__all__ = ["BaseView", "VIEW_LIFECYCLES"]
@@ -1,12 +1,33 @@
 import json
 
+from ramka.request import BodyTooLargeError
 from ramka.response import Response
 
 
+def _encode_error(message: str) -> bytes:
+    """Encode the body of an error page.
+
+    Arguments:
+        message (str): The message to send to the client.
+
+    Returns:
+        bytes: The JSON body with the message.
+    """
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+# Bodies of the error pages that never change, encoded once.
+_ERROR_BODIES = {
+    message: _encode_error(message)
+    for message in ("Not found.", "Method not allowed.", "Payload too large.")
+}
+
+
 def _error_page(response: Response, error_code: int, message: str) -> None:
     """Helper function to send an error page to the client.
 
-    It updates the response object with the error details.
+    It updates the response object with the error details. Bodies of the default
+    error pages are encoded only once.
 
     Arguments:
         response (Response): The response object to send the error page to.
@@ -15,7 +36,7 @@ def _error_page(response: Response, error_code: int, message: str) -> None:
     """
     response.status_code = error_code
     response.content_type = "application/json"
-    response.text = json.dumps({"error": message})
+    response.body = _ERROR_BODIES.get(message) or _encode_error(message)
 
 
 def http_404_not_found(_, response):
@@ -31,14 +52,28 @@ def http_405_method_not_allowed(_, response):
     _error_page(response, 405, "Method not allowed.")
 
 
+def http_413_payload_too_large(_, response):
+    """The default handler for requests with too large bodies."""
+    _error_page(response, 413, "Payload too large.")
+
+
 def default_error_handler(_, response, error: Exception):
     """The default handler for all unhandled exceptions.
 
     It sends a 500 error page to the client as all unhandles exceptions are considered
     as server errors. Instead of sending a genetic 500 error page, it sends a JSON
-    response with the error message.
+    response with the error message. Requests with too large bodies get the 413 error
+    page instead.
     """
-    _error_page(response, 500, str(error))
+    if isinstance(error, BodyTooLargeError):
+        http_413_payload_too_large(_, response)
+    else:
+        _error_page(response, 500, str(error))
 
 
-__all__ = ["default_error_handler", "http_404_not_found", "http_405_method_not_allowed"]
+__all__ = [
+    "default_error_handler",
+    "http_404_not_found",
+    "http_405_method_not_allowed",
+    "http_413_payload_too_large",
+]
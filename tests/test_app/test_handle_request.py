@@ -1,9 +1,11 @@
 import tempfile
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
 from ramka.app import App
+from ramka.request import BodyTooLargeError, Request
+from ramka.response import JSONResponse
 
 
 @patch("ramka.app.Response")
@@ -17,8 +19,9 @@ def test_handle_request_success(mock_response_cls):
     """
     # pylint: disable=protected-access
     with tempfile.TemporaryDirectory() as root_dir:
-        mock_parsed_route = Mock()
+        mock_parsed_route = Mock(max_body_size=None)
         mock_parsed_route.params = {"foo": "bar"}
+        mock_parsed_route.find_handler.return_value.return_value = None
 
         mock_router = Mock()
         mock_router.resolve.return_value = mock_parsed_route
@@ -41,9 +44,9 @@ def test_handle_request_success(mock_response_cls):
 
         result = app.handle_request(mock_request)
 
-        mock_router.resolve.assert_called_once_with(mock_request.path)
-        mock_parsed_route.get_handler.assert_called_once_with(mock_request.method)
-        mock_parsed_route.get_handler.return_value.assert_called_once_with(
+        mock_router.resolve.assert_called_once_with(mock_request.path_info)
+        mock_parsed_route.find_handler.assert_called_once_with(mock_request.method)
+        mock_parsed_route.find_handler.return_value.assert_called_once_with(
             mock_request, mock_response, foo="bar"
         )
         mock_404_handler.assert_not_called()
@@ -82,24 +85,66 @@ def test_handle_request_invalid_path(mock_response_cls):
 
         result = app.handle_request(mock_request)
 
-        mock_router.resolve.assert_called_once_with(mock_request.path)
+        mock_router.resolve.assert_called_once_with(mock_request.path_info)
         mock_404_handler.assert_called_once_with(mock_request, mock_response)
         mock_405_handler.assert_not_called()
         mock_error_handler.assert_not_called()
         assert result == mock_response
 
 
+@patch("ramka.app.Response")
+def test_handle_request_method_not_allowed(mock_response_cls):
+    """
+    When the method `_handle_request` is called
+    And the route has no handler for the request method
+    Then the error should be handled with a valid method
+    And the `Allow` header should be set.
+    """
+    # pylint: disable=protected-access
+    with tempfile.TemporaryDirectory() as root_dir:
+        mock_parsed_route = Mock(allow="GET, POST")
+        mock_parsed_route.find_handler.return_value = None
+
+        mock_router = Mock()
+        mock_router.resolve.return_value = mock_parsed_route
+
+        mock_response = Mock(headers={})
+        mock_response_cls.return_value = mock_response
+
+        mock_request = Mock()
+        mock_404_handler = Mock()
+        mock_405_handler = Mock()
+        mock_error_handler = Mock()
+
+        app = App(
+            root_dir,
+            router=mock_router,
+            http_404_not_found_handler=mock_404_handler,
+            http_405_method_not_allowed_handler=mock_405_handler,
+            error_handler=mock_error_handler,
+        )
+
+        result = app.handle_request(mock_request)
+
+        mock_router.resolve.assert_called_once_with(mock_request.path_info)
+        mock_405_handler.assert_called_once_with(mock_request, mock_response)
+        mock_404_handler.assert_not_called()
+        mock_error_handler.assert_not_called()
+        assert mock_response.headers == {"Allow": "GET, POST"}
+        assert result == mock_response
+
+
 @patch("ramka.app.Response")
 def test_handle_request_handler_not_implemented(mock_response_cls):
     """
     When the method `_handle_request` is called
-    And route handler is not implemented
+    And route handler raises NotImplementedError
     Then the error should be handled with a valid method.
     """
     # pylint: disable=protected-access
     with tempfile.TemporaryDirectory() as root_dir:
-        mock_parsed_route = Mock()
-        mock_parsed_route.get_handler.side_effect = NotImplementedError
+        mock_parsed_route = Mock(params={}, max_body_size=None)
+        mock_parsed_route.find_handler.return_value.side_effect = NotImplementedError
 
         mock_router = Mock()
         mock_router.resolve.return_value = mock_parsed_route
@@ -122,7 +167,7 @@ def test_handle_request_handler_not_implemented(mock_response_cls):
 
         result = app.handle_request(mock_request)
 
-        mock_router.resolve.assert_called_once_with(mock_request.path)
+        mock_router.resolve.assert_called_once_with(mock_request.path_info)
         mock_405_handler.assert_called_once_with(mock_request, mock_response)
         mock_404_handler.assert_not_called()
         mock_error_handler.assert_not_called()
@@ -139,7 +184,7 @@ def test_handle_request_handler_raised_error(mock_response_cls):
     # pylint: disable=protected-access
     with tempfile.TemporaryDirectory() as root_dir:
         mock_parsed_route = Mock()
-        mock_parsed_route.get_handler.side_effect = ValueError
+        mock_parsed_route.find_handler.side_effect = ValueError
 
         mock_router = Mock()
         mock_router.resolve.return_value = mock_parsed_route
@@ -162,7 +207,7 @@ def test_handle_request_handler_raised_error(mock_response_cls):
 
         result = app.handle_request(mock_request)
 
-        mock_router.resolve.assert_called_once_with(mock_request.path)
+        mock_router.resolve.assert_called_once_with(mock_request.path_info)
 
         error_handler_first_call_args = mock_error_handler.call_args_list[0].args
         assert error_handler_first_call_args[0] == mock_request
@@ -184,7 +229,7 @@ def test_handle_request_handler_raised_error_with_no_error_handler():
     # pylint: disable=protected-access
     with tempfile.TemporaryDirectory() as root_dir:
         mock_parsed_route = Mock()
-        mock_parsed_route.get_handler.side_effect = ValueError
+        mock_parsed_route.find_handler.side_effect = ValueError
 
         mock_router = Mock()
         mock_router.resolve.return_value = mock_parsed_route
@@ -196,3 +241,167 @@ def test_handle_request_handler_raised_error_with_no_error_handler():
 
         with pytest.raises(ValueError):
             app.handle_request(mock_request)
+
+
+@pytest.mark.parametrize(
+    "app_limit,route_limit,content_length,expected_limit,expected_status",
+    [
+        (None, None, 10, None, 200),
+        (10, None, 10, 10, 200),
+        (10, None, 11, 10, 413),
+        (10, 20, 11, 20, 200),
+        (None, 5, 6, 5, 413),
+    ],
+)
+def test_handle_request_max_body_size(
+    app_limit, route_limit, content_length, expected_limit, expected_status
+):
+    """
+    Given an application and a route with maximum body sizes
+    When a request is handled
+    Then the limit of the route is used if it's set
+    And requests with larger declared bodies are rejected before the view is called.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        view = Mock(return_value=None)
+        app = App(root_dir, max_body_size=app_limit)
+        app.add_route("/upload", view, ["post"], max_body_size=route_limit)
+
+        request = Request.blank("/upload/", method="POST", body=b"x" * content_length)
+        response = app.handle_request(request)
+
+        assert response.status_code == expected_status
+        assert request.max_body_size == expected_limit
+        assert view.called == (expected_status == 200)
+
+
+def test_handle_request_body_too_large_while_read():
+    """
+    Given an application with the maximum body size
+    When the view reads a body without declared length that is too large
+    Then the error handler is called with `BodyTooLargeError`.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        mock_error_handler = Mock()
+        app = App(root_dir, max_body_size=3, error_handler=mock_error_handler)
+
+        @app.route("/upload", ["post"])
+        def upload(request, response):  # pylint: disable=unused-argument
+            return request.body
+
+        request = Request.blank("/upload/", method="POST", body=b"data")
+        del request.environ["CONTENT_LENGTH"]
+        request.environ["wsgi.input_terminated"] = True
+        response = app.handle_request(request)
+
+        mock_error_handler.assert_called_once_with(request, response, ANY)
+        assert isinstance(mock_error_handler.call_args[0][2], BodyTooLargeError)
+
+
+def test_handle_request_streamed_body():
+    """
+    Given a view that returns a generator
+    When the request is handled
+    Then the generator is used as the parts of the body
+    And it's not read before the response is sent.
+    """
+    produced = []
+
+    def view(_, response):
+        response.content_type = "text/csv"
+        for line in (b"a,b\n", b"1,2\n"):
+            produced.append(line)
+            yield line
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+        app.add_route("/export/", view)
+
+        response = app.handle_request(Request.blank("/export/"))
+
+        assert response.is_streaming
+        assert not produced
+        assert list(response(environ={}, start_response=Mock())) == [
+            b"a,b\n",
+            b"1,2\n",
+        ]
+        assert response.content_type == "text/csv"
+        assert "Content-Length" not in response.headers
+
+
+def test_handle_request_view_returned_response():
+    """
+    Given a view that returns another response
+    When the request is handled
+    Then the returned response is used.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+        app.add_route("/", lambda request, response: JSONResponse([], status=201))
+
+        response = app.handle_request(Request.blank("/"))
+
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == 201
+
+
+@pytest.mark.parametrize(
+    "body,type_name",
+    (
+        ("text", "str"),
+        (b"data", "bytes"),
+        (1, "int"),
+        ({"id": 1}, "dict"),
+        ([b"a", b"b"], "list"),
+    ),
+)
+def test_handle_request_view_returned_other_value(body, type_name):
+    """
+    Given a view that sets the body and returns something else than a response
+    or an iterator
+    When the request is handled
+    Then the returned value is ignored
+    And a warning says what the view returned.
+    """
+
+    def view(_, response):
+        response.text = "ok"
+        return body
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+        app.add_route("/", view)
+
+        with pytest.warns(UserWarning, match=f"ignored, {type_name} returned"):
+            response = app.handle_request(Request.blank("/"))
+
+        assert response.status_code == 200
+        assert response.body == b"ok"
+
+
+def test_handle_request_json_serializer():
+    """
+    Given an application with a custom JSON serializer
+    When a view sets the JSON body of the response
+    Then the body is serialized with that serializer.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(
+            root_dir,
+            response_kwargs={"json_serializer": lambda value: repr(value).encode()},
+        )
+        app.add_route("/", lambda request, response: setattr(response, "json", {1}))
+
+        response = app.handle_request(Request.blank("/"))
+
+        assert response.body == b"{1}"
+
+
+def test_app_with_negative_max_body_size():
+    """
+    When the app is initialized with a negative maximum body size
+    Then an exception is raised.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        with pytest.raises(ValueError, match="Maximum body size can't be negative"):
+            App(root_dir, max_body_size=-1)
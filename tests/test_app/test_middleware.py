@@ -1,7 +1,12 @@
 import tempfile
 from unittest.mock import Mock, patch
 
+import pytest
+
 from ramka.app import App
+from ramka.middleware import Middleware
+from ramka.request import Request
+from ramka.views import BaseView
 
 
 @patch("ramka.middleware.base_middleware.Request")
@@ -25,3 +30,261 @@ def test_middleware_call(mock_request):
         app.handle_request.return_value.assert_called_once_with(
             mock_environ, mock_start_response
         )
+
+
+def create_middleware(name, calls):
+    """Create a middleware class that records its name when it processes requests."""
+
+    class RecordingMiddleware(Middleware):
+        """Middleware that records its name."""
+
+        def process_request(self, request):
+            calls.append(name)
+
+    return type(name, (RecordingMiddleware,), {})
+
+
+def test_route_middleware():
+    """
+    Given an app with middleware and routes that add or exclude middleware
+    When requests are handled
+    Then each route uses the middleware of the app without the excluded middleware
+    And with its own middleware added inside the middleware of the app.
+    """
+    calls = []
+    session = create_middleware("session", calls)
+    logging = create_middleware("logging", calls)
+    auth = create_middleware("auth", calls)
+    audit = create_middleware("audit", calls)
+
+    class AdminView(BaseView):  # pylint: disable=abstract-method
+        """Class-based view with its own middleware."""
+
+        middleware = (audit,)
+        exclude_middleware = (logging,)
+
+        def get(self, request, response, **kwargs):
+            calls.append("view")
+
+    def view(request, response):  # pylint: disable=unused-argument
+        calls.append("view")
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir, middleware_classes=[session, logging])
+        app.add_route("/", view)
+        app.add_route("/health/", view, exclude_middleware=[session])
+        app.add_route("/admin/{page}/", AdminView, middleware=[auth])
+        app.route("/login/", middleware=[auth], exclude_middleware=[session])(view)
+
+        expected_calls = {
+            "/": ["logging", "session", "view"],
+            "/health/": ["logging", "view"],
+            "/admin/users/": ["session", "auth", "audit", "view"],
+            "/login/": ["logging", "auth", "view"],
+            "/missing/": ["logging", "session"],
+        }
+        for path, expected in expected_calls.items():
+            calls.clear()
+            app(Request.blank(path).environ, Mock())
+            assert calls == expected, path
+
+
+def test_route_middleware_compiled_once():
+    """
+    Given an app with a route
+    When the route handles requests or the views are preloaded
+    Then the chain of middleware of the route is compiled only once.
+    """
+    # pylint: disable=protected-access
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+        app.add_route("/", Mock(return_value=None))
+        app.add_route("/users/{id}/", Mock(return_value=None))
+
+        with patch.object(
+            app._middleware, "scope", wraps=app._middleware.scope
+        ) as mock_scope:
+            app(Request.blank("/").environ, Mock())
+            app(Request.blank("/").environ, Mock())
+            app.preload_views()
+            app(Request.blank("/users/1/").environ, Mock())
+
+        assert mock_scope.call_count == 2
+        assert all(app in route.middleware_pipelines for route in app._router.routes)
+
+
+@pytest.mark.parametrize(
+    "view", ["ramka.views:NotExistingView", "ramka.not_existing_module:view"]
+)
+def test_route_middleware_with_view_that_cannot_be_imported(view):
+    """
+    Given a route with a view that can't be imported
+    When the route handles a request
+    Then the error is handled by the error handler
+    And the 500 error page is sent with the default error handler.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        error_handler = Mock()
+        app = App(root_dir, error_handler=error_handler)
+        app.add_route("/", view)
+
+        app(Request.blank("/").environ, Mock())
+
+        error_handler.assert_called_once()
+        assert isinstance(error_handler.call_args[0][2], (ImportError, AttributeError))
+
+        app = App(root_dir)
+        app.add_route("/", view)
+        start_response = Mock()
+
+        app(Request.blank("/").environ, start_response)
+
+        assert start_response.call_args[0][0].startswith("500")
+
+
+def test_route_middleware_with_view_that_cannot_be_imported_no_error_handler():
+    """
+    Given an app without an error handler and a view that can't be imported
+    When the route handles a request
+    Then the error is raised.
+    """
+    # pylint: disable=protected-access
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+        app._error_handler = None
+        app.add_route("/", "ramka.not_existing_module:view")
+
+        with pytest.raises(ModuleNotFoundError):
+            app(Request.blank("/").environ, Mock())
+
+
+def test_route_middleware_with_custom_handle_request():
+    """
+    Given an app with a middleware that overrides `handle_request`
+    When a route handles a request
+    Then the middleware handles the request after the middleware of the route.
+    """
+    calls = []
+
+    class CustomMiddleware(Middleware):
+        """Middleware that handles the request itself."""
+
+        def handle_request(self, request):
+            calls.append("custom")
+            return self._app.handle_request(request)
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir, middleware_classes=[CustomMiddleware])
+        app.add_route(
+            "/",
+            lambda request, response: calls.append("view"),
+            middleware=[create_middleware("route", calls)],
+        )
+
+        app(Request.blank("/").environ, Mock())
+
+        assert calls == ["route", "custom", "view"]
+
+
+class RewriteMiddleware(Middleware):
+    """Middleware that removes the language prefix from the path."""
+
+    def process_request(self, request):
+        if request.path_info.startswith("/en/"):
+            request.path_info = request.path_info[3:]
+
+
+class PassThroughMiddleware(Middleware):
+    """Middleware that passes the request to the wrapped middleware itself."""
+
+    def handle_request(self, request):
+        return self._app.handle_request(request)
+
+
+def test_route_middleware_with_path_changed_by_middleware():
+    """
+    Given an app with a middleware that changes the path of the request
+    When a request is handled
+    Then the route of the changed path handles the request.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir, middleware_classes=[RewriteMiddleware])
+        app.add_route(
+            "/hello/", lambda request, response: setattr(response, "text", "hello")
+        )
+        app.add_route(
+            "/en/hello/", lambda request, response: setattr(response, "text", "en")
+        )
+
+        body = app(Request.blank("/en/hello/").environ, Mock())
+
+        assert b"".join(body) == b"hello"
+
+
+@pytest.mark.parametrize("middleware_classes", [[], [PassThroughMiddleware]])
+@pytest.mark.parametrize(
+    "path,status", [("/", "200 OK"), ("/missing/", "404 Not Found")]
+)
+def test_route_resolved_once(middleware_classes, path, status):
+    """
+    Given an app with or without a middleware that overrides `handle_request`
+    When a request is handled, with or without a route
+    Then the path is resolved only once.
+    """
+    # pylint: disable=protected-access
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir, middleware_classes=middleware_classes)
+        app.add_route("/", lambda request, response: None)
+        start_response = Mock()
+
+        with patch.object(app._router, "resolve", wraps=app._router.resolve) as mock:
+            app(Request.blank(path).environ, start_response)
+
+        mock.assert_called_once_with(path)
+        assert start_response.call_args[0][0] == status
+
+
+class BodyReadingMiddleware(Middleware):
+    """Middleware that reads the body of the request."""
+
+    bodies = []
+
+    def process_request(self, request):
+        self.bodies.append(request.body)
+
+
+@pytest.mark.parametrize("declared_length", [True, False])
+@pytest.mark.parametrize(
+    "path,app_limit,route_limit",
+    [("/upload/", None, 3), ("/upload/", 3, None), ("/missing/", 3, None)],
+)
+def test_route_middleware_reads_too_large_body(
+    declared_length, path, app_limit, route_limit
+):
+    """
+    Given an app with a middleware that reads the body of the request
+    And the maximum body size of the app or of the route
+    When a request with a too large body is handled, with or without declared length
+    Then the middleware can't read more than the limit
+    And the 413 error page is sent.
+    """
+    view = Mock(return_value=None)
+    BodyReadingMiddleware.bodies.clear()
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(
+            root_dir,
+            middleware_classes=[BodyReadingMiddleware],
+            max_body_size=app_limit,
+        )
+        app.add_route("/upload/", view, ["post"], max_body_size=route_limit)
+        request = Request.blank(path, method="POST", body=b"data")
+        if not declared_length:
+            del request.environ["CONTENT_LENGTH"]
+            request.environ["wsgi.input_terminated"] = True
+        start_response = Mock()
+
+        app(request.environ, start_response)
+
+        assert start_response.call_args[0][0].startswith("413")
+        assert not BodyReadingMiddleware.bodies
+        view.assert_not_called()
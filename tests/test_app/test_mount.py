@@ -0,0 +1,132 @@
+import tempfile
+
+import pytest
+from wsgiadapter import WSGIAdapter
+
+import ramka.test
+from ramka.app import App
+from ramka.middleware import Middleware
+
+
+class HeaderMiddleware(Middleware):
+    """Middleware that marks the responses of the application it wraps."""
+
+    def process_response(self, request, response):
+        response.headers["X-Middleware"] = "shop"
+
+
+def create_apps(root_dir):
+    """Create the main application with a shop application mounted in it."""
+    app = App(root_dir)
+    shop_app = App(root_dir, middleware_classes=[HeaderMiddleware])
+    admin_app = App(root_dir)
+
+    @app.route("/")
+    def home_view(request, response):  # pylint: disable=unused-argument
+        response.text = "Home"
+
+    @app.route("/shopping/")
+    def shopping_view(request, response):  # pylint: disable=unused-argument
+        response.text = "Shopping"
+
+    @shop_app.route("/")
+    def shop_view(request, response):
+        response.text = f"Shop {request.script_name} {request.path_info}"
+
+    @shop_app.route("/items/{id:int}/")
+    def item_view(request, response, id):  # pylint: disable=redefined-builtin
+        response.text = f"Item {id} {request.script_name} {request.path_info}"
+
+    @admin_app.route("/")
+    def admin_view(request, response):
+        response.text = f"Admin {request.script_name} {request.path_info}"
+
+    app.mount("/shop/", shop_app)
+    app.mount("/shop/admin", admin_app)
+
+    return app
+
+
+@pytest.fixture(name="client")
+def client_fixture():
+    """Test session that sends requests to the main application."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        yield ramka.test.TestSession(
+            "http://testserver", WSGIAdapter(create_apps(root_dir))
+        )
+
+
+@pytest.mark.parametrize(
+    "url,expected_text,expected_header",
+    (
+        ("/", "Home", None),
+        ("/shopping/", "Shopping", None),
+        ("/shop", "Shop /shop /", "shop"),
+        ("/shop/", "Shop /shop /", "shop"),
+        ("/shop/items/3/", "Item 3 /shop /items/3/", "shop"),
+        ("/shop/admin/", "Admin /shop/admin /", None),
+        ("/shop/admin", "Admin /shop/admin /", None),
+    ),
+)
+def test_mount(client, url, expected_text, expected_header):
+    """
+    Given an application with other applications mounted in it
+    When I send requests to paths inside and outside of the mounts
+    Then each request is handled by the correct application
+    And only the middleware of that application is used.
+    """
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.text == expected_text
+    assert response.headers.get("X-Middleware") == expected_header
+
+
+def test_mount_with_path_longer_than_prefixes(client):
+    """
+    Given an application with another application mounted in it
+    When I send a request to a long path outside of the mount
+    Then the request is handled by the main application.
+    """
+    response = client.get("/shopping-cart/items/")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("prefix", ("", "/", "//", "shop"))
+def test_mount_with_invalid_prefix(prefix):
+    """
+    When I mount an application under an invalid prefix
+    Then a ValueError should be raised.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+
+        with pytest.raises(ValueError):
+            app.mount(prefix, App(root_dir))
+
+
+def test_mount_in_itself():
+    """
+    When I mount an application in itself
+    Then a ValueError should be raised.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+
+        with pytest.raises(ValueError):
+            app.mount("/app", app)
+
+
+def test_mount_with_existing_prefix():
+    """
+    Given an application with another application mounted in it
+    When I mount an application under the same prefix
+    Then an AttributeError should be raised.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+        app.mount("/shop", App(root_dir))
+
+        with pytest.raises(AttributeError):
+            app.mount("/shop/", App(root_dir))
@@ -1,3 +1,4 @@
+import os
 import tempfile
 from unittest.mock import Mock
 
@@ -16,10 +17,16 @@ def test_add_route_calls_router_method():
 
         app = App(root_dir, router=mock_router)
 
-        app.add_route("/sample_route", mock_handler, ["GET", "POST"])
+        app.add_route("/sample_route", mock_handler, ["GET", "POST"], "singleton", 1024)
 
         mock_router.add_route.assert_called_once_with(
-            "/sample_route", mock_handler, ["GET", "POST"]
+            "/sample_route",
+            mock_handler,
+            ["GET", "POST"],
+            "singleton",
+            1024,
+            None,
+            None,
         )
 
 
@@ -35,7 +42,9 @@ def test_route_calls_router_method():
 
         app.route("/sample_route", ["GET", "POST"])
 
-        mock_router.route.assert_called_once_with("/sample_route", ["GET", "POST"])
+        mock_router.route.assert_called_once_with(
+            "/sample_route", ["GET", "POST"], None, None, None, None
+        )
 
 
 def test_has_route_calls_router_method():
@@ -52,3 +61,97 @@ def test_has_route_calls_router_method():
         app.has_route("/sample_route")
 
         mock_router.has_route.assert_called_once_with("/sample_route")
+
+
+def test_add_routes_calls_router_method():
+    """
+    When the method `add_routes` is called on App object
+    Then the method `add_routes` should be called with the correct arguments
+        on the router.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        mock_router = Mock()
+        mock_handler = Mock()
+
+        app = App(root_dir, router=mock_router)
+
+        routes = [("/first", mock_handler), ("/second", mock_handler, ["GET"])]
+        app.add_routes(routes)
+
+        mock_router.add_routes.assert_called_once_with(routes)
+
+
+def test_remove_route_calls_router_method():
+    """
+    When the method `remove_route` is called on App object
+    Then the method `remove_route` should be called on the router
+    And the removed route should be returned.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        mock_router = Mock()
+
+        app = App(root_dir, router=mock_router)
+
+        assert app.remove_route("/sample_route") == (
+            mock_router.remove_route.return_value
+        )
+        mock_router.remove_route.assert_called_once_with("/sample_route")
+
+
+def users_view(request, response):  # pylint: disable=unused-argument
+    """Sample function-based view used in the snapshots."""
+    response.text = "Users"
+
+
+def test_save_routes_snapshot_calls_router_method():
+    """
+    When the method `save_routes_snapshot` is called on App object
+    Then the method `save_snapshot` should be called on the router.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        mock_router = Mock()
+
+        app = App(root_dir, router=mock_router)
+
+        assert app.save_routes_snapshot("routes.snapshot") == (
+            mock_router.save_snapshot.return_value
+        )
+        mock_router.save_snapshot.assert_called_once_with("routes.snapshot")
+
+
+def test_load_routes_snapshot():
+    """
+    Given an app with routes saved to a snapshot
+    When I load the snapshot in another app
+    Then the other app has the same routes.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+        app.add_route("/users/", users_view)
+        file_path = os.path.join(root_dir, "routes.snapshot")
+        app.save_routes_snapshot(file_path)
+
+        other_app = App(root_dir)
+        other_app.load_routes_snapshot(file_path, [("/users/", users_view)])
+
+        assert other_app.has_route("/users/")
+
+
+def test_preload_views():
+    """
+    Given an app with views given as dotted paths, also in a mounted app
+    When I preload the views
+    Then the views are imported in both apps.
+    """
+    # pylint: disable=protected-access
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir)
+        app.add_route("/users/", f"{__name__}:users_view")
+        shop_app = App(root_dir)
+        shop_app.add_route("/items/", f"{__name__}:users_view")
+        app.mount("/shop", shop_app)
+
+        app.preload_views()
+
+        assert app._router.routes[0].is_loaded
+        assert shop_app._router.routes[0].is_loaded
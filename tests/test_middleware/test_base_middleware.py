@@ -1,6 +1,10 @@
+import tempfile
 from unittest.mock import Mock, patch
 
-from ramka.middleware import Middleware
+from ramka.app import App
+from ramka.middleware import Middleware, run_hooks
+from ramka.request import Request
+from ramka.response import Response
 
 
 @patch("ramka.middleware.base_middleware.Request")
@@ -43,7 +47,7 @@ def test_handle_request():
     mock_request = Mock()
 
     middleware = Middleware(mock_app)
-    middleware.process_request = Mock()
+    middleware.process_request = Mock(return_value=None)
     middleware.process_response = Mock()
 
     middleware.handle_request(mock_request)
@@ -67,3 +71,316 @@ def test_add():
 
     mock_middleware.assert_called_once_with(mock_app)
     assert middleware._app == mock_new_app  # pylint: disable=protected-access
+
+
+def test_streamed_body_is_wrapped_by_middleware():
+    """
+    Given an application with a view that streams the body
+    And a middleware that wraps streamed bodies
+    When the application is called
+    Then the body is passed to the WSGI server without being read
+    And it's wrapped by the middleware.
+    """
+    produced = []
+
+    class UpperMiddleware(Middleware):
+        """Middleware that changes streamed bodies to upper case."""
+
+        def process_response(self, request, response):
+            assert response.is_streaming
+            response.wrap_app_iter(lambda parts: (part.upper() for part in parts))
+
+    def view(_, __):
+        for part in (b"a", b"b"):
+            produced.append(part)
+            yield part
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir, middleware_classes=[UpperMiddleware])
+        app.add_route("/", view)
+        start_response = Mock()
+
+        body = app(Request.blank("/").environ, start_response)
+
+        start_response.assert_called_once_with(
+            "200 OK", [("Content-Type", "text/html; charset=UTF-8")]
+        )
+        assert not produced
+        assert list(body) == [b"A", b"B"]
+
+
+def test_middleware_chain_is_compiled():
+    """
+    Given middleware that override one or both hooks or none of them
+    When they are added to the chain
+    Then only the overridden hooks are in the compiled pipeline
+    And they are called in the same order as in nested middleware.
+    """
+    calls = []
+
+    class First(Middleware):
+        """Middleware that overrides both hooks."""
+
+        def process_request(self, request):
+            calls.append("first.request")
+
+        def process_response(self, request, response):
+            calls.append("first.response")
+
+    class Noop(Middleware):
+        """Middleware that doesn't override any hook."""
+
+    class Second(Middleware):
+        """Middleware that overrides only `process_response`."""
+
+        def process_response(self, request, response):
+            calls.append("second.response")
+
+    class Third(Middleware):
+        """Middleware that overrides only `process_request`."""
+
+        def process_request(self, request):
+            calls.append("third.request")
+
+    app = Mock()
+    middleware = Middleware(app)
+    for middleware_cls in (First, Noop, Second, Third):
+        middleware.add(middleware_cls)
+
+    request_hooks, handler, response_hooks = middleware.scope()
+    assert len(request_hooks) == 2
+    assert len(response_hooks) == 2
+    assert handler is app
+
+    with patch("ramka.middleware.base_middleware.Request"):
+        middleware({}, Mock())
+
+    assert calls == [
+        "third.request",
+        "first.request",
+        "first.response",
+        "second.response",
+    ]
+    app.handle_request.return_value.assert_called_once()
+
+
+def test_middleware_chain_with_custom_handle_request():
+    """
+    Given a middleware that overrides `handle_request`
+    And a middleware with hooks set on the instance
+    When the chain is compiled
+    Then the middleware that overrides `handle_request` handles the request
+    And the hooks set on the instance are used.
+    """
+
+    class CustomMiddleware(Middleware):
+        """Middleware that handles the request with the rest of the chain."""
+
+        def handle_request(self, request):
+            return self._app.handle_request(request)
+
+    app = Mock()
+    middleware = Middleware(app)
+    middleware.add(CustomMiddleware)
+    inner = middleware._app  # pylint: disable=protected-access
+    outer = Middleware(inner)
+    outer.process_request = Mock(return_value=None)
+    middleware._app = outer  # pylint: disable=protected-access
+    middleware._compile()  # pylint: disable=protected-access
+
+    with patch("ramka.middleware.base_middleware.Request") as mock_request:
+        middleware({}, Mock())
+
+    outer.process_request.assert_called_once_with(mock_request.return_value)
+    assert middleware.scope()[1] is inner
+    app.handle_request.assert_called_once_with(mock_request.return_value)
+
+
+def test_handle_request_with_response_from_process_request():
+    """
+    Given a middleware whose process_request method returns a response
+    When the handle_request method is called
+    Then the response is returned
+    And the request is not handled
+    And process_response method is not called.
+    """
+    mock_app = Mock()
+    mock_request = Mock()
+
+    middleware = Middleware(mock_app)
+    middleware.process_request = Mock()
+    middleware.process_response = Mock()
+
+    response = middleware.handle_request(mock_request)
+
+    assert response is middleware.process_request.return_value
+    mock_app.handle_request.assert_not_called()
+    middleware.process_response.assert_not_called()
+
+
+def test_middleware_chain_is_short_circuited():
+    """
+    Given a chain of middleware, one of which returns a response from process_request
+    When the chain is called
+    Then the inner middleware and the application are not called
+    And only process_response methods of the outer middleware are called in order.
+    """
+    calls = []
+    cached_response = Mock()
+
+    class Inner(Middleware):
+        """Middleware inside the one that returns a response."""
+
+        def process_request(self, request):
+            calls.append("inner.request")
+
+        def process_response(self, request, response):
+            calls.append("inner.response")
+
+    class Cache(Middleware):
+        """Middleware that returns a cached response."""
+
+        def process_request(self, request):
+            calls.append("cache.request")
+            return cached_response
+
+        def process_response(self, request, response):
+            calls.append("cache.response")
+
+    class Outer(Middleware):
+        """Middleware outside the one that returns a response."""
+
+        def process_response(self, request, response):
+            calls.append(f"outer{len(calls)}.response")
+
+    app = Mock()
+    middleware = Middleware(app)
+    for middleware_cls in (Inner, Cache, Outer, Outer):
+        middleware.add(middleware_cls)
+
+    start_response = Mock()
+    with patch("ramka.middleware.base_middleware.Request"):
+        body = middleware({}, start_response)
+
+    assert calls == ["cache.request", "outer1.response", "outer2.response"]
+    app.handle_request.assert_not_called()
+    cached_response.assert_called_once_with({}, start_response)
+    assert body is cached_response.return_value
+
+    # The nested chain behaves the same way.
+    calls.clear()
+    assert middleware.handle_request(Mock()) is cached_response
+    assert calls == ["cache.request", "outer1.response", "outer2.response"]
+    app.handle_request.assert_not_called()
+
+
+def test_middleware_rejects_request_in_app():
+    """
+    Given an application with a middleware that rejects requests without a token
+    When it's called without the token
+    Then the response of the middleware is returned without calling the view.
+    """
+
+    class TokenMiddleware(Middleware):
+        """Middleware that rejects requests without the `X-Token` header."""
+
+        def process_request(self, request):
+            if "X-Token" not in request.headers:
+                return Response(b"Forbidden", status=403)
+
+            return None
+
+    view = Mock(return_value=None)
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir, middleware_classes=[TokenMiddleware])
+        app.add_route("/", view)
+        start_response = Mock()
+
+        body = app(Request.blank("/").environ, start_response)
+
+        assert b"".join(body) == b"Forbidden"
+        assert start_response.call_args[0][0] == "403 Forbidden"
+        view.assert_not_called()
+
+        app(Request.blank("/", headers={"X-Token": "a"}).environ, start_response)
+        view.assert_called_once()
+
+
+def test_scope():
+    """
+    Given a chain of middleware
+    When I compile it with some middleware excluded and other added
+    Then the excluded middleware is not in the compiled chain
+    And the added middleware is inside the middleware of the chain.
+    """
+    calls = []
+
+    class First(Middleware):
+        """Middleware of the chain."""
+
+        def process_request(self, request):
+            calls.append("first")
+
+    class Second(First):
+        """Middleware of the chain, excluded from the route."""
+
+        def process_request(self, request):
+            calls.append("second")
+
+    class Extra(Middleware):
+        """Middleware added to the route."""
+
+        def process_request(self, request):
+            calls.append("extra")
+
+    class Custom(Middleware):
+        """Middleware added to the route that handles the request itself."""
+
+        def handle_request(self, request):
+            calls.append("custom")
+            return self._app.handle_request(request)
+
+    app = Mock()
+    middleware = Middleware(app)
+    middleware.add(First)
+    middleware.add(Second)
+
+    request_hooks, handler, response_hooks = middleware.scope((Second,), (Extra,))
+    run_hooks(Mock(), request_hooks, response_hooks, handler.handle_request)
+    assert handler is app
+    assert calls == ["first", "extra"]
+
+    calls.clear()
+    request_hooks, handler, _ = middleware.scope(extra=(Custom, Extra))
+    assert isinstance(handler, Custom)
+    run_hooks(Mock(), request_hooks, (), handler.handle_request)
+    assert calls == ["second", "first", "extra", "custom"]
+
+    calls.clear()
+    request_hooks, handler, response_hooks = middleware.scope()
+    run_hooks(Mock(), request_hooks, response_hooks, handler.handle_request)
+    assert handler is app
+    assert calls == ["second", "first"]
+
+
+def test_call_with_dispatch():
+    """
+    Given a middleware with a dispatch function
+    When the middleware is called
+    Then the dispatch function handles the request
+    And it can handle the request with the compiled chain.
+    """
+    app = Mock()
+
+    def dispatch(request, process):
+        return process(request)
+
+    middleware = Middleware(app, dispatch=Mock(wraps=dispatch))
+    start_response = Mock()
+
+    with patch("ramka.middleware.base_middleware.Request") as mock_request:
+        body = middleware({}, start_response)
+
+    middleware._dispatch.assert_called_once()  # pylint: disable=protected-access
+    app.handle_request.assert_called_once_with(mock_request.return_value)
+    assert body is app.handle_request.return_value.return_value
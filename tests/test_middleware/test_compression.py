@@ -0,0 +1,264 @@
+import gzip
+import tempfile
+import zlib
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ramka.app import App
+from ramka.middleware import CompressionMiddleware
+from ramka.middleware.compression import parse_accept_encoding
+from ramka.request import Request
+from ramka.response import Response
+
+BODY = b"<p>Hello, World!</p>" * 100
+
+
+def process(response, accept_encoding="gzip", middleware=None):
+    """Process the response with the compression middleware."""
+    middleware = middleware or CompressionMiddleware(Mock())
+    request = Request.blank("/", headers={"Accept-Encoding": accept_encoding})
+    middleware.process_response(request, response)
+    return response
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("gzip, deflate, br", "gzip"),
+        ("deflate", "deflate"),
+        ("gzip;q=0.5, deflate", "deflate"),
+        ("GZIP;Q=1.0", "gzip"),
+        ("deflate;level=1", "deflate"),
+        ("*", "gzip"),
+        ("*;q=0.5, gzip;q=0", "deflate"),
+        ("gzip;q=0, deflate;q=0", None),
+        ("gzip;q=invalid", None),
+        ("br, identity", None),
+        ("", None),
+    ],
+)
+def test_parse_accept_encoding(value, expected):
+    """
+    Given the `Accept-Encoding` header
+    When I select the encoding
+    Then the supported encoding with the highest quality is selected.
+    """
+    assert parse_accept_encoding(value) == expected
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,decompress",
+    [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+)
+def test_compression_middleware(accept_encoding, decompress):
+    """
+    Given a response with a large text body
+    When the middleware processes it
+    Then the body is compressed with the encoding accepted by the client
+    And the headers describe the encoding.
+    """
+    response = process(Response(BODY), accept_encoding)
+
+    assert decompress(response.body) == BODY
+    assert response.headers["Content-Encoding"] == accept_encoding
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.content_length == len(response.body) < len(BODY)
+
+
+@pytest.mark.parametrize(
+    "response,accept_encoding",
+    [
+        (Response(b"<p>Small</p>"), "gzip"),
+        (Response(BODY), "br"),
+        (Response(BODY, content_type="image/png"), "gzip"),
+        (Response(BODY, headerlist=[("Content-Encoding", "br")]), "gzip"),
+        (Response(BODY, status=304), "gzip"),
+        (
+            Response(
+                BODY,
+                status=206,
+                headerlist=[
+                    ("Content-Type", "text/html"),
+                    ("Content-Range", f"bytes 0-{len(BODY) - 1}/{len(BODY) * 2}"),
+                ],
+            ),
+            "gzip",
+        ),
+        (
+            Response(
+                BODY,
+                status=416,
+                headerlist=[
+                    ("Content-Type", "text/html"),
+                    ("Content-Range", f"bytes */{len(BODY)}"),
+                ],
+            ),
+            "gzip",
+        ),
+        (Response(BODY, status=101), "gzip"),
+        (
+            Response(
+                BODY,
+                headerlist=[
+                    ("Content-Type", "text/html"),
+                    ("Cache-Control", "no-transform"),
+                ],
+            ),
+            "gzip",
+        ),
+    ],
+)
+def test_compression_middleware_skipped(response, accept_encoding):
+    """
+    Given a response that should not be compressed
+    When the middleware processes it
+    Then the body is not changed.
+    """
+    process(response, accept_encoding)
+
+    assert response.body == (BODY if len(response.body) > 100 else b"<p>Small</p>")
+    assert "Content-Encoding" not in response.headers or (
+        response.headers["Content-Encoding"] == "br"
+    )
+
+
+def test_compression_middleware_vary_header():
+    """
+    Given a text response that already varies on the encoding
+    When the middleware processes it for a client without compression support
+    Then the `Vary` header is not duplicated.
+    """
+    response = Response(
+        BODY,
+        headerlist=[
+            ("Content-Type", "application/ld+json"),
+            ("Vary", "Accept-Encoding"),
+        ],
+    )
+
+    process(response, "identity")
+
+    assert response.headers.getall("Vary") == ["Accept-Encoding"]
+
+
+def test_compression_middleware_streamed_body():
+    """
+    Given a response with a streamed body
+    When the middleware processes it
+    Then the parts are compressed while they are sent
+    And each part can be decompressed as soon as it's received.
+    """
+    produced = []
+
+    def generate():
+        for part in (b"a,b\n", b"", b"1,2\n"):
+            produced.append(part)
+            yield part
+
+    response = Response(
+        app_iter=generate(),
+        headerlist=[
+            ("Content-Type", "text/csv"),
+            ("ETag", '"tag"'),
+            ("Accept-Ranges", "bytes"),
+        ],
+    )
+
+    process(response)
+
+    assert not produced
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == 'W/"tag"'
+    assert "Accept-Ranges" not in response.headers
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    parts = iter(response(environ={}, start_response=Mock()))
+    assert decompressor.decompress(next(parts)) == b"a,b\n"
+    assert decompressor.decompress(next(parts)) == b"1,2\n"
+    assert decompressor.decompress(b"".join(parts)) == b""
+    assert decompressor.eof
+
+
+def test_compression_middleware_small_streamed_body():
+    """
+    Given a response with a streamed body of a known small length
+    When the middleware processes it
+    Then the body is not compressed.
+    """
+    response = Response(app_iter=[b"a"], headerlist=[("Content-Type", "text/plain")])
+    response.headers["Content-Length"] = "1"
+
+    process(response)
+
+    assert "Content-Encoding" not in response.headers
+    assert response.app_iter == [b"a"]
+
+
+@patch("ramka.middleware.compression.zlib.compressobj", wraps=zlib.compressobj)
+def test_compression_middleware_cache(mock_compressobj):
+    """
+    Given responses with the same body
+    When the middleware processes them
+    Then the body is compressed only once for each encoding
+    And the least recently used bodies are removed from the cache.
+    """
+
+    class SmallCacheMiddleware(CompressionMiddleware):
+        """Compression middleware with a cache of two bodies."""
+
+        cache_size = 2
+
+    middleware = SmallCacheMiddleware(Mock())
+    other_body = BODY.replace(b"Hello", b"Hi")
+
+    first = process(Response(BODY), middleware=middleware).body
+    second = process(Response(BODY), middleware=middleware).body
+    assert first is second
+    assert mock_compressobj.call_count == 1
+
+    process(Response(BODY), "deflate", middleware)
+    process(Response(other_body), middleware=middleware)
+    assert mock_compressobj.call_count == 3
+
+    process(Response(BODY), middleware=middleware)
+    assert mock_compressobj.call_count == 4
+
+
+@pytest.mark.parametrize("cache_size,max_cached_body_size", [(0, 1024**2), (2, 10)])
+@patch("ramka.middleware.compression.zlib.compressobj", wraps=zlib.compressobj)
+def test_compression_middleware_without_cache(
+    mock_compressobj, cache_size, max_cached_body_size
+):
+    """
+    Given the cache disabled or a body larger than cached bodies
+    When the middleware processes the same body twice
+    Then the body is compressed twice.
+    """
+    middleware = CompressionMiddleware(Mock())
+    middleware.cache_size = cache_size
+    middleware.max_cached_body_size = max_cached_body_size
+
+    process(Response(BODY), middleware=middleware)
+    process(Response(BODY), middleware=middleware)
+
+    assert mock_compressobj.call_count == 2
+
+
+def test_compression_middleware_in_app():
+    """
+    Given an application with the compression middleware
+    When it's called
+    Then the response is compressed.
+    """
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir, middleware_classes=[CompressionMiddleware])
+        app.add_route("/", lambda request, response: setattr(response, "body", BODY))
+        start_response = Mock()
+
+        body = app(
+            Request.blank("/", headers={"Accept-Encoding": "gzip"}).environ,
+            start_response,
+        )
+
+        assert gzip.decompress(b"".join(body)) == BODY
+        assert ("Content-Encoding", "gzip") in start_response.call_args[0][1]
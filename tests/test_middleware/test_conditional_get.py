@@ -0,0 +1,145 @@
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+
+from ramka.app import App
+from ramka.middleware import ConditionalGetMiddleware
+from ramka.request import Request
+from ramka.response import Response, make_etag, not_modified
+
+BODY = b"<p>Hello, World!</p>"
+
+
+def process(response, method="GET", middleware=None, **headers):
+    """Process the response with the conditional GET middleware."""
+    middleware = middleware or ConditionalGetMiddleware(Mock())
+    request = Request.blank("/", method=method, headers=headers)
+    middleware.process_response(request, response)
+    return response
+
+
+def test_conditional_get_middleware_adds_etag():
+    """
+    Given a response with a body
+    When the middleware processes it
+    Then the ETag of the body is added.
+    """
+    response = process(Response(BODY))
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == make_etag(BODY)
+    assert response.body == BODY
+
+
+def test_conditional_get_middleware_weak_etags():
+    """
+    Given the middleware configured to create weak ETags
+    When it processes a response
+    Then the weak ETag is added.
+    """
+
+    class WeakMiddleware(ConditionalGetMiddleware):
+        """Conditional GET middleware that creates weak ETags."""
+
+        weak_etags = True
+
+    response = process(Response(BODY), middleware=WeakMiddleware(Mock()))
+
+    assert response.headers["ETag"] == make_etag(BODY, weak=True)
+
+
+@pytest.mark.parametrize(
+    "response_headers,request_headers",
+    [
+        ([], {"If-None-Match": make_etag(BODY)}),
+        ([("ETag", '"v1"')], {"If-None-Match": '"v0", "v1"'}),
+        (
+            [("Last-Modified", "Sun, 13 Sep 2020 12:26:40 GMT")],
+            {"If-Modified-Since": "Sun, 13 Sep 2020 12:26:40 GMT"},
+        ),
+    ],
+)
+def test_conditional_get_middleware_not_modified(response_headers, request_headers):
+    """
+    Given a request with validators that match the response
+    When the middleware processes the response
+    Then the response is turned into the 304 response without body.
+    """
+    response = Response(BODY, headerlist=[("Content-Type", "text/html")])
+    response.headerlist.extend(response_headers)
+
+    process(response, **request_headers)
+
+    assert response.status_code == 304
+    assert "Content-Type" not in response.headers
+    assert b"".join(response(environ={}, start_response=Mock())) == b""
+
+
+def test_conditional_get_middleware_streamed_body():
+    """
+    Given a response with a streamed body
+    When the middleware processes it
+    Then the body is not read
+    And the ETag set by the view is used.
+    """
+    app_iter = Mock(__iter__=Mock(return_value=iter([BODY])))
+    response = process(
+        Response(app_iter=app_iter), **{"If-None-Match": make_etag(BODY)}
+    )
+
+    assert response.is_streaming
+    assert "ETag" not in response.headers
+    app_iter.__iter__.assert_not_called()
+
+    response = process(
+        Response(app_iter=app_iter, headerlist=[("ETag", '"v1"')]),
+        **{"If-None-Match": '"v1"'},
+    )
+
+    assert response.status_code == 304
+    app_iter.close.assert_called_once_with()
+
+
+@pytest.mark.parametrize("method,status", [("POST", 200), ("GET", 404)])
+def test_conditional_get_middleware_skipped(method, status):
+    """
+    Given a response to other request than GET or a response with other status
+    When the middleware processes it
+    Then the response is not changed.
+    """
+    response = process(Response(BODY, status=status), method, **{"If-None-Match": "*"})
+
+    assert response.status_code == status
+    assert "ETag" not in response.headers
+
+
+def test_conditional_get_middleware_with_view_validators():
+    """
+    Given an application with the middleware and a view that sets its ETag
+    When the client has the current version
+    Then the body is not created.
+    """
+    render = Mock(return_value=BODY)
+
+    def view(request, response):
+        if not_modified(request, response, etag="v1"):
+            return
+
+        response.body = render()
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        app = App(root_dir, middleware_classes=[ConditionalGetMiddleware])
+        app.add_route("/", view)
+        start_response = Mock()
+
+        body = app(Request.blank("/").environ, start_response)
+        assert b"".join(body) == BODY
+
+        body = app(
+            Request.blank("/", headers={"If-None-Match": '"v1"'}).environ,
+            start_response,
+        )
+        assert b"".join(body) == b""
+        assert start_response.call_args[0] == ("304 Not Modified", [("ETag", '"v1"')])
+        render.assert_called_once_with()
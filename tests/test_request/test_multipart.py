@@ -0,0 +1,191 @@
+import hashlib
+from io import BytesIO
+
+import pytest
+
+from ramka.request import MultipartError, MultipartParser
+from ramka.request.multipart import parse_options_header
+
+BODY = (
+    b"preamble\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="name"\r\n\r\n'
+    b"Za\xc5\xbc\xc3\xb3\xc5\x82\xc4\x87\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="a \\"b\\".txt"\r\n'
+    b"Content-Type: text/plain; charset=latin-1\r\n\r\n"
+    b"line\r\n--bound\r\r\n-line\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="empty"\r\n\r\n'
+    b"\r\n"
+    b"--boundary--\r\n"
+    b"epilogue"
+)
+
+
+def split(data, size):
+    """Split the data into chunks of the given size."""
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, len(BODY)])
+def test_multipart_parser(chunk_size):
+    """
+    Given a multipart body split into chunks of any size
+    When I parse the body
+    Then the parts are parsed with their headers and data
+    And the preamble and the epilogue are ignored.
+    """
+    parser = MultipartParser(split(BODY, chunk_size), "boundary")
+
+    parts = [
+        (part.name, part.filename, part.content_type, part.charset, part.read())
+        for part in parser
+    ]
+
+    assert parts == [
+        ("name", None, "text/plain", "utf-8", "Zażółć".encode()),
+        (
+            "file",
+            'a "b".txt',
+            "text/plain",
+            "latin-1",
+            b"line\r\n--bound\r\r\n-line",
+        ),
+        ("empty", None, "text/plain", "utf-8", b""),
+    ]
+
+
+def test_multipart_parser_data_is_not_copied():
+    """
+    Given a multipart body without preamble in a single chunk
+    When I iterate over the data of a part
+    Then the data is a view of the chunk.
+    """
+    body = BODY[len(b"preamble\r\n") :]
+    parser = MultipartParser([body], b"boundary")
+
+    chunks = list(next(iter(parser)).iter_data())
+
+    assert len(chunks) == 1
+    assert isinstance(chunks[0], memoryview)
+    assert chunks[0].obj is body
+
+
+def test_multipart_parser_skips_unread_data():
+    """
+    Given a multipart body
+    When I don't read the data of the parts
+    Then the data is skipped
+    And the next parts are parsed.
+    """
+    parser = MultipartParser(split(BODY, 5), "boundary")
+
+    assert [part.name for part in parser] == ["name", "file", "empty"]
+
+
+def test_multipart_part_save():
+    """
+    Given a part of a multipart body
+    When I save the data to a file, a hash or a callable
+    Then the data is written in chunks
+    And the size of the data is returned.
+    """
+    data = b"0123456789" * 10
+    body = (
+        b'--b\r\nContent-Disposition: form-data; name="a"; filename="a"\r\n\r\n'
+        + data
+        + b'\r\n--b\r\nContent-Disposition: form-data; name="b"\r\n\r\n'
+        + data
+        + b"\r\n--b\r\nContent-Disposition: form-data; name=c\r\n\r\n"
+        + data
+        + b"\r\n--b--"
+    )
+    file = BytesIO()
+    digest = hashlib.sha256()
+    chunks = []
+
+    sizes = [
+        part.save(sink)
+        for part, sink in zip(
+            MultipartParser(split(body, 16), "b"), (file, digest, chunks.append)
+        )
+    ]
+
+    assert sizes == [100, 100, 100]
+    assert file.getvalue() == data
+    assert digest.hexdigest() == hashlib.sha256(data).hexdigest()
+    assert b"".join(chunks) == data
+    assert len(chunks) > 1
+
+
+def test_multipart_part_text_and_repr():
+    """
+    Given a part of a multipart body
+    When I read the data as text
+    Then it's decoded using the charset of the part.
+    """
+    part = next(iter(MultipartParser([BODY], "boundary")))
+
+    assert part.text() == "Zażółć"
+    assert repr(part) == "MultipartPart(name='name', filename=None)"
+    assert part.headers == {"content-disposition": 'form-data; name="name"'}
+
+
+@pytest.mark.parametrize("boundary", ["", "b" * 201])
+def test_multipart_parser_invalid_boundary(boundary):
+    """
+    Given an empty or too long boundary
+    When I create a parser
+    Then an exception is raised.
+    """
+    with pytest.raises(MultipartError, match="Invalid multipart boundary"):
+        MultipartParser([BODY], boundary)
+
+
+@pytest.mark.parametrize(
+    "body,chunk_size,message",
+    [
+        (b"", 10, "Unexpected end"),
+        (b"-", 10, "Unexpected end"),
+        (b"preamble", 10, "Unexpected end"),
+        (b"--b\r\nName: value\r\n\r\ndata", 10, "Unexpected end"),
+        (b"--b", 10, "Unexpected end"),
+        (b"--bxx", 10, "Invalid multipart delimiter"),
+        (b"--b\r\nInvalid\r\n\r\n\r\n--b--", 10, "Invalid header"),
+        (b"--b\r\nName: " + b"a" * 100, 10, "too large"),
+        (b"--b\r\nName: " + b"a" * 100 + b"\r\n\r\n\r\n--b--", 200, "too large"),
+    ],
+)
+def test_multipart_parser_invalid_body(body, chunk_size, message):
+    """
+    Given an invalid multipart body
+    When I parse the body
+    Then an exception is raised.
+    """
+    parser = MultipartParser(split(body, chunk_size), "b", max_header_size=50)
+
+    with pytest.raises(MultipartError, match=message):
+        for part in parser:
+            part.read()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("text/plain", ("text/plain", {})),
+        (
+            'Form-Data; Name="a;b"; filename=c.txt',
+            ("form-data", {"name": "a;b", "filename": "c.txt"}),
+        ),
+        ('form-data; name="a\\\\b\\"c"', ("form-data", {"name": 'a\\b"c'})),
+        ("", ("", {})),
+    ],
+)
+def test_parse_options_header(value, expected):
+    """
+    Given a header with options
+    When I parse the header
+    Then the value and the options are returned.
+    """
+    assert parse_options_header(value) == expected
@@ -0,0 +1,507 @@
+import json
+
+import pytest
+from webob import Request as WebObRequest
+from webob.multidict import NoVars
+
+from ramka.request import BodyTooLargeError, MultipartError, Request, UploadedFile
+
+
+def test_request_is_lazy():
+    """
+    Given a WSGI environment
+    When I create a request
+    Then nothing is parsed
+    And instances of the request don't have `__dict__`.
+    """
+    request = Request.blank("/users/?page=2", method="POST")
+
+    assert request.environ["REQUEST_METHOD"] == "POST"
+    assert not hasattr(request, "__dict__")
+    for name in ("_headers", "_cookies", "_get", "_post", "_body", "_webob"):
+        assert not hasattr(request, name)
+
+
+@pytest.mark.parametrize(
+    "path,environ",
+    [
+        ("/users/?page=2&page=3", {}),
+        ("/", {"SCRIPT_NAME": "/shop"}),
+        ("/%C5%BC%C3%B3%C5%82w/a%20b/", {}),
+        ("/", {"HTTP_HOST": "example.com:8080"}),
+        ("/", {"HTTP_HOST": "example.com:80"}),
+        ("/", {"SERVER_PORT": "8000"}),
+        ("/", {"SERVER_PORT": "80"}),
+        ("https://example.com:443/secure/", {}),
+    ],
+)
+def test_request_attributes_match_webob(path, environ):
+    """
+    Given a WSGI environment
+    When I create a request
+    Then its attributes have the same values as in the WebOb request.
+    """
+    request = Request.blank(path, environ)
+    if "SERVER_PORT" in environ:
+        del request.environ["HTTP_HOST"]
+
+    expected = WebObRequest(dict(request.environ))
+
+    for name in (
+        "method",
+        "scheme",
+        "path_info",
+        "script_name",
+        "query_string",
+        "path",
+        "path_qs",
+        "host",
+        "host_url",
+        "url",
+    ):
+        assert getattr(request, name) == getattr(expected, name), name
+
+
+def test_request_path_setters():
+    """
+    Given a request
+    When I change its path
+    Then the WSGI environment is updated.
+    """
+    request = Request.blank("/")
+
+    request.script_name = "/sklep"
+    request.path_info = "/żółw/"
+
+    assert request.environ["SCRIPT_NAME"] == "/sklep"
+    assert request.environ["PATH_INFO"] == "/żółw/".encode("utf-8").decode("latin-1")
+    assert request.path_info == "/żółw/"
+    assert request.path == "/sklep/%C5%BC%C3%B3%C5%82w/"
+
+
+def test_request_setters():
+    """
+    Given a request with a form in the body
+    When I change its method, headers, content type and charset
+    Then the WSGI environment is updated
+    And the form is parsed again.
+    """
+    request = Request.blank(
+        "/",
+        method="POST",
+        body=b"name=John",
+        content_type="application/x-www-form-urlencoded; charset=utf-8",
+    )
+    assert request.POST["name"] == "John"
+
+    request.method = "PUT"
+    request.content_type = "application/json"
+
+    assert request.environ["REQUEST_METHOD"] == request.method == "PUT"
+    assert request.environ["CONTENT_TYPE"] == "application/json; charset=utf-8"
+    assert isinstance(request.POST, NoVars)
+
+    request.charset = "latin-1"
+
+    assert request.environ["CONTENT_TYPE"] == "application/json; charset=latin-1"
+    assert request.charset == "latin-1"
+
+    request.content_type = "text/plain; charset=ascii"
+
+    assert request.environ["CONTENT_TYPE"] == "text/plain; charset=ascii"
+
+    request.headers = {
+        "Content-Type": "application/x-www-form-urlencoded",
+        "X-Request-Id": "abc",
+    }
+
+    assert request.environ["HTTP_X_REQUEST_ID"] == "abc"
+    assert "CONTENT_LENGTH" not in request.environ
+    assert request.content_type == "application/x-www-form-urlencoded"
+    assert request.charset == "UTF-8"
+    assert request.POST["name"] == "John"
+
+
+@pytest.mark.parametrize("spool", [True, False])
+def test_request_body_setter(spool):
+    """
+    Given a request with a form in the body
+    When I set a new body
+    Then the input stream in the WSGI environment is replaced
+    And the body and the form are read from the new body.
+    """
+    request = Request.blank(
+        "/",
+        method="POST",
+        body=b"name=John",
+        content_type="application/x-www-form-urlencoded",
+    )
+    assert request.POST["name"] == "John"
+    if spool:
+        request.spool_body()
+
+    request.body = b"name=Jane"
+
+    assert request.environ["CONTENT_LENGTH"] == "9"
+    assert request.environ["wsgi.input"].read() == b"name=Jane"
+    assert request.body == b"name=Jane"
+    assert request.spool_body().read() == b"name=Jane"
+    assert request.POST["name"] == "Jane"
+    assert WebObRequest(request.environ).body == b"name=Jane"
+
+
+def test_request_headers_and_cookies():
+    """
+    Given a request with headers and cookies
+    When I read them
+    Then they are parsed once and cached.
+    """
+    request = Request.blank(
+        "/",
+        headers={"X-Request-Id": "abc", "Cookie": "session=123; theme=dark"},
+        user_agent="tests",
+        remote_addr="10.0.0.1",
+    )
+
+    headers = request.headers
+    cookies = request.cookies
+
+    assert headers["x-request-id"] == "abc"
+    assert request.headers is headers
+    assert cookies == {"session": "123", "theme": "dark"}
+    assert request.cookies is cookies
+    assert request.user_agent == "tests"
+    assert request.remote_addr == "10.0.0.1"
+
+
+def test_request_get_parameters():
+    """
+    Given a request with a query string
+    When I read the parameters
+    Then they are parsed once
+    And they are parsed again when the query string changes.
+    """
+    request = Request.blank("/?a=1&a=2&b=")
+
+    get = request.GET
+
+    assert get.getall("a") == ["1", "2"]
+    assert get["b"] == ""
+    assert request.GET is get
+
+    request.environ["QUERY_STRING"] = "c=3"
+
+    assert dict(request.GET) == {"c": "3"}
+
+
+def test_request_urlencoded_form():
+    """
+    Given a request with a URL-encoded form
+    When I read the parameters
+    Then the form is parsed from the body.
+    """
+    request = Request.blank(
+        "/?page=1",
+        method="POST",
+        body="name=Za%C5%BC%C3%B3%C5%82%C4%87&tags=a&tags=b".encode("ascii"),
+        content_type="application/x-www-form-urlencoded",
+    )
+
+    post = request.POST
+
+    assert request.content_type == "application/x-www-form-urlencoded"
+    assert post["name"] == "Zażółć"
+    assert post.getall("tags") == ["a", "b"]
+    assert request.POST is post
+    assert request.params["page"] == "1"
+    assert request.params["name"] == "Zażółć"
+
+
+def test_request_multipart_form():
+    """
+    Given a request with a multipart form with a field and a file
+    When I read the parameters
+    Then the form is parsed
+    And the file is stored in a temporary file
+    And the body can't be read again.
+    """
+    body = (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="name"\r\n\r\n'
+        b"John\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="avatar"; filename="a.png"\r\n'
+        b"Content-Type: image/png\r\n\r\n"
+        b"\x89PNG\r\n"
+        b"--boundary--\r\n"
+    )
+    request = Request.blank(
+        "/",
+        method="POST",
+        body=body,
+        content_type="multipart/form-data; boundary=boundary",
+    )
+
+    assert request.POST["name"] == "John"
+    avatar = request.POST["avatar"]
+    assert isinstance(avatar, UploadedFile)
+    assert (avatar.name, avatar.filename) == ("avatar", "a.png")
+    assert avatar.content_type == "image/png"
+    assert avatar.file.read() == b"\x89PNG"
+    assert avatar.value == b"\x89PNG"
+    with pytest.raises(RuntimeError):
+        request.body  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize(
+    "content_type,body",
+    [
+        ("multipart/form-data; boundary=boundary", b""),
+        ("application/json", b"{}"),
+    ],
+)
+def test_request_post_parameters_without_form(content_type, body):
+    """
+    Given a request without a form in the body
+    When I read the form parameters
+    Then they are empty.
+    """
+    request = Request.blank("/", method="POST", body=body, content_type=content_type)
+
+    assert not request.POST
+
+
+def test_request_post_parameters_of_other_content_types():
+    """
+    Given a request with a body that is not a form
+    When I read the form parameters
+    Then no variables are returned, the same as in WebOb.
+    """
+    request = Request.blank(
+        "/", method="POST", body=b"{}", content_type="application/json"
+    )
+
+    assert isinstance(request.POST, NoVars)
+    assert request.POST.get("name") is None
+    assert not request.params
+
+
+def test_request_json_body():
+    """
+    Given a request with a JSON body in a custom charset
+    When I read the body
+    Then the body is read once
+    And it can be decoded.
+    """
+    data = {"name": "Zażółć"}
+    request = Request.blank(
+        "/",
+        method="POST",
+        body=json.dumps(data, ensure_ascii=False).encode("utf-16"),
+        content_type='application/json; format=compact; charset="utf-16"',
+    )
+
+    body = request.body
+
+    assert request.content_length == len(body)
+    assert request.charset == "utf-16"
+    assert request.body is body
+    assert request.json == request.json_body == data
+
+
+@pytest.mark.parametrize(
+    "environ,expected_body",
+    [
+        ({}, b""),
+        ({"wsgi.input_terminated": True}, b"data"),
+    ],
+)
+def test_request_body_without_content_length(environ, expected_body):
+    """
+    Given a request without the `Content-Length` header
+    When I read the body
+    Then the body is read only if the server marked the end of the input.
+    """
+    request = Request.blank("/", method="POST", body=b"data")
+    del request.environ["CONTENT_LENGTH"]
+    request.environ.update(environ)
+
+    assert request.content_length is None
+    assert request.body == expected_body
+    assert request.environ["wsgi.input"].read() == expected_body
+
+
+def test_request_body_without_input():
+    """
+    Given a WSGI environment without the input stream
+    When I read the body
+    Then the body is empty.
+    """
+    request = Request({"REQUEST_METHOD": "GET"})
+
+    assert request.body == b""
+    assert request.text == ""
+    assert request.charset == "UTF-8"
+
+
+@pytest.mark.parametrize("input_terminated", [False, True])
+def test_request_iter_body(input_terminated):
+    """
+    Given a request with a body
+    When I iterate over the body
+    Then the body is read in chunks of the given size
+    And it can't be read again.
+    """
+    request = Request.blank("/", method="POST", body=b"abcdefg")
+    if input_terminated:
+        del request.environ["CONTENT_LENGTH"]
+        request.environ["wsgi.input_terminated"] = True
+
+    assert list(request.iter_body(chunk_size=3)) == [b"abc", b"def", b"g"]
+
+    with pytest.raises(RuntimeError, match="already been read as a stream"):
+        request.iter_body()
+
+    with pytest.raises(RuntimeError, match="already been read as a stream"):
+        request.body  # pylint: disable=pointless-statement
+
+
+def test_request_iter_body_after_body():
+    """
+    Given a request with a body that has already been read
+    When I iterate over the body
+    Then the chunks are taken from the body.
+    """
+    request = Request.blank("/", method="POST", body=b"abcdefg")
+
+    assert request.body == b"abcdefg"
+    assert list(request.iter_body(chunk_size=4)) == [b"abcd", b"efg"]
+    assert list(request.iter_body(chunk_size=4)) == [b"abcd", b"efg"]
+
+
+def test_request_iter_body_with_short_input():
+    """
+    Given a request with a body shorter than its declared length
+    When I iterate over the body
+    Then the chunks that are available are returned.
+    """
+    request = Request.blank("/", method="POST", body=b"abc")
+    request.environ["CONTENT_LENGTH"] = "10"
+
+    assert list(request.iter_body()) == [b"abc"]
+
+
+@pytest.mark.parametrize("max_memory_size,rolled_over", [(10, False), (5, True)])
+def test_request_spool_body(max_memory_size, rolled_over):
+    """
+    Given a request with a body
+    When I spool the body
+    Then the body is moved to disk only if it's larger than the memory limit
+    And the same file is returned each time, rewound.
+    """
+    request = Request.blank("/", method="POST", body=b"abcdefg")
+
+    body_file = request.spool_body(max_memory_size, chunk_size=2)
+
+    assert body_file.read() == b"abcdefg"
+    assert body_file._rolled == rolled_over  # pylint: disable=protected-access
+    assert request.spool_body() is body_file
+    assert body_file.read() == b"abcdefg"
+
+
+@pytest.mark.parametrize("declared_length", [True, False])
+def test_request_body_too_large(declared_length):
+    """
+    Given a request with a body larger than its maximum size
+    When I read the body
+    Then an exception is raised
+    And the body is not read if its declared length is too large.
+    """
+    request = Request.blank("/", method="POST", body=b"abcdefg")
+    request.max_body_size = 4
+    if not declared_length:
+        del request.environ["CONTENT_LENGTH"]
+        request.environ["wsgi.input_terminated"] = True
+
+    assert request.is_body_too_large() == declared_length
+
+    with pytest.raises(BodyTooLargeError, match="larger than 4 bytes"):
+        list(request.iter_body(chunk_size=2))
+
+    assert request.environ["wsgi.input"].read() == (
+        b"abcdefg" if declared_length else b"g"
+    )
+
+
+def test_request_body_within_limit():
+    """
+    Given a request with a body that is not larger than its maximum size
+    When I read the body
+    Then the body is returned.
+    """
+    request = Request.blank("/", method="POST", body=b"abcd")
+    request.max_body_size = 4
+
+    assert not request.is_body_too_large()
+    assert request.body == b"abcd"
+
+
+def test_request_webob_attributes():
+    """
+    Given a request
+    When I use attributes that are not implemented in the request
+    Then they are taken from the WebOb request
+    And custom attributes are stored in the environment.
+    """
+    request = Request.blank("/", headers={"Accept": "application/json"})
+
+    request.user = "john"
+
+    assert "application/json" in request.accept
+    assert request.user == "john"
+    assert WebObRequest(request.environ).user == "john"
+
+    with pytest.raises(AttributeError):
+        request._missing  # pylint: disable=protected-access,pointless-statement
+
+    with pytest.raises(AttributeError):
+        request.missing  # pylint: disable=pointless-statement
+
+
+def test_request_iter_multipart():
+    """
+    Given a request with a multipart body
+    When I iterate over the parts
+    Then the parts are parsed from the chunks of the body.
+    """
+    body = (
+        b"--b\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="a.txt"\r\n\r\n'
+        b"0123456789\r\n"
+        b"--b--\r\n"
+    )
+    request = Request.blank(
+        "/", method="POST", body=body, content_type="multipart/form-data; boundary=b"
+    )
+
+    parts = [
+        (part.filename, part.read()) for part in request.iter_multipart(chunk_size=3)
+    ]
+
+    assert parts == [("a.txt", b"0123456789")]
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/json", "multipart/form-data", "text/plain; boundary=b"],
+)
+def test_request_iter_multipart_without_multipart_body(content_type):
+    """
+    Given a request without a multipart body
+    When I iterate over the parts
+    Then an exception is raised.
+    """
+    request = Request.blank("/", method="POST", body=b"{}", content_type=content_type)
+
+    with pytest.raises(MultipartError, match="not multipart"):
+        request.iter_multipart()
@@ -0,0 +1,144 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from ramka.request import Request
+from ramka.response import Response, make_etag, not_modified
+from ramka.response.conditional import is_not_modified, make_not_modified
+
+LAST_MODIFIED = "Sun, 13 Sep 2020 12:26:40 GMT"
+
+
+def test_make_etag():
+    """
+    Given a body
+    When I create its ETag
+    Then the same body gets the same quoted ETag
+    And the ETag can be weak.
+    """
+    etag = make_etag(b"body")
+
+    assert etag == make_etag(b"body") != make_etag(b"other")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert make_etag(b"body", weak=True) == f"W/{etag}"
+
+
+@pytest.mark.parametrize(
+    "environ,etag,last_modified,expected",
+    [
+        ({"HTTP_IF_NONE_MATCH": '"a"'}, '"a"', None, True),
+        ({"HTTP_IF_NONE_MATCH": 'W/"b", W/"a"'}, '"a"', None, True),
+        ({"HTTP_IF_NONE_MATCH": '"a"'}, 'W/"a"', None, True),
+        ({"HTTP_IF_NONE_MATCH": "*"}, '"a"', None, True),
+        ({"HTTP_IF_NONE_MATCH": '"b"'}, '"a"', None, False),
+        ({"HTTP_IF_NONE_MATCH": '"a"'}, None, LAST_MODIFIED, False),
+        (
+            {
+                "HTTP_IF_NONE_MATCH": '"b"',
+                "HTTP_IF_MODIFIED_SINCE": LAST_MODIFIED,
+            },
+            '"a"',
+            LAST_MODIFIED,
+            False,
+        ),
+        ({"HTTP_IF_MODIFIED_SINCE": LAST_MODIFIED}, None, LAST_MODIFIED, True),
+        (
+            {"HTTP_IF_MODIFIED_SINCE": "Sun, 13 Sep 2020 12:26:39 GMT"},
+            None,
+            LAST_MODIFIED,
+            False,
+        ),
+        ({"HTTP_IF_MODIFIED_SINCE": "invalid"}, None, LAST_MODIFIED, False),
+        ({"HTTP_IF_MODIFIED_SINCE": LAST_MODIFIED}, None, None, False),
+        ({}, '"a"', LAST_MODIFIED, False),
+    ],
+)
+def test_is_not_modified(environ, etag, last_modified, expected):
+    """
+    Given a request with conditional headers
+    When I check if the client has the current version
+    Then `If-None-Match` is compared with the ETag using the weak comparison
+    And `If-Modified-Since` is compared with the date only without `If-None-Match`.
+    """
+    assert is_not_modified(environ, etag, last_modified) is expected
+
+
+def test_make_not_modified():
+    """
+    Given a response with a streamed body
+    When I turn it into the 304 response
+    Then the body is closed without reading it
+    And the headers that describe the body are removed.
+    """
+    app_iter = Mock()
+    response = Response(
+        app_iter=app_iter,
+        headerlist=[
+            ("Content-Type", "text/html"),
+            ("Content-Length", "10"),
+            ("Content-Encoding", "gzip"),
+            ("ETag", '"a"'),
+        ],
+    )
+
+    make_not_modified(response)
+
+    app_iter.close.assert_called_once_with()
+    assert response.status_code == 304
+    assert response.headerlist == [("ETag", '"a"')]
+    assert response.app_iter == []
+
+    make_not_modified(Response(app_iter=iter([])))
+
+
+def test_not_modified():
+    """
+    Given a request with `If-None-Match` header
+    When a view checks if the client has the current version
+    Then the ETag is set
+    And the response is turned into the 304 response if the ETag matches.
+    """
+    request = Request.blank("/", headers={"If-None-Match": '"v2"'})
+
+    response = Response()
+    assert not_modified(request, response, etag="v2")
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"v2"'
+
+    response = Response()
+    assert not not_modified(request, response, etag='W/"v3"')
+    assert response.status_code == 200
+    assert response.headers["ETag"] == 'W/"v3"'
+
+
+@pytest.mark.parametrize(
+    "last_modified",
+    [1_600_000_000, datetime(2020, 9, 13, 12, 26, 40, tzinfo=timezone.utc)],
+)
+def test_not_modified_with_last_modified(last_modified):
+    """
+    Given a request with `If-Modified-Since` header
+    When a view checks if the client has the current version using a date
+    Then the `Last-Modified` header is set
+    And the response is turned into the 304 response.
+    """
+    request = Request.blank("/", headers={"If-Modified-Since": LAST_MODIFIED})
+    response = Response()
+
+    assert not_modified(request, response, last_modified=last_modified)
+    assert response.headers["Last-Modified"] == LAST_MODIFIED
+    assert response.status_code == 304
+
+
+def test_not_modified_for_post_request():
+    """
+    Given a POST request with `If-None-Match` header
+    When a view checks if the client has the current version
+    Then the response is not changed.
+    """
+    request = Request.blank("/", method="POST", headers={"If-None-Match": "*"})
+    response = Response()
+
+    assert not not_modified(request, response, etag="v1")
+    assert response.status_code == 200
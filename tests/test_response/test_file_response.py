@@ -0,0 +1,335 @@
+import os
+import tempfile
+from email.utils import formatdate
+from unittest.mock import Mock
+
+import pytest
+
+from ramka.response import FileResponse
+from ramka.response.file_response import MAX_RANGES, _FileSlice, _parse_ranges
+
+DATA = bytes(range(256)) * 4
+
+
+@pytest.fixture(name="file_path")
+def file_path_fixture():
+    """Return the path of a sample file with a fixed modification time."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "video.mp4")
+        with open(path, "wb") as file:
+            file.write(DATA)
+
+        os.utime(path, (1_600_000_000, 1_600_000_000))
+        yield path
+
+
+def call(response, method="GET", **headers):
+    """Call the response as a WSGI application, return the status, headers and body."""
+    start_response = Mock()
+    environ = {"REQUEST_METHOD": method}
+    environ.update({f"HTTP_{name.upper()}": value for name, value in headers.items()})
+
+    body = response(environ, start_response)
+    data = b"".join(body)
+    getattr(body, "close", lambda: None)()
+
+    status, headerlist = start_response.call_args[0]
+    return status, dict(headerlist), data
+
+
+def test_file_response(file_path):
+    """
+    Given a file
+    When I send it as a response
+    Then the whole file is sent in chunks
+    And the headers describe the file.
+    """
+    response = FileResponse(file_path, chunk_size=100)
+
+    assert response.is_streaming
+    assert response.content_length == len(DATA)
+    status, headers, body = call(response)
+
+    assert status == "200 OK"
+    assert headers == {
+        "Content-Type": "video/mp4",
+        "Content-Length": str(len(DATA)),
+        "Last-Modified": "Sun, 13 Sep 2020 12:26:40 GMT",
+        "Accept-Ranges": "bytes",
+    }
+    assert body == DATA
+
+
+def test_file_response_with_file_object(file_path):
+    """
+    Given a file opened in binary mode
+    When I send it as a response
+    Then the file is sent
+    And it's closed afterwards.
+    """
+    file = open(file_path, "rb")  # pylint: disable=consider-using-with
+    response = FileResponse(
+        file, content_type="application/x-custom", filename="Zażółć.bin"
+    )
+
+    _, headers, body = call(response)
+
+    assert body == DATA
+    assert file.closed
+    assert headers["Content-Type"] == "application/x-custom"
+    assert headers["Content-Disposition"] == (
+        "attachment; filename*=UTF-8''Za%C5%BC%C3%B3%C5%82%C4%87.bin"
+    )
+
+
+def test_file_response_content_type_from_filename(file_path):
+    """
+    Given a file with a name that doesn't have a known type
+    When I create the response with or without a download name
+    Then the content type is guessed from the download name
+    And it's `application/octet-stream` by default.
+    """
+    path = f"{file_path}.unknown"
+    os.rename(file_path, path)
+
+    assert FileResponse(path).content_type == "application/octet-stream"
+    assert FileResponse(path, filename="a.pdf").content_type == "application/pdf"
+
+
+def test_file_response_with_file_wrapper(file_path):
+    """
+    Given a server that provides `wsgi.file_wrapper`
+    When I send a file
+    Then the file is passed to the wrapper with the chunk size.
+    """
+    file_wrapper = Mock()
+    response = FileResponse(file_path, chunk_size=100)
+
+    body = response(
+        {"REQUEST_METHOD": "GET", "wsgi.file_wrapper": file_wrapper}, Mock()
+    )
+
+    assert body is file_wrapper.return_value
+    file_slice, chunk_size = file_wrapper.call_args[0]
+    assert chunk_size == 100
+    assert os.fstat(file_slice.fileno()).st_size == len(DATA)
+    assert file_slice.read() == DATA
+    file_slice.close()
+
+
+def test_file_response_head(file_path):
+    """
+    Given a file
+    When I send it as a response to a HEAD request
+    Then only the headers are sent.
+    """
+    file = open(file_path, "rb")  # pylint: disable=consider-using-with
+
+    status, headers, body = call(FileResponse(file), "HEAD")
+
+    assert status == "200 OK"
+    assert headers["Content-Length"] == str(len(DATA))
+    assert body == b""
+    assert file.closed
+
+
+@pytest.mark.parametrize(
+    "headers,expected_status",
+    [
+        ({"if_modified_since": "Sun, 13 Sep 2020 12:26:40 GMT"}, "304 Not Modified"),
+        ({"if_modified_since": formatdate(2_000_000_000)}, "304 Not Modified"),
+        ({"if_modified_since": "Sun, 13 Sep 2020 12:26:39 GMT"}, "200 OK"),
+        ({"if_modified_since": "invalid"}, "200 OK"),
+        (
+            {
+                "if_modified_since": "Sun, 13 Sep 2020 12:26:40 GMT",
+                "if_none_match": '"tag"',
+            },
+            "200 OK",
+        ),
+    ],
+)
+def test_file_response_if_modified_since(file_path, headers, expected_status):
+    """
+    Given a request with the `If-Modified-Since` header
+    When I send a file
+    Then the 304 response without body is sent if the file has not been modified
+    And the file is sent otherwise.
+    """
+    status, response_headers, body = call(FileResponse(file_path), **headers)
+
+    assert status == expected_status
+    if expected_status == "304 Not Modified":
+        assert body == b""
+        assert "Content-Length" not in response_headers
+        assert "Last-Modified" in response_headers
+    else:
+        assert body == DATA
+
+
+@pytest.mark.parametrize(
+    "value,start,end",
+    [
+        ("bytes=0-99", 0, 100),
+        ("bytes=1000-", 1000, 1024),
+        ("bytes=-24", 1000, 1024),
+        ("bytes=-2000", 0, 1024),
+        ("bytes=1000-5000", 1000, 1024),
+    ],
+)
+def test_file_response_single_range(file_path, value, start, end):
+    """
+    Given a request for a single range of a file
+    When I send the file
+    Then only the range is sent with the 206 status.
+    """
+    status, headers, body = call(FileResponse(file_path), range=value)
+
+    assert status == "206 Partial Content"
+    assert headers["Content-Range"] == f"bytes {start}-{end - 1}/{len(DATA)}"
+    assert headers["Content-Length"] == str(end - start)
+    assert body == DATA[start:end]
+
+
+def test_file_response_single_range_with_file_wrapper(file_path):
+    """
+    Given a server that provides `wsgi.file_wrapper`
+    When I send a range of a file
+    Then the wrapper gets the file moved to the start of the range
+    And reading the file is limited to the range.
+    """
+    file_wrapper = Mock()
+
+    FileResponse(file_path)(
+        {
+            "REQUEST_METHOD": "GET",
+            "HTTP_RANGE": "bytes=100-199",
+            "wsgi.file_wrapper": file_wrapper,
+        },
+        Mock(),
+    )
+
+    file_slice = file_wrapper.call_args[0][0]
+    assert os.lseek(file_slice.fileno(), 0, os.SEEK_CUR) == 100
+    assert file_slice.read() == DATA[100:200]
+    file_slice.close()
+
+
+def test_file_response_multiple_ranges(file_path):
+    """
+    Given a request for multiple ranges of a file
+    When I send the file
+    Then the ranges are sent as `multipart/byteranges` body
+    And the length of the body is known.
+    """
+    status, headers, body = call(
+        FileResponse(file_path, chunk_size=30), range="bytes=0-49, 100-149,-10"
+    )
+
+    assert status == "206 Partial Content"
+    content_type, _, boundary = headers["Content-Type"].partition("; boundary=")
+    assert content_type == "multipart/byteranges"
+    assert headers["Content-Length"] == str(len(body))
+    assert body == b"".join(
+        [
+            f"\r\n--{boundary}\r\nContent-Type: video/mp4\r\n"
+            f"Content-Range: bytes {start}-{end - 1}/1024\r\n\r\n".encode()
+            + DATA[start:end]
+            for start, end in ((0, 50), (100, 150), (1014, 1024))
+        ]
+        + [f"\r\n--{boundary}--\r\n".encode()]
+    )
+
+
+def test_file_response_range_not_satisfiable(file_path):
+    """
+    Given a request for a range after the end of a file
+    When I send the file
+    Then the 416 response is sent.
+    """
+    status, headers, body = call(FileResponse(file_path), range="bytes=2000-")
+
+    assert status == "416 Range Not Satisfiable"
+    assert headers["Content-Range"] == "bytes */1024"
+    assert headers["Content-Length"] == "0"
+    assert body == b""
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"range": "items=0-1"},
+        {"range": "bytes=a-b"},
+        {"range": "bytes=-"},
+        {"range": "bytes=5-1"},
+        {"range": ",".join(["bytes=0-0"] + ["1-1"] * MAX_RANGES)},
+        {"range": "bytes=0-1", "if_range": "Mon, 14 Sep 2020 12:26:40 GMT"},
+    ],
+)
+def test_file_response_ignored_range(file_path, headers):
+    """
+    Given a request with an invalid `Range` header or with a stale `If-Range`
+    When I send the file
+    Then the whole file is sent.
+    """
+    status, _, body = call(FileResponse(file_path), **headers)
+
+    assert status == "200 OK"
+    assert body == DATA
+
+
+def test_file_response_range_with_matching_if_range(file_path):
+    """
+    Given a request with a range and `If-Range` with the date of the file
+    When I send the file
+    Then the range is sent.
+    """
+    status, _, body = call(
+        FileResponse(file_path),
+        range="bytes=0-1",
+        if_range="Sun, 13 Sep 2020 12:26:40 GMT",
+    )
+
+    assert status == "206 Partial Content"
+    assert body == DATA[:2]
+
+
+@pytest.mark.parametrize("method", ["POST", "GET"])
+def test_file_response_without_ranges(file_path, method):
+    """
+    Given a file response with other status or method, or a wrapped body
+    When I send it with a range request
+    Then the range is not handled.
+    """
+    response = FileResponse(file_path)
+    if method == "GET":
+        response.status_code = 404
+    response.wrap_app_iter(lambda parts: parts)
+
+    status, headers, body = call(response, method, range="bytes=0-1")
+
+    assert status in ("200 OK", "404 Not Found")
+    assert "Content-Length" not in headers
+    assert body == DATA
+
+
+def test_parse_ranges_of_empty_file():
+    """
+    Given an empty file
+    When I parse ranges
+    Then none of them can be satisfied.
+    """
+    assert not _parse_ranges("bytes=-10,0-", 0)
+
+
+def test_file_slice_of_shrunk_file(file_path):
+    """
+    Given a part of a file that has been truncated
+    When I read the part
+    Then the reading stops at the end of the file.
+    """
+    file_slice = _FileSlice(file_path, 1000, 100, 10)
+
+    assert b"".join(file_slice) == DATA[1000:]
+    assert file_slice.read() == b""
+    file_slice.close()
@@ -0,0 +1,371 @@
+from unittest.mock import Mock
+
+import pytest
+
+from ramka.response import JSONResponse, Response
+
+
+def call(response, method="GET"):
+    """Call the response as a WSGI application and return the sent response."""
+    start_response = Mock()
+    body = b"".join(response({"REQUEST_METHOD": method}, start_response))
+    status, headerlist = start_response.call_args.args
+    return status, headerlist, body
+
+
+def test_response_defaults():
+    """
+    Given a new response
+    When I call it
+    Then an empty HTML page is sent with the 200 status.
+    """
+    response = Response()
+
+    assert not hasattr(response, "__dict__")
+    assert call(response) == (
+        "200 OK",
+        [("Content-Type", "text/html; charset=UTF-8"), ("Content-Length", "0")],
+        b"",
+    )
+
+
+def test_response_text():
+    """
+    Given a response
+    When I set its text and status
+    Then the text is encoded using the charset
+    And the status line is sent.
+    """
+    response = Response()
+    response.status_code = 201
+    response.text = "Zażółć"
+
+    assert response.body == "Zażółć".encode("utf-8")
+    assert response.text == "Zażółć"
+    assert response.content_length == len(response.body)
+    assert call(response) == (
+        "201 Created",
+        [
+            ("Content-Type", "text/html; charset=UTF-8"),
+            ("Content-Length", str(len(response.body))),
+        ],
+        response.body,
+    )
+
+
+def test_response_json():
+    """
+    Given a response
+    When I set its content type and JSON body
+    Then the charset is dropped from the content type
+    And the body is compact JSON.
+    """
+    response = Response()
+    response.content_type = "application/json"
+    response.json = {"name": "John", "tags": [1, 2]}
+
+    assert response.content_type == "application/json"
+    assert response.charset is None
+    assert response.body == b'{"name":"John","tags":[1,2]}'
+    assert response.json == response.json_body == {"name": "John", "tags": [1, 2]}
+
+
+def test_response_json_serializer():
+    """
+    Given a response with a custom JSON serializer
+    When I set its JSON body
+    Then the body is serialized with that serializer.
+    """
+    serializer = Mock(return_value=b"[1]")
+    response = Response(json_serializer=serializer)
+
+    response.json = (1,)
+
+    serializer.assert_called_once_with((1,))
+    assert response.body == b"[1]"
+
+
+def test_json_response():
+    """
+    Given data
+    When I create a JSON response
+    Then the data is serialized to the body
+    And the content type is `application/json`.
+    """
+    response = JSONResponse({"name": "Zażółć"}, status=201)
+
+    assert call(response) == (
+        "201 Created",
+        [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len("Zażółć".encode()) + 11)),
+        ],
+        '{"name":"Zażółć"}'.encode(),
+    )
+    assert response.json == {"name": "Zażółć"}
+
+
+def test_json_response_with_headers_and_serializer():
+    """
+    Given data, headers and a JSON serializer
+    When I create a JSON response
+    Then the headers are used
+    And the data is serialized with the serializer.
+    """
+    response = JSONResponse(
+        [1], headerlist=[("X-Custom", "1")], json_serializer=lambda value: b"[]"
+    )
+
+    assert response.headerlist == [("X-Custom", "1")]
+    assert response.body == b"[]"
+
+
+@pytest.mark.parametrize(
+    "content_type,expected_header",
+    [
+        ("text/plain", "text/plain; charset=UTF-8"),
+        ("application/xml", "application/xml; charset=UTF-8"),
+        ("image/svg+xml", "image/svg+xml; charset=UTF-8"),
+        ("text/csv; header=present", "text/csv; header=present"),
+        ("image/png", "image/png"),
+    ],
+)
+def test_response_content_type(content_type, expected_header):
+    """
+    Given a response with the default content type
+    When I change the content type
+    Then the charset is kept only for text types.
+    """
+    response = Response()
+    response.content_type = content_type
+
+    assert response.headers["content-type"] == expected_header
+    assert response.content_type == content_type.split(";")[0]
+    assert response.charset == ("UTF-8" if "charset" in expected_header else None)
+
+
+def test_response_charset():
+    """
+    Given a response
+    When I change its charset
+    Then the text is encoded using the new charset.
+    """
+    response = Response(content_type="text/plain")
+    response.charset = "utf-16"
+    response.text = "Hi"
+
+    assert response.headers["Content-Type"] == "text/plain; charset=utf-16"
+    assert response.body == "Hi".encode("utf-16")
+
+    response.charset = None
+
+    assert response.headers["Content-Type"] == "text/plain"
+
+
+def test_response_without_content_type():
+    """
+    Given a response without the `Content-Type` header
+    When I set its charset
+    Then HTML content type is used.
+    """
+    response = Response(headerlist=[("X-Custom", "a")])
+
+    assert response.content_type is None
+    assert response.charset is None
+
+    response.charset = "latin-1"
+
+    assert response.headerlist == [
+        ("X-Custom", "a"),
+        ("Content-Type", "text/html; charset=latin-1"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "status,expected_status,expected_code",
+    [
+        (404, "404 Not Found", 404),
+        ("299 Custom Status", "299 Custom Status", 299),
+        (599, "599 Unknown Status", 599),
+    ],
+)
+def test_response_status(status, expected_status, expected_code):
+    """
+    Given a response
+    When I set its status using the code or the status line
+    Then both the status line and the code are updated.
+    """
+    response = Response(status=status)
+
+    assert response.status == expected_status
+    assert response.status_code == expected_code
+
+
+def test_response_headers():
+    """
+    Given a response
+    When I change its headers using the mapping
+    Then the list of headers is updated.
+    """
+    response = Response("Hi", headerlist=[("X-Custom", "a")])
+    response.headers["x-custom"] = "b"
+    response.headers.add("X-Other", "c")
+
+    assert response.headerlist == [("x-custom", "b"), ("X-Other", "c")]
+    assert response.headers.get("X-CUSTOM") == "b"
+
+
+def test_response_with_content_length_header():
+    """
+    Given a response with the `Content-Length` header
+    When I call it
+    Then the header is not added again
+    And it's removed when the body changes.
+    """
+    response = Response(b"abc", headerlist=[("Content-Length", "3")])
+
+    assert call(response)[1] == [("Content-Length", "3")]
+
+    response.body = b"abcd"
+
+    assert call(response)[1] == [("Content-Length", "4")]
+
+
+def test_response_body_must_be_bytes():
+    """
+    Given a response
+    When I set its body to text
+    Then an exception is raised.
+    """
+    with pytest.raises(TypeError, match="The body needs to be bytes, not str"):
+        Response().body = "text"
+
+
+def test_response_app_iter():
+    """
+    Given a response with an iterable body
+    When I call it
+    Then the parts of the body are sent without the `Content-Length` header
+    And the parts are joined when the body is used.
+    """
+    response = Response(app_iter=iter([b"a", b"b"]), headerlist=[])
+
+    assert response.content_length is None
+    assert call(response) == ("200 OK", [], b"ab")
+
+    response = Response(b"abc", headerlist=[("Content-Length", "3")])
+    response.app_iter = [b"a", b"b"]
+
+    assert response.headerlist == []
+    assert response.app_iter == [b"a", b"b"]
+    assert response.text == "ab"
+
+    app_iter = Mock(__iter__=Mock(return_value=iter([b"a", b"b"])))
+    response = Response(app_iter=app_iter, headerlist=[("Content-Length", "2")])
+
+    assert response.content_length == 2
+    assert response.body == b"ab"
+    assert response.app_iter == [b"ab"]
+    app_iter.close.assert_called_once_with()
+
+
+def test_response_app_iter_with_bytes():
+    """
+    Given a response
+    When I set the parts of the body to bytes or text
+    Then an exception is raised.
+    """
+    for value in (b"abc", "abc"):
+        with pytest.raises(TypeError, match="iterable of bytes"):
+            Response().app_iter = value
+
+
+def test_response_is_streaming():
+    """
+    Given responses with a body and with parts of the body
+    When I check if they are streaming
+    Then only the response with parts of the body that haven't been read is streaming.
+    """
+    response = Response(app_iter=iter([b"a"]))
+
+    assert not Response(b"abc").is_streaming
+    assert response.is_streaming
+    assert response.body == b"a"
+    assert not response.is_streaming
+
+
+def test_response_wrap_app_iter():
+    """
+    Given a response with a streamed body
+    When I wrap the parts of the body
+    Then they are not read until the response is sent
+    And closing the wrapped parts closes the original ones.
+    """
+    produced = []
+
+    def generate():
+        for part in (b"a", b"b"):
+            produced.append(part)
+            yield part
+
+    original = generate()
+    original_close = Mock(wraps=original.close)
+    app_iter = Mock(__iter__=Mock(return_value=original), close=original_close)
+    response = Response(app_iter=app_iter, headerlist=[])
+
+    response.wrap_app_iter(lambda parts: (part.upper() for part in parts))
+
+    assert response.is_streaming
+    assert not produced
+    body = response(environ={}, start_response=Mock())
+    assert list(body) == [b"A", b"B"]
+    body.close()
+    original_close.assert_called_once_with()
+
+
+def test_response_wrap_body():
+    """
+    Given a response with a body
+    When I wrap the parts of the body
+    Then the body is streamed.
+    """
+    response = Response(b"abc", headerlist=[])
+
+    response.wrap_app_iter(lambda parts: (part[::-1] for part in parts))
+
+    assert call(response) == ("200 OK", [], b"cba")
+
+
+def test_response_head_request():
+    """
+    Given a response with an iterable body
+    When I call it for a HEAD request
+    Then the body is not sent
+    And the iterable is closed.
+    """
+    app_iter = Mock()
+    response = Response(app_iter=app_iter)
+
+    assert call(response, "HEAD") == (
+        "200 OK",
+        [("Content-Type", "text/html; charset=UTF-8")],
+        b"",
+    )
+    app_iter.close.assert_called_once_with()
+
+    assert call(Response(b"abc"), "HEAD")[2] == b""
+
+
+def test_response_cookies():
+    """
+    Given a response
+    When I set and delete cookies
+    Then the `Set-Cookie` headers are added.
+    """
+    response = Response()
+    response.set_cookie("session", "abc", httponly=True)
+    response.delete_cookie("theme")
+
+    cookies = response.headers.getall("Set-Cookie")
+    assert cookies[0] == "session=abc; Path=/; HttpOnly"
+    assert cookies[1].startswith("theme=; Max-Age=0; Path=/; expires=")
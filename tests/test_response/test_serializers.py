@@ -0,0 +1,41 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from ramka.response.serializers import (
+    get_default_json_serializer,
+    stdlib_json_serializer,
+)
+
+
+def test_stdlib_json_serializer():
+    """
+    Given a value
+    When I serialize it with the standard library serializer
+    Then the value is serialized to compact JSON encoded using UTF-8.
+    """
+    value = {"name": "Zażółć", "tags": [1, 2]}
+
+    assert stdlib_json_serializer(value) == '{"name":"Zażółć","tags":[1,2]}'.encode()
+
+
+def test_default_json_serializer():
+    """
+    Given `orjson` is installed
+    When I get the default JSON serializer
+    Then `orjson` is used.
+    """
+    orjson = pytest.importorskip("orjson")
+
+    assert get_default_json_serializer() is orjson.dumps
+
+
+def test_default_json_serializer_without_orjson():
+    """
+    Given `orjson` is not installed
+    When I get the default JSON serializer
+    Then the standard library is used.
+    """
+    with patch.dict(sys.modules, {"orjson": None}):
+        assert get_default_json_serializer() is stdlib_json_serializer
@@ -0,0 +1,64 @@
+import pytest
+
+from ramka.routing import Converter, RegexRouter, register_converter
+from ramka.routing.converters import CONVERTERS
+
+
+@pytest.fixture
+def restore_converters():
+    """Remove the converters registered in a test."""
+    converters = dict(CONVERTERS)
+    yield
+    CONVERTERS.clear()
+    CONVERTERS.update(converters)
+
+
+def test_converter():
+    """
+    When I create a converter
+    Then its regular expression is compiled.
+    """
+    converter = Converter(r"[01]+", lambda value: int(value, 2))
+
+    assert converter.matcher.fullmatch("101")
+    assert converter.to_python("101") == 5
+    assert not converter.multi_segment
+    assert repr(converter).startswith("Converter('[01]+'")
+
+
+def test_converter_with_capturing_groups():
+    """
+    When I create a converter with capturing groups in its regular expression
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        Converter(r"(a|b)+")
+
+
+def test_register_converter(
+    restore_converters, sample_func_view
+):  # pylint: disable=redefined-outer-name,unused-argument
+    """
+    Given a custom converter
+    When I register it
+    Then it can be used in route paths.
+    """
+    register_converter("bin", Converter(r"[01]+", lambda value: int(value, 2)))
+
+    router = RegexRouter()
+    router.add_route("/numbers/{number:bin}/", sample_func_view)
+
+    assert router.resolve("/numbers/101/").params == {"number": 5}
+    assert router.resolve("/numbers/123/") is None
+
+
+@pytest.mark.parametrize("name", ("", "int", "a:b", "a/b", "{a}"))
+def test_register_converter_with_invalid_name(
+    restore_converters, name
+):  # pylint: disable=redefined-outer-name,unused-argument
+    """
+    When I register a converter with an invalid or already registered name
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        register_converter(name, Converter(r"\d+"))
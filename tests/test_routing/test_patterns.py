@@ -0,0 +1,175 @@
+from uuid import UUID
+
+import pytest
+
+from ramka.routing.patterns import PathPattern, pattern_key, patterns_can_overlap
+
+
+@pytest.mark.parametrize(
+    "path,value,expected_params",
+    (
+        ("/users/", "/users/", {}),
+        ("/users/{name}/", "/users/john/", {"name": "john"}),
+        ("/users/{name:str}/", "/users/john/", {"name": "john"}),
+        ("/files/{name:path}/", "/files/john/doe/", {"name": "john/doe"}),
+        ("/users/{id:d}/", "/users/-12/", {"id": -12}),
+        ("/users/{id:int}/", "/users/12/", {"id": 12}),
+        ("/prices/{price:f}/", "/prices/1.5/", {"price": 1.5}),
+        ("/prices/{price:float}/", "/prices/3/", {"price": 3.0}),
+        ("/posts/{slug:slug}/", "/posts/my-post_1/", {"slug": "my-post_1"}),
+        (
+            "/orders/{id:uuid}/",
+            "/orders/12345678-1234-5678-1234-567812345678/",
+            {"id": UUID("12345678-1234-5678-1234-567812345678")},
+        ),
+        ("/tags/{tag:l}/", "/tags/python/", {"tag": "python"}),
+        ("/tags/{tag:w}/", "/tags/py_3/", {"tag": "py_3"}),
+        ("/tags/{tag:W}/", "/tags/-+-/", {"tag": "-+-"}),
+        ("/tags/{tag:S}/", "/tags/a.b/", {"tag": "a.b"}),
+        ("/files/{}/{name}.{ext}", "/files/x/a.txt", {"name": "a", "ext": "txt"}),
+        ("/files/{:d}/", "/files/1/", {}),
+        ("/{{literal}}/", "/{literal}/", {}),
+        ("/a.b/", "/a.b/", {}),
+    ),
+)
+def test_path_pattern_match(path, value, expected_params):
+    """
+    Given a path pattern
+    When I match a value against its regular expression
+    Then the value matches
+    And the parameters are converted to correct types.
+    """
+    pattern = PathPattern(path)
+    match = pattern.regex.fullmatch(value)
+
+    assert match is not None
+    assert pattern.convert(match.groups()) == expected_params
+
+
+@pytest.mark.parametrize(
+    "path,value",
+    (
+        ("/users/{id:d}/", "/users/john/"),
+        ("/users/{name}/", "/users/john/doe/"),
+        ("/tags/{tag:S}/", "/tags/a/b/"),
+        ("/posts/{slug:slug}/", "/posts/my.post/"),
+        ("/orders/{id:uuid}/", "/orders/1234/"),
+        ("/a.b/", "/aXb/"),
+        ("/{{literal}}/", "/literal/"),
+        ("/users/", "/Users/"),
+    ),
+)
+def test_path_pattern_no_match(path, value):
+    """
+    Given a path pattern
+    When I match a value that does not fit the pattern
+    Then there is no match.
+    """
+    assert PathPattern(path).regex.fullmatch(value) is None
+
+
+@pytest.mark.parametrize("path", ("/users/{id:x}/", "/users/{id}/{id:d}/"))
+def test_path_pattern_invalid(path):
+    """
+    Given a path with an unsupported parameter type or a duplicated parameter
+    When I create a path pattern
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        PathPattern(path)
+
+
+def test_path_pattern_regex_compiled_once():
+    """
+    Given a path pattern
+    When I get its regular expression more than once
+    Then the same compiled expression is returned
+    And it's equal to the expression of the same pattern built separately.
+    """
+    pattern = PathPattern("/users/{id:d}/")
+    regex = pattern.regex
+
+    assert pattern.regex is regex
+    assert PathPattern("/users/{id:d}/").regex == regex
+
+
+@pytest.mark.parametrize(
+    "first_path,second_path,expected_result",
+    (
+        ("/users/{id}/", "/users/{name}/", True),
+        ("/users/{id:d}/", "/users/{pk:d}/", True),
+        ("/users/{id:d}/", "/users/{id}/", False),
+        ("/{{users}}/", "/{{users}}/", True),
+        ("/{{users}}/", "/{users}/", False),
+        ("/users/", "/users/", True),
+        ("/users/", "/posts/", False),
+        ("/users/{id:d}/", "/users/{pk:int}/", True),
+        ("/users/{name}/", "/users/{name:str}/", True),
+    ),
+)
+def test_pattern_key(first_path, second_path, expected_result):
+    """
+    Given two paths
+    When I compare their pattern keys
+    Then the keys are equal only if the paths differ only in names of the parameters.
+    """
+    assert (pattern_key(first_path) == pattern_key(second_path)) is expected_result
+
+
+def test_pattern_key_with_unsupported_type():
+    """
+    Given a path with an unsupported parameter type
+    When I get its pattern key
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        pattern_key("/users/{id:x}/")
+
+
+@pytest.mark.parametrize(
+    "value,expected_params",
+    (("/users/12/", {"id": 12}), ("/users/john/", None), ("/users/12/x/", None)),
+)
+def test_path_pattern_match_method(value, expected_params):
+    """
+    Given a path pattern
+    When I match a value using the `match` method
+    Then the converted parameters are returned if the whole value matches.
+    """
+    assert PathPattern("/users/{id:int}/").match(value) == expected_params
+
+
+def test_path_pattern_multi_segment():
+    """
+    Given paths with and without multi-segment parameters
+    When I create path patterns
+    Then only the patterns with multi-segment parameters are marked as such.
+    """
+    assert PathPattern("/files/{:path}").multi_segment
+    assert not PathPattern("/files/{name}/{id:d}").multi_segment
+
+
+@pytest.mark.parametrize(
+    "first_path,second_path,expected_result",
+    (
+        ("/users/{id:d}/", "/users/{name}/", True),
+        ("/users/{id:d}/", "/posts/{id:d}/", False),
+        ("/users/{id:d}/", "/users/{id:d}/posts/", False),
+        ("/users/me/", "/users/{id:d}/", False),
+        ("/users/{id:d}/", "/users/12/", True),
+        ("/users/{{id}}/{x}", "/users/{{id}}/{y}", True),
+        ("/files/{path:path}/", "/users/{id:d}/", True),
+        ("/users/{id:d}/", "/files/{path:path}", True),
+    ),
+)
+def test_patterns_can_overlap(first_path, second_path, expected_result):
+    """
+    Given two path patterns
+    When I check if they can overlap
+    Then the result is False only if no path can match both patterns.
+    """
+    first = PathPattern(first_path)
+    second = PathPattern(second_path)
+
+    assert patterns_can_overlap(first, second) is expected_result
+    assert patterns_can_overlap(first=second, second=first) is expected_result
@@ -0,0 +1,128 @@
+import pytest
+
+from ramka.routing import RegexRouter
+
+
+def test_regex_router_add_route(sample_func_view):
+    """
+    Given a regex router
+    When I add a route using `add_route` method
+    Then the router should have the route.
+    And that route should have the correct path and view.
+    """
+    router = RegexRouter()
+
+    assert not router.routes
+
+    router.add_route("/users", sample_func_view)
+
+    assert len(router.routes) == 1
+
+    route = router.routes[0]
+    assert route.path == "/users/"
+    assert route.view == sample_func_view
+
+
+def test_regex_router_add_route_with_existing_path(sample_func_view):
+    """
+    Given a regex router with a route
+    When I add a route with the same pattern
+    Then an AttributeError should be raised.
+    """
+    router = RegexRouter()
+    router.add_route("/users/{id:d}/", sample_func_view)
+
+    with pytest.raises(AttributeError):
+        router.add_route("/users/{user_id:d}", sample_func_view)
+
+
+def test_regex_router_resolve_without_routes():
+    """
+    Given a regex router without any routes
+    When I resolve a path
+    Then `None` should be returned.
+    """
+    assert RegexRouter().resolve("/") is None
+
+
+@pytest.mark.parametrize(
+    "path,expected_route,expected_params",
+    (
+        ("/", "/", {}),
+        ("/users/12", "/users/{id:d}/", {"id": 12}),
+        ("/users/john/", "/users/{name}/", {"name": "john"}),
+        ("/add/3/4/", "/add/{first:d}/{second:d}/", {"first": 3, "second": 4}),
+        (
+            "/files/a/report.pdf/",
+            "/files/{path:path}.{ext:w}/",
+            {"path": "a/report", "ext": "pdf"},
+        ),
+    ),
+)
+def test_regex_router_resolve(sample_func_view, path, expected_route, expected_params):
+    """
+    Given a regex router with static and dynamic routes
+    When I resolve a path
+    Then the correct route is returned
+    And the parameters are converted to correct types.
+    """
+    router = RegexRouter()
+    router.add_route("/", sample_func_view)
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/users/{name}/", sample_func_view)
+    router.add_route("/add/{first:d}/{second:d}/", sample_func_view)
+    router.add_route("/files/{path:path}.{ext:w}/", sample_func_view)
+
+    resolved_route = router.resolve(path)
+
+    assert resolved_route.path == expected_route
+    assert resolved_route.params == expected_params
+
+
+def test_regex_router_resolve_uses_registration_order(sample_func_view):
+    """
+    Given a regex router with overlapping routes
+    When I resolve a path that matches more than one route
+    Then the route that has been added first is returned.
+    """
+    router = RegexRouter()
+    router.add_route("/items/{name:w}/", sample_func_view)
+    router.add_route("/items/{id:d}/", sample_func_view)
+
+    assert router.resolve("/items/5/").path == "/items/{name:w}/"
+    assert router.resolve("/items/5/").params == {"name": "5"}
+
+
+def test_regex_router_recompiles_after_adding_route(sample_func_view):
+    """
+    Given a regex router that has already resolved a path
+    When I add another route
+    Then the new route can be resolved.
+    """
+    router = RegexRouter()
+    router.add_route("/users/", sample_func_view)
+
+    assert router.resolve("/posts/") is None
+
+    router.add_route("/posts/", sample_func_view)
+
+    assert router.resolve("/posts/").path == "/posts/"
+
+
+def test_regex_router_remove_route(sample_func_view):
+    """
+    Given a regex router that has already resolved a path
+    When I remove a route
+    Then its path can't be resolved anymore
+    And the other routes are kept.
+    """
+    router = RegexRouter()
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/posts/{id:d}/", sample_func_view)
+
+    assert router.resolve("/users/1/").params == {"id": 1}
+
+    router.remove_route("/users/{id:d}/")
+
+    assert router.resolve("/users/1/") is None
+    assert router.resolve("/posts/1/").params == {"id": 1}
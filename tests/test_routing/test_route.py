@@ -1,6 +1,11 @@
+from threading import Thread
+from unittest.mock import Mock, patch
+
 import pytest
 
+from ramka.middleware import CompressionMiddleware, ConditionalGetMiddleware
 from ramka.routing import ResolvedRoute, Route
+from ramka.views import BaseView
 
 
 def test_get_handler_with_class_based_view(sample_class_view):
@@ -59,7 +64,7 @@ def test_get_handler_with_incorrect_handler():
     When I get the handler for the route
     Then an AttributeError should be raised.
     """
-    route = Route("/sample_route", "incorrect_handler")
+    route = Route("/sample_route", object())
 
     with pytest.raises(AttributeError):
         route.get_handler("get")
@@ -100,3 +105,348 @@ def test_resolved_route_str_representation(sample_class_view):
     resolved_route = ResolvedRoute.from_route(route, params={"a": "1", "b": "2"})
 
     assert str(resolved_route) == f"/sample_route ? a=1&b=2 -> {str(sample_class_view)}"
+
+
+def test_route_handlers_with_class_based_view():
+    """
+    Given a class-based view that implements some of the HTTP methods
+    When I create a route for the view
+    Then only the implemented methods are allowed
+    And the `Allow` header value is precomputed.
+    """
+
+    class SampleView(BaseView):  # pylint: disable=abstract-method
+        """Class-based view with two HTTP methods implemented."""
+
+        def get(self, request, response, **kwargs):  # pylint: disable=unused-argument
+            response.text = "GET"
+
+        @staticmethod
+        def options(request, response, **kwargs):  # pylint: disable=unused-argument
+            """Static method handler of the OPTIONS method."""
+            response.text = "OPTIONS"
+
+    route = Route("/sample_route", SampleView)
+
+    assert set(route.handlers) == {"GET", "OPTIONS"}
+    assert route.allowed_methods == frozenset({"GET", "OPTIONS"})
+    assert route.allow == "GET, OPTIONS"
+    assert route.find_handler("put") is None
+
+    response = Mock()
+    route.find_handler("options")(Mock(), response)
+    assert response.text == "OPTIONS"
+
+
+def test_route_handlers_with_function_view(sample_func_view):
+    """
+    Given a function-based view with methods given in upper case
+    When I create a route for the view
+    Then the given methods are allowed.
+    """
+    route = Route("/sample_route", sample_func_view, ["GET", "POST"])
+
+    assert route.allowed_methods == frozenset({"GET", "POST"})
+    assert route.find_handler("post") is sample_func_view
+    assert route.find_handler("delete") is None
+
+
+def test_route_middleware(sample_func_view):
+    """
+    Given a route with middleware added and excluded
+    When I resolve the route and pickle it
+    Then the resolved route shares the compiled chains of middleware with the route
+    And the compiled chains are not pickled.
+    """
+    route = Route(
+        "/users/",
+        sample_func_view,
+        middleware=[CompressionMiddleware],
+        exclude_middleware=[ConditionalGetMiddleware],
+    )
+    route.middleware_pipelines["app"] = ((), Mock(), ())
+
+    resolved_route = ResolvedRoute.from_route(route, {})
+
+    assert route.middleware == (CompressionMiddleware,)
+    assert route.exclude_middleware == (ConditionalGetMiddleware,)
+    assert resolved_route.middleware_pipelines is route.middleware_pipelines
+    assert not Route("/", sample_func_view).middleware_pipelines
+    assert "middleware_pipelines" not in set(route.__getstate__())
+
+
+def test_resolved_route_init(sample_func_view):
+    """
+    When I create a resolved route
+    Then it has the handlers and the parameters.
+    """
+    resolved_route = ResolvedRoute("/users/{id}", sample_func_view, None, {"id": "1"})
+
+    assert resolved_route.params == {"id": "1"}
+    assert resolved_route.find_handler("GET") is sample_func_view
+
+
+@pytest.mark.parametrize(
+    "lifecycle,expected_instances", (("per_request", 3), ("singleton", 1))
+)
+def test_route_view_lifecycle(lifecycle, expected_instances):
+    """
+    Given a route for a class-based view with a lifecycle set
+    When I get the handler multiple times
+    Then the instances of the view are created according to the lifecycle.
+    """
+    instances = []
+
+    class SampleView(BaseView):  # pylint: disable=abstract-method
+        """Class-based view that records its instances."""
+
+        def __init__(self):
+            instances.append(self)
+
+        def get(self, request, response, **kwargs):  # pylint: disable=unused-argument
+            response.text = "GET"
+
+    route = Route("/sample_route", SampleView, lifecycle=lifecycle)
+    for _ in range(3):
+        route.find_handler("GET")
+
+    assert route.lifecycle == lifecycle
+    assert len(instances) == expected_instances
+
+
+def test_route_view_lifecycle_thread_local():
+    """
+    Given a route for a class-based view with the `thread_local` lifecycle set in
+        the view
+    When I get the handler in different threads
+    Then each thread gets its own instance of the view
+    And the instance is reused within the thread.
+    """
+
+    class SampleView(BaseView):  # pylint: disable=abstract-method
+        """Class-based view with instances reused within a thread."""
+
+        lifecycle = "thread_local"
+
+        def get(self, request, response, **kwargs):  # pylint: disable=unused-argument
+            response.text = "GET"
+
+    route = Route("/sample_route", SampleView)
+    instances = []
+
+    def get_instances():
+        instances.append(route.find_handler("GET").__self__)
+        instances.append(route.find_handler("GET").__self__)
+
+    thread = Thread(target=get_instances)
+    thread.start()
+    thread.join()
+    get_instances()
+
+    assert route.lifecycle == "thread_local"
+    assert instances[0] is instances[1]
+    assert instances[2] is instances[3]
+    assert instances[0] is not instances[2]
+
+
+def test_route_shares_view_instance_with_resolved_routes(sample_class_view):
+    """
+    Given a route for a class-based view with the `singleton` lifecycle
+    When I get handlers of the route and of a route resolved from it
+    Then both are bound to the same instance of the view.
+    """
+    route = Route("/sample_route", sample_class_view, lifecycle="singleton")
+    resolved_route = ResolvedRoute.from_route(route, {})
+
+    assert (
+        route.find_handler("GET").__self__
+        is resolved_route.find_handler("GET").__self__
+    )
+
+
+def test_route_with_unsupported_view_lifecycle(sample_class_view):
+    """
+    When I create a route with an unsupported view lifecycle
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        Route("/sample_route", sample_class_view, lifecycle="pooled")
+
+
+def test_route_singleton_view_created_once_when_threads_race():
+    """
+    Given a route for a class-based view with the `singleton` lifecycle
+    When another thread creates the instance of the view while the lock is acquired
+    Then the instance created by the other thread is used.
+    """
+    instances = []
+
+    class SampleView(BaseView):  # pylint: disable=abstract-method
+        """Class-based view that records its instances."""
+
+        def __init__(self):
+            instances.append(self)
+
+        def get(self, request, response, **kwargs):  # pylint: disable=unused-argument
+            response.text = "GET"
+
+    class RacingLock:
+        """Lock that lets another thread get the view before it's acquired."""
+
+        raced = False
+
+        def __enter__(self):
+            if not RacingLock.raced:
+                RacingLock.raced = True
+                route.find_handler("GET")
+
+        def __exit__(self, *args):
+            pass
+
+    with patch("ramka.routing.route.Lock", RacingLock):
+        route = Route("/sample_route", SampleView, lifecycle="singleton")
+
+    handler = route.find_handler("GET")
+
+    assert len(instances) == 1
+    assert handler.__self__ is instances[0]
+
+
+def sample_lazy_view(request, response):  # pylint: disable=unused-argument
+    """Sample function-based view imported using its dotted path."""
+    response.text = "Lazy"
+
+
+class SampleLazyView(BaseView):  # pylint: disable=abstract-method
+    """Sample class-based view imported using its dotted path."""
+
+    lifecycle = "singleton"
+
+    def post(self, request, response, **kwargs):  # pylint: disable=unused-argument
+        response.text = "Lazy POST"
+
+
+@pytest.mark.parametrize(
+    "reference",
+    (f"{__name__}:sample_lazy_view", f"{__name__}.sample_lazy_view"),
+)
+def test_route_with_view_reference(reference):
+    """
+    Given a route with a function-based view given as a dotted path
+    When I find a handler for the route
+    Then the view is imported and used as the handler.
+    """
+    route = Route("/sample_route", reference)
+
+    assert not route.is_loaded
+    assert route.reference == f"{__name__}:sample_lazy_view"
+    assert str(route) == f"/sample_route -> {__name__}:sample_lazy_view"
+
+    assert route.find_handler("GET") is sample_lazy_view
+    assert route.is_loaded
+    assert route.view is sample_lazy_view
+
+
+def test_route_with_class_view_reference():
+    """
+    Given a route with a class-based view given as a dotted path
+    And a route resolved from it before the view is imported
+    When I find handlers for both routes
+    Then the view is imported once and shared by both routes.
+    """
+    route = Route("/sample_route", f"{__name__}:SampleLazyView")
+    resolved_route = ResolvedRoute.from_route(route, {})
+
+    assert resolved_route.get_handler("POST").__self__ is (
+        route.find_handler("POST").__self__
+    )
+    assert route.lifecycle == "singleton"
+    assert route.allow == "POST"
+    assert route.allowed_methods == {"POST"}
+    assert set(route.handlers) == {"POST"}
+    assert route.reference == f"{__name__}:SampleLazyView"
+
+
+def test_route_load():
+    """
+    Given a route with a view given as a dotted path
+    When I load the route
+    Then the view is imported.
+    """
+    route = Route("/sample_route", f"{__name__}:SampleLazyView")
+
+    route.load()
+    route.load()
+
+    assert route.is_loaded
+    assert route.view is SampleLazyView
+
+
+@pytest.mark.parametrize(
+    "reference,lifecycle",
+    (("view", None), ("app.views:", None), ("app views:View", None), ("a:b", "x")),
+)
+def test_route_with_invalid_view_reference(reference, lifecycle):
+    """
+    When I create a route with an invalid dotted path of the view or lifecycle
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        Route("/sample_route", reference, lifecycle=lifecycle)
+
+
+def test_route_with_negative_max_body_size(sample_func_view):
+    """
+    When I create a route with a negative maximum body size
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError, match="Maximum body size can't be negative"):
+        Route("/sample_route", sample_func_view, max_body_size=-1)
+
+
+@pytest.mark.parametrize(
+    "reference,error_class",
+    (
+        ("ramka.not_existing:View", ImportError),
+        ("ramka.views:NotExistingView", AttributeError),
+    ),
+)
+def test_route_with_view_reference_that_cannot_be_imported(reference, error_class):
+    """
+    Given a route with a dotted path of a view that can't be imported
+    When I find the handler for the route
+    Then the import error is raised.
+    """
+    route = Route("/sample_route", reference)
+
+    with pytest.raises(error_class):
+        route.find_handler("GET")
+
+    assert not route.is_loaded
+
+
+def test_route_view_reference_loaded_once_when_threads_race():
+    """
+    Given a route with a view given as a dotted path
+    When another thread imports the view while the lock is acquired
+    Then the view imported by the other thread is used.
+    """
+    route = Route("/sample_route", f"{__name__}:SampleLazyView")
+
+    class RacingLock:
+        """Lock that lets another thread load the view before it's acquired."""
+
+        raced = False
+
+        def __enter__(self):
+            if not RacingLock.raced:
+                RacingLock.raced = True
+                route.load()
+
+        def __exit__(self, *args):
+            pass
+
+    with patch("ramka.routing.route._ViewTarget._load_lock", RacingLock()):
+        handlers = route.handlers
+
+    assert set(handlers) == {"POST"}
@@ -1,6 +1,15 @@
+from unittest.mock import patch
+
 import pytest
 
-from ramka.routing import SimpleRouter
+from ramka.routing import (
+    RegexRouter,
+    RouterCacheInfo,
+    RouterStats,
+    SimpleRouter,
+    TrieRouter,
+)
+from ramka.routing.patterns import patterns_can_overlap
 
 
 def test_simple_router_add_route(sample_func_view):
@@ -102,3 +111,634 @@ def test_simple_router_handle_trailing_slashes(
 
     # pylint: disable=protected-access
     assert router._handle_trailing_slashes(path) == expected_result
+
+
+def test_simple_router_resolve_static_route_without_parsing(sample_func_view):
+    """
+    Given a router with a route without parameters
+    When I resolve the path of that route
+    Then the route is returned with empty parameters
+    And routes with parameters are not checked.
+    """
+    router = SimpleRouter()
+    router.add_route("/health", sample_func_view)
+
+    with patch.object(router, "_resolve_dynamic") as mock_resolve_dynamic:
+        resolved_route = router.resolve("/health")
+
+    assert resolved_route.path == "/health/"
+    assert resolved_route.params == {}
+    mock_resolve_dynamic.assert_not_called()
+
+
+def test_simple_router_resolve_static_route_with_escaped_braces(sample_func_view):
+    """
+    Given a router with a route that contains escaped braces
+    When I resolve the path with single braces
+    Then the route is returned.
+    """
+    router = SimpleRouter()
+    router.add_route("/{{braces}}/", sample_func_view)
+
+    assert router.resolve("/{braces}/").path == "/{{braces}}/"
+
+
+@pytest.mark.parametrize("router_class", (SimpleRouter, TrieRouter, RegexRouter))
+def test_router_resolve_is_case_sensitive(router_class, sample_func_view):
+    """
+    Given a router with routes with and without parameters
+    When I resolve paths that differ from the routes only in letter case
+    Then no route is returned
+    And values of parameters keep their case.
+    """
+    router = router_class()
+    router.add_route("/health/", sample_func_view)
+    router.add_route("/users/{name}/", sample_func_view)
+
+    assert router.resolve("/Health/") is None
+    assert router.resolve("/USERS/john/") is None
+    assert router.resolve("/users/John/").params == {"name": "John"}
+
+
+@pytest.mark.parametrize("router_class", (SimpleRouter, TrieRouter, RegexRouter))
+@pytest.mark.parametrize("count", (10, 1000))
+def test_router_routes_added_one_by_one(router_class, count, sample_func_view):
+    """
+    Given a router
+    When I add many routes one by one with the `route` decorator
+    Then the table of routes is built only once, when a path is resolved
+    And all routes can be resolved.
+    """
+    router = router_class()
+
+    with patch.object(
+        router,
+        "_extend_dynamic",
+        wraps=router._extend_dynamic,  # pylint: disable=protected-access
+    ) as mock_extend_dynamic:
+        for index in range(count):
+            router.route(f"/items/{index}/{{id:int}}/")(sample_func_view)
+            router.route(f"/pages/{index}/")(sample_func_view)
+
+        mock_extend_dynamic.assert_not_called()
+        assert router.resolve(f"/items/{count - 1}/3/").params == {"id": 3}
+        assert router.resolve("/pages/0/").path == "/pages/0/"
+
+    mock_extend_dynamic.assert_called_once()
+    assert len(router.routes) == 2 * count
+
+    router.route("/items/{name}/")(sample_func_view)
+
+    assert router.resolve("/items/abc/").params == {"name": "abc"}
+    with pytest.raises(AttributeError):
+        router.add_routes(
+            [("/other/", sample_func_view), ("/items/{slug}/", sample_func_view)]
+        )
+    assert not router.has_route("/other/")
+
+
+def test_simple_router_resolve_keeps_registration_order(sample_func_view):
+    """
+    Given a router with a route without parameters
+    And a route with parameters added later that matches the same path
+    When I resolve the path
+    Then the route that has been added first is returned.
+    """
+    router = SimpleRouter()
+    router.add_route("/users/me/", sample_func_view)
+    router.add_route("/users/{name}/", sample_func_view)
+
+    assert router.resolve("/users/me/").path == "/users/me/"
+    assert router.resolve("/users/john/").params == {"name": "john"}
+
+
+def test_simple_router_static_route_shadowed_by_dynamic_route(sample_func_view):
+    """
+    Given a router with a route with parameters
+    When I add a route without parameters that is also handled by that route
+    And I resolve the path of the new route
+    Then the route that has been added first is returned
+    And the check is done only once.
+    """
+    router = SimpleRouter()
+    router.add_route("/users/{name}/", sample_func_view)
+    router.add_route("/users/me/", sample_func_view)
+    router.add_route("/posts/latest/", sample_func_view)
+
+    resolve_dynamic = router._resolve_dynamic  # pylint: disable=protected-access
+    with patch.object(
+        router, "_resolve_dynamic", wraps=resolve_dynamic
+    ) as mock_resolve_dynamic:
+        assert router.resolve("/users/me/").path == "/users/{name}/"
+        assert router.resolve("/users/me/").params == {"name": "me"}
+        assert router.resolve("/posts/latest/").path == "/posts/latest/"
+        assert router.resolve("/posts/latest/").path == "/posts/latest/"
+
+    assert mock_resolve_dynamic.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "first_path,second_path",
+    (
+        ("/users/", "/users"),
+        ("/users/{id}/", "/users/{name}/"),
+        ("/users/{id:d}/", "/users/{pk:d}"),
+        ("/{{users}}/", "/{{users}}/"),
+    ),
+)
+def test_simple_router_add_route_with_same_pattern(
+    sample_func_view, first_path, second_path
+):
+    """
+    Given a router with a route
+    When I add a route with a path that differs only in names of the parameters
+    Then an AttributeError should be raised.
+    """
+    router = SimpleRouter()
+    router.add_route(first_path, sample_func_view)
+
+    with pytest.raises(AttributeError):
+        router.add_route(second_path, sample_func_view)
+
+
+def test_simple_router_add_route_with_overlapping_pattern(sample_func_view):
+    """
+    Given a router with a route with parameters
+    When I add a route with a different pattern that matches some of the same paths
+    Then the route is added
+    And the route added first is used for the paths matched by both routes.
+    """
+    router = SimpleRouter()
+    router.add_route("/items/{name}/", sample_func_view)
+    router.add_route("/items/{id:d}/", sample_func_view)
+
+    assert len(router.routes) == 2
+    assert router.resolve("/items/12/").params == {"name": "12"}
+
+
+def test_simple_router_add_routes(sample_func_view, sample_class_view):
+    """
+    Given a router
+    When I add multiple routes using `add_routes` method
+    Then all routes are added in the given order.
+    """
+    router = SimpleRouter()
+    router.add_routes(
+        [
+            ("/", sample_func_view),
+            ("/users/{id:d}", sample_class_view, ["get", "post"]),
+            {"path": "/posts/", "view": sample_func_view, "methods": ["get"]},
+        ]
+    )
+
+    assert [route.path for route in router.routes] == ["/", "/users/{id:d}/", "/posts/"]
+    assert router.routes[1].methods == ["get", "post"]
+    assert router.resolve("/users/3/").params == {"id": 3}
+    assert router.resolve("/posts/").view == sample_func_view
+
+
+@pytest.mark.parametrize(
+    "routes",
+    (
+        [("/users/{id}/",), ("/posts/",), ("/users/{pk}",)],
+        [("/posts/",), ("/posts/",)],
+        [("/posts/",), ("/existing/",)],
+    ),
+)
+def test_simple_router_add_routes_with_existing_path(sample_func_view, routes):
+    """
+    Given a router with a route
+    When I add multiple routes and one of them has the same pattern as another route
+    Then an AttributeError should be raised
+    And none of the routes should be added.
+    """
+    router = SimpleRouter()
+    router.add_route("/existing/", sample_func_view)
+
+    with pytest.raises(AttributeError):
+        router.add_routes([(path, sample_func_view) for path, in routes])
+
+    assert len(router.routes) == 1
+    assert router.resolve("/posts/") is None
+
+
+@pytest.mark.parametrize("cache_size", (0, -1))
+def test_simple_router_with_invalid_cache_size(cache_size):
+    """
+    When I create a router with a cache size that is not a positive number
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        SimpleRouter(cache_size=cache_size)
+
+
+def test_simple_router_cache_disabled_by_default(sample_func_view):
+    """
+    Given a router created without the cache size
+    When I resolve paths
+    Then nothing is cached.
+    """
+    router = SimpleRouter()
+    router.add_route("/hello/{name}/", sample_func_view)
+
+    router.resolve("/hello/john/")
+    router.resolve("/hello/john/")
+
+    assert router.cache_info() == RouterCacheInfo(0, 0, 0, None, 0)
+
+
+def test_simple_router_cache_hits_and_misses(sample_func_view):
+    """
+    Given a router with the cache enabled
+    When I resolve the same paths more than once
+    Then only the first lookups are misses
+    And the paths that can't be resolved are cached as well
+    And the paths without parameters are not cached.
+    """
+    router = SimpleRouter(cache_size=10)
+    router.add_route("/", sample_func_view)
+    router.add_route("/hello/{name}/", sample_func_view)
+
+    resolve_dynamic = router._resolve_dynamic  # pylint: disable=protected-access
+    with patch.object(
+        router, "_resolve_dynamic", wraps=resolve_dynamic
+    ) as mock_resolve_dynamic:
+        first = router.resolve("/hello/john/")
+        second = router.resolve("/hello/john")
+        assert router.resolve("/missing/") is None
+        assert router.resolve("/missing/") is None
+        router.resolve("/")
+
+    assert first.params == second.params == {"name": "john"}
+    assert mock_resolve_dynamic.call_count == 2
+    assert router.cache_info() == RouterCacheInfo(2, 2, 0, 10, 2)
+
+
+def test_simple_router_cache_evicts_least_recently_used_path(sample_func_view):
+    """
+    Given a router with a full cache
+    When I resolve a path that is not cached
+    Then the least recently used path is removed from the cache.
+    """
+    router = SimpleRouter(cache_size=2)
+    router.add_route("/hello/{name}/", sample_func_view)
+
+    router.resolve("/hello/a/")
+    router.resolve("/hello/b/")
+    router.resolve("/hello/a/")
+    router.resolve("/hello/c/")
+
+    assert router.cache_info() == RouterCacheInfo(1, 3, 1, 2, 2)
+
+    router.resolve("/hello/a/")
+    router.resolve("/hello/b/")
+
+    assert router.cache_info() == RouterCacheInfo(2, 4, 2, 2, 2)
+
+
+def test_simple_router_cache_cleared_after_adding_route(sample_func_view):
+    """
+    Given a router with a cached path that could not be resolved
+    When I add a route for that path
+    Then the path is resolved to the new route.
+    """
+    router = SimpleRouter(cache_size=10)
+    router.add_route("/hello/{name}/", sample_func_view)
+
+    assert router.resolve("/users/1/") is None
+
+    router.add_route("/users/{id:d}/", sample_func_view)
+
+    assert router.resolve("/users/1/").params == {"id": 1}
+    assert router.cache_info().current_size == 1
+
+
+def test_simple_router_remove_route(sample_func_view):
+    """
+    Given a router with routes with and without parameters
+    When I remove the routes
+    Then the removed routes are returned
+    And their paths can't be resolved anymore
+    And the other routes are kept.
+    """
+    router = SimpleRouter()
+    router.add_route("/", sample_func_view)
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/posts/{id:d}/", sample_func_view)
+
+    assert router.remove_route("/users/{pk:d}").path == "/users/{id:d}/"
+    assert router.remove_route("/").path == "/"
+
+    assert [route.path for route in router.routes] == ["/posts/{id:d}/"]
+    assert router.resolve("/users/1/") is None
+    assert router.resolve("/") is None
+    assert router.resolve("/posts/1/").params == {"id": 1}
+    assert not router.has_route("/users/{id:d}/")
+
+
+def test_simple_router_remove_route_with_non_existing_path(sample_func_view):
+    """
+    Given a router with a route
+    When I remove a route that doesn't exist
+    Then an exception is raised
+    And the route is kept.
+    """
+    router = SimpleRouter()
+    router.add_route("/users/{id:d}/", sample_func_view)
+
+    with pytest.raises(AttributeError, match="Route /users/{id}/ doesn't exist."):
+        router.remove_route("/users/{id}/")
+
+    assert len(router.routes) == 1
+
+
+def test_simple_router_remove_route_that_shadows_static_route(sample_func_view):
+    """
+    Given a router with a route with parameters that handles a path of a route
+        without parameters added later
+    When I remove the route with parameters
+    Then the path is resolved to the route without parameters
+    And the route can be added again.
+    """
+    router = SimpleRouter(cache_size=10)
+    router.add_route("/users/{name}/", sample_func_view)
+    router.add_route("/users/me/", sample_func_view)
+
+    assert router.resolve("/users/me/").path == "/users/{name}/"
+    assert router.resolve("/users/john/").path == "/users/{name}/"
+
+    router.remove_route("/users/{name}/")
+
+    assert router.resolve("/users/me/").path == "/users/me/"
+    assert router.resolve("/users/john/") is None
+
+    router.add_route("/users/{name}/", sample_func_view)
+
+    assert router.resolve("/users/me/").path == "/users/me/"
+    assert router.resolve("/users/john/").path == "/users/{name}/"
+
+
+def test_simple_router_resolve_while_routes_are_changed(sample_func_view):
+    """
+    Given a router with routes
+    When the routes are changed while a path is being resolved
+    Then the path is resolved using the routes from before the change.
+    """
+    router = SimpleRouter()
+    router.add_route("/users/{id:d}/", sample_func_view)
+
+    resolve_dynamic = router._resolve_dynamic  # pylint: disable=protected-access
+
+    def resolve_and_remove(dynamic, path):
+        router.remove_route("/users/{id:d}/")
+        return resolve_dynamic(dynamic, path)
+
+    with patch.object(router, "_resolve_dynamic", side_effect=resolve_and_remove):
+        assert router.resolve("/users/1/").params == {"id": 1}
+
+    assert router.resolve("/users/1/") is None
+
+
+def test_simple_router_cache_skips_outdated_results(sample_func_view):
+    """
+    Given a router with the cache enabled
+    When the routes are changed while a path is being resolved
+    Then the result is returned but not cached.
+    """
+    router = SimpleRouter(cache_size=10)
+    router.add_route("/hello/{name}/", sample_func_view)
+
+    resolve_dynamic = router._resolve_dynamic  # pylint: disable=protected-access
+
+    def resolve_and_clear(dynamic, path):
+        result = resolve_dynamic(dynamic, path)
+        router.cache_clear()
+        return result
+
+    with patch.object(router, "_resolve_dynamic", side_effect=resolve_and_clear):
+        assert router.resolve("/hello/john/").params == {"name": "john"}
+
+    assert router.cache_info().current_size == 0
+
+
+def test_simple_router_stats(sample_func_view):
+    """
+    Given a simple router that collects statistics
+    When I resolve paths
+    Then the hits of the routes and the match costs are counted.
+    """
+    router = SimpleRouter(collect_stats=True)
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/posts/{id:d}/", sample_func_view)
+
+    router.resolve("/posts/1/")
+    router.resolve("/posts/2/")
+    router.resolve("/users/1/")
+    router.resolve("/other/1/")
+
+    assert router.route_stats() == RouterStats(
+        {"/posts/{id:d}/": 2, "/users/{id:d}/": 1},
+        {1: 1, 2: 3},
+        ["/users/{id:d}/", "/posts/{id:d}/"],
+    )
+
+    router.reset_stats()
+
+    assert router.route_stats() == RouterStats(
+        {}, {}, ["/users/{id:d}/", "/posts/{id:d}/"]
+    )
+
+
+def test_simple_router_stats_disabled_by_default(sample_func_view):
+    """
+    Given a simple router
+    When I resolve paths
+    Then no statistics are collected.
+    """
+    router = SimpleRouter()
+    router.add_route("/users/{id:d}/", sample_func_view)
+
+    router.resolve("/users/1/")
+
+    assert router.route_stats() == RouterStats({}, {}, ["/users/{id:d}/"])
+
+
+class SyncThread:
+    """Thread that runs its target when it's started, in the current thread."""
+
+    def __init__(self, target, daemon):
+        self.target = target
+        self.daemon = daemon
+
+    def start(self):
+        """Run the target."""
+        self.target()
+
+
+@patch("ramka.routing.simple_router.Thread", SyncThread)
+def test_simple_router_reorder_routes(sample_func_view):
+    """
+    Given a simple router with routes that have different number of hits
+    When the routes are reordered
+    Then routes with more hits are checked earlier
+    And they are never moved before routes that can match the same paths.
+    """
+    router = SimpleRouter(reorder_interval=8)
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/users/{name}/", sample_func_view)
+    router.add_route("/posts/{id:d}/", sample_func_view)
+    router.add_route("/users/{id:d}/posts/", sample_func_view)
+
+    for path in ("/users/me/", "/posts/1/", "/posts/2/", "/posts/3/"):
+        router.resolve(path)
+
+    assert router.route_stats().scan_order == [
+        "/users/{id:d}/",
+        "/users/{name}/",
+        "/posts/{id:d}/",
+        "/users/{id:d}/posts/",
+    ]
+
+    for path in ("/posts/4/", "/posts/5/", "/users/a/", "/users/1/posts/"):
+        router.resolve(path)
+
+    expected_order = [
+        "/posts/{id:d}/",
+        "/users/{id:d}/",
+        "/users/{name}/",
+        "/users/{id:d}/posts/",
+    ]
+    assert router.route_stats().scan_order == expected_order
+    assert router.resolve("/users/1/").path == "/users/{id:d}/"
+    assert router.resolve("/users/me/").path == "/users/{name}/"
+    assert router.resolve("/posts/6/").path == "/posts/{id:d}/"
+    assert router.route_stats().match_costs[1] == 1
+
+    router.reorder_routes()
+
+    assert router.route_stats().scan_order == expected_order
+
+
+@patch("ramka.routing.simple_router.Thread")
+def test_simple_router_reorder_routes_in_background(mock_thread, sample_func_view):
+    """
+    Given a simple router with the reorder interval
+    When paths are resolved
+    Then routes are reordered in a background thread after each interval
+    And not in the thread that resolves the paths.
+    """
+    router = SimpleRouter(reorder_interval=2)
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/posts/{id:d}/", sample_func_view)
+
+    with patch.object(router, "reorder_routes") as mock_reorder_routes:
+        for index in range(5):
+            router.resolve(f"/posts/{index}/")
+
+    mock_reorder_routes.assert_not_called()
+    assert mock_thread.call_count == 2
+    mock_thread.assert_called_with(target=mock_reorder_routes, daemon=True)
+    assert mock_thread.return_value.start.call_count == 2
+
+
+def test_simple_router_reorder_routes_stored_overlaps_limit(sample_func_view):
+    """
+    Given a simple router with many routes
+    When the routes are reordered
+    Then the number of stored results of comparing patterns is limited
+    And the order of the routes is the same as without the limit.
+    """
+    router = SimpleRouter(collect_stats=True)
+    for index in range(6):
+        router.add_route(f"/items/{index}/{{id:d}}/", sample_func_view)
+    for index in range(6):
+        for _ in range(index):
+            router.resolve(f"/items/{index}/1/")
+
+    with patch("ramka.routing.simple_router._MAX_OVERLAPS", 3):
+        router.reorder_routes()
+
+    assert len(router._overlaps) == 3  # pylint: disable=protected-access
+    assert router.route_stats().scan_order == [
+        f"/items/{index}/{{id:d}}/" for index in reversed(range(6))
+    ]
+
+
+def test_simple_router_reorder_routes_after_removing_route(sample_func_view):
+    """
+    Given a simple router with reordered routes
+    When a route is removed and added again
+    Then the patterns of that route are compared again when routes are reordered
+    And results for the other routes are reused.
+    """
+    router = SimpleRouter(collect_stats=True)
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/users/{name}/", sample_func_view)
+    router.add_route("/posts/{id:d}/", sample_func_view)
+    for path in ("/posts/1/", "/posts/2/", "/users/me/"):
+        router.resolve(path)
+
+    router.reorder_routes()
+    router.remove_route("/posts/{id:d}/")
+    router.add_route("/posts/{id:d}/", sample_func_view)
+
+    with patch(
+        "ramka.routing.simple_router.patterns_can_overlap", wraps=patterns_can_overlap
+    ) as mock_patterns_can_overlap:
+        router.reorder_routes()
+
+    compared = [
+        (first.path, second.path)
+        for (first, second), _ in mock_patterns_can_overlap.call_args_list
+    ]
+    assert compared
+    assert all("/posts/{id:d}/" in paths for paths in compared)
+    assert router.route_stats().scan_order[0] == "/posts/{id:d}/"
+
+
+def test_simple_router_reorder_routes_in_progress(sample_func_view):
+    """
+    Given a simple router with routes being reordered by another thread
+    When I reorder the routes
+    Then nothing is done.
+    """
+    router = SimpleRouter(collect_stats=True)
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/posts/{id:d}/", sample_func_view)
+    router.resolve("/posts/1/")
+
+    with router._write_lock:  # pylint: disable=protected-access
+        router.reorder_routes()
+
+    assert router.route_stats().scan_order == ["/users/{id:d}/", "/posts/{id:d}/"]
+
+    router.reorder_routes()
+
+    assert router.route_stats().scan_order == ["/posts/{id:d}/", "/users/{id:d}/"]
+
+
+def test_simple_router_with_invalid_reorder_interval():
+    """
+    When I create a simple router with a reorder interval that is not positive
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        SimpleRouter(reorder_interval=0)
+
+
+def test_simple_router_preload_views():
+    """
+    Given a simple router with views given as dotted paths
+    When I preload the views
+    Then all views are imported.
+    """
+    router = SimpleRouter()
+    router.add_route("/errors/404/", "ramka.views:http_404_not_found")
+    router.add_route("/errors/{code:int}/", "ramka.views.default_error_handler")
+
+    assert not any(route.is_loaded for route in router.routes)
+
+    router.preload_views()
+
+    assert all(route.is_loaded for route in router.routes)
+    assert router.resolve("/errors/500/").view.__name__ == "default_error_handler"
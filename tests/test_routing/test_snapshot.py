@@ -0,0 +1,192 @@
+import pickle
+
+import pytest
+
+from ramka.middleware import CompressionMiddleware
+from ramka.routing import (
+    RegexRouter,
+    SimpleRouter,
+    TrieRouter,
+    routes_hash,
+    view_reference,
+)
+from ramka.routing.route import Route
+from ramka.views import BaseView
+
+
+def users_view(request, response, **kwargs):  # pylint: disable=unused-argument
+    """Sample function-based view used in the snapshots."""
+    response.text = "Users"
+
+
+class UserView(BaseView):  # pylint: disable=abstract-method
+    """Sample class-based view used in the snapshots."""
+
+    lifecycle = "singleton"
+
+    def get(self, request, response, **kwargs):  # pylint: disable=unused-argument
+        response.text = "User"
+
+
+ROUTES = [
+    ("/users/", users_view),
+    ("/users/{id:int}/", UserView),
+    ("/users/me/", users_view, ["get", "post"]),
+    ("/pages/{name}/", users_view),
+    ("/pages/about/", users_view),
+    {"path": "/files/{path:path}/", "view": users_view},
+    {
+        "path": "/health/",
+        "view": users_view,
+        "exclude_middleware": [CompressionMiddleware],
+    },
+]
+
+
+@pytest.mark.parametrize("router_class", (SimpleRouter, TrieRouter, RegexRouter))
+def test_router_snapshot(tmp_path, router_class):
+    """
+    Given a router with routes
+    When I save it to a snapshot and load it
+    Then the loaded router resolves paths the same as the original one.
+    """
+    router = router_class(cache_size=10)
+    router.add_routes(ROUTES)
+    router.resolve("/users/1/")
+    file_path = str(tmp_path / "routes.snapshot")
+
+    definitions_hash = router.save_snapshot(file_path)
+    loaded_router = router_class.load_snapshot(file_path, ROUTES)
+
+    assert isinstance(loaded_router, router_class)
+    assert definitions_hash == loaded_router.routes_hash() == router.routes_hash()
+    assert [route.path for route in loaded_router.routes] == [
+        route.path for route in router.routes
+    ]
+    assert loaded_router.resolve("/users/").view is users_view
+    assert loaded_router.resolve("/users/me/").allowed_methods == {"GET", "POST"}
+    assert loaded_router.resolve("/pages/about/").path == "/pages/{name}/"
+    assert loaded_router.resolve("/users/1/").params == {"id": 1}
+    assert loaded_router.resolve("/users/1/").find_handler("GET").__self__ is (
+        loaded_router.resolve("/users/2/").find_handler("GET").__self__
+    )
+    assert loaded_router.resolve("/files/a/b/").params == {"path": "a/b"}
+    assert loaded_router.resolve("/health/").exclude_middleware == (
+        CompressionMiddleware,
+    )
+    assert loaded_router.cache_info().hits == 1
+
+    with pytest.raises(AttributeError):
+        loaded_router.add_route("/users/{pk:d}/", users_view)
+
+
+def test_router_snapshot_stale(tmp_path):
+    """
+    Given a router saved to a snapshot
+    When I load the snapshot with different route definitions
+    Then a ValueError should be raised.
+    """
+    router = SimpleRouter()
+    router.add_routes(ROUTES)
+    file_path = str(tmp_path / "routes.snapshot")
+    router.save_snapshot(file_path)
+
+    with pytest.raises(ValueError):
+        SimpleRouter.load_snapshot(file_path, ROUTES[:-1])
+
+    with pytest.raises(ValueError):
+        SimpleRouter.load_snapshot(file_path, [("/users/", users_view, ["post"])])
+
+
+def test_router_snapshot_without_route_definitions(tmp_path):
+    """
+    Given a router saved to a snapshot
+    When I load the snapshot without route definitions
+    Then the snapshot is loaded
+    And a warning is issued that it can't be checked if it's stale.
+    """
+    router = SimpleRouter()
+    router.add_routes(ROUTES)
+    file_path = str(tmp_path / "routes.snapshot")
+    router.save_snapshot(file_path)
+
+    with pytest.warns(UserWarning, match="without route definitions"):
+        loaded_router = SimpleRouter.load_snapshot(file_path)
+
+    assert loaded_router.routes_hash() == router.routes_hash()
+
+
+def test_router_snapshot_with_another_router(tmp_path):
+    """
+    Given a simple router saved to a snapshot
+    When I load the snapshot as a trie router
+    Then a ValueError should be raised.
+    """
+    router = SimpleRouter()
+    file_path = str(tmp_path / "routes.snapshot")
+    router.save_snapshot(file_path)
+
+    with pytest.raises(ValueError):
+        TrieRouter.load_snapshot(file_path)
+
+
+@pytest.mark.parametrize(
+    "content", ({"version": 0, "router": SimpleRouter()}, ["not", "a", "snapshot"])
+)
+def test_router_snapshot_invalid(tmp_path, content):
+    """
+    Given a file that is not a valid snapshot
+    When I load it
+    Then a ValueError should be raised.
+    """
+    file_path = tmp_path / "routes.snapshot"
+    file_path.write_bytes(pickle.dumps(content))
+
+    with pytest.raises(ValueError):
+        SimpleRouter.load_snapshot(str(file_path))
+
+
+def test_view_reference():
+    """
+    When I get references of views defined on the module level
+    Then their dotted paths are returned.
+    """
+    assert view_reference(users_view) == f"{__name__}:users_view"
+    assert view_reference(UserView) == f"{__name__}:UserView"
+
+
+def test_view_reference_with_local_view(sample_func_view):
+    """
+    When I get a reference of a view defined inside a function
+    Then a ValueError should be raised.
+    """
+    with pytest.raises(ValueError):
+        view_reference(sample_func_view)
+
+    with pytest.raises(ValueError):
+        view_reference(object())
+
+
+def test_routes_hash():
+    """
+    Given two lists of routes
+    When I calculate their hashes
+    Then the hashes are equal only if the route definitions are equal.
+    """
+    first_routes = [Route("/users/", users_view), Route("/users/{id}/", UserView)]
+    second_routes = [Route("/users/", users_view), Route("/users/{id}/", UserView)]
+
+    assert routes_hash(first_routes) == routes_hash(second_routes)
+    assert routes_hash(first_routes) != routes_hash(reversed(second_routes))
+    assert routes_hash(first_routes) != routes_hash(
+        [
+            Route("/users/", users_view),
+            Route("/users/{id}/", UserView, None, "thread_local"),
+        ]
+    )
+    assert routes_hash(first_routes) != routes_hash(
+        [
+            Route("/users/", users_view, middleware=[CompressionMiddleware]),
+            Route("/users/{id}/", UserView),
+        ]
+    )
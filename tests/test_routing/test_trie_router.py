@@ -0,0 +1,237 @@
+import pytest
+
+from ramka.routing import TrieRouter
+
+
+def test_trie_router_add_route(sample_func_view):
+    """
+    Given a trie router
+    When I add a route using `add_route` method
+    Then the router should have the route.
+    And that route should have the correct path and view.
+    """
+    router = TrieRouter()
+
+    assert not router.routes
+
+    router.add_route("/users", sample_func_view)
+
+    assert len(router.routes) == 1
+
+    route = router.routes[0]
+    assert route.path == "/users/"
+    assert route.view == sample_func_view
+
+
+def test_trie_router_add_route_with_existing_path(sample_func_view):
+    """
+    Given a trie router with a route
+    When I add a route with the same path
+    Then an AttributeError should be raised.
+    """
+    router = TrieRouter()
+    router.add_route("/users/", sample_func_view)
+
+    with pytest.raises(AttributeError):
+        router.add_route("/users", sample_func_view)
+
+
+def test_trie_router_route():
+    """
+    Given a trie router
+    When I add a route using `route` decorator
+    Then the router should have the route.
+    """
+    router = TrieRouter()
+
+    @router.route("/")
+    def sample_view(_, response):
+        response.text = "Hello, world!"
+
+    assert len(router.routes) == 1
+    assert router.routes[0].view is sample_view
+
+
+@pytest.mark.parametrize(
+    "path,expected_route,expected_params",
+    (
+        ("/", "/", {}),
+        ("/users", "/users/", {}),
+        ("/users/12/", "/users/{id:d}/", {"id": 12}),
+        ("/users/john/", "/users/{name}/", {"name": "john"}),
+        (
+            "/users/12/posts/3/",
+            "/users/{id:d}/posts/{post_id:d}/",
+            {"id": 12, "post_id": 3},
+        ),
+        (
+            "/files/report.pdf/",
+            "/files/{name}.{extension}/",
+            {"name": "report", "extension": "pdf"},
+        ),
+        ("/{braces}/", "/{{braces}}/", {}),
+    ),
+)
+def test_trie_router_resolve(sample_func_view, path, expected_route, expected_params):
+    """
+    Given a trie router with static and dynamic routes
+    When I resolve a path
+    Then the correct route is returned
+    And the parameters are converted to correct types.
+    """
+    router = TrieRouter()
+    router.add_route("/", sample_func_view)
+    router.add_route("/users/", sample_func_view)
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/users/{name}/", sample_func_view)
+    router.add_route("/users/{id:d}/posts/{post_id:d}/", sample_func_view)
+    router.add_route("/files/{name}.{extension}/", sample_func_view)
+    router.add_route("/{{braces}}/", sample_func_view)
+
+    resolved_route = router.resolve(path)
+
+    assert resolved_route.path == expected_route
+    assert resolved_route.params == expected_params
+
+
+@pytest.mark.parametrize(
+    "path",
+    ("/another-view/", "/users/12/posts/", "/users/12/posts/abc/", "/users/a/b/"),
+)
+def test_trie_router_resolve_with_non_existing_path(sample_func_view, path):
+    """
+    Given a trie router
+    When I resolve a path that does not exist
+    Then `None` should be returned.
+    """
+    router = TrieRouter()
+    router.add_route("/users/{name}/", sample_func_view)
+    router.add_route("/users/{id:d}/posts/{post_id:d}/", sample_func_view)
+
+    assert router.resolve(path) is None
+
+
+def test_trie_router_resolve_uses_registration_order(sample_func_view):
+    """
+    Given a trie router with overlapping routes
+    When I resolve a path that matches more than one route
+    Then the route that has been added first is returned, the same as in
+        `SimpleRouter`.
+    """
+    router = TrieRouter()
+    router.add_route("/items/{name:w}/", sample_func_view)
+    router.add_route("/items/{id:d}/", sample_func_view)
+    router.add_route("/items/{id:d}/details/", sample_func_view)
+    router.add_route("/items/{name}/details/", sample_func_view)
+
+    assert router.resolve("/items/5/").path == "/items/{name:w}/"
+    assert router.resolve("/items/5/").params == {"name": "5"}
+    assert router.resolve("/items/5/details/").path == "/items/{id:d}/details/"
+    assert router.resolve("/items/abc/details/").path == "/items/{name}/details/"
+
+
+def test_trie_router_resolve_with_static_and_dynamic_siblings(sample_func_view):
+    """
+    Given a trie router with static and dynamic routes on the same level
+    When I resolve paths that match one of them
+    Then the correct route is returned.
+    """
+    router = TrieRouter()
+    router.add_route("/pages/{page:d}/", sample_func_view)
+    router.add_route("/pages/latest/", sample_func_view)
+    router.add_route("/pages/{page:d}/edit/", sample_func_view)
+    router.add_route("/pages/{{page}}/edit/", sample_func_view)
+
+    assert router.resolve("/pages/latest/").path == "/pages/latest/"
+    assert router.resolve("/pages/3/").path == "/pages/{page:d}/"
+    assert router.resolve("/pages/3/edit/").path == "/pages/{page:d}/edit/"
+
+
+def test_trie_router_without_forced_trailing_slashes(sample_func_view):
+    """
+    Given a trie router that does not force trailing slashes
+    When I resolve paths with and without trailing slashes
+    Then they are treated as different paths.
+    """
+    router = TrieRouter(force_trailing_slashes=False)
+    router.add_route("/users", sample_func_view)
+
+    assert router.has_route("/users")
+    assert not router.has_route("/users/")
+
+
+def test_trie_router_resolve_skips_routes_added_later(sample_func_view):
+    """
+    Given a trie router with overlapping routes on different branches of the trie
+    When I resolve a path that matches more than one of them
+    Then the route that has been added first is returned.
+    """
+    router = TrieRouter(force_trailing_slashes=False)
+    router.add_route("/pages/{name:w}/archive", sample_func_view)
+    router.add_route("/pages/{page:d}/edit", sample_func_view)
+    router.add_route("/pages/{name:w}", sample_func_view)
+    router.add_route("/pages/{page:d}", sample_func_view)
+
+    assert router.resolve("/pages/5").path == "/pages/{name:w}"
+    assert router.resolve("/pages/5/edit").path == "/pages/{page:d}/edit"
+
+
+def test_trie_router_resolve_with_multi_segment_parameters(sample_func_view):
+    """
+    Given a trie router with routes that have parameters spanning multiple segments
+    When I resolve paths that match them
+    Then the route that has been added first is returned.
+    """
+    router = TrieRouter()
+    router.add_route("/files/{name}/", sample_func_view)
+    router.add_route("/files/{path:path}/", sample_func_view)
+    router.add_route("/files/{name}/{id:d}/", sample_func_view)
+
+    assert router.resolve("/files/a/").path == "/files/{name}/"
+    assert router.resolve("/files/a/b/c/").params == {"path": "a/b/c"}
+    assert router.resolve("/files/a/1/").path == "/files/{path:path}/"
+    assert router.resolve("/other/") is None
+
+
+def test_trie_router_remove_route(sample_func_view):
+    """
+    Given a trie router with routes that share segments
+    When I remove one of the routes
+    Then its path can't be resolved anymore
+    And the other routes are kept.
+    """
+    router = TrieRouter()
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/users/{id:d}/posts/", sample_func_view)
+    router.add_route("/files/{path:path}/", sample_func_view)
+
+    router.remove_route("/users/{id:d}/")
+
+    assert router.resolve("/users/1/") is None
+    assert router.resolve("/users/1/posts/").params == {"id": 1}
+    assert router.resolve("/files/a/b/").params == {"path": "a/b"}
+
+    router.remove_route("/files/{path:path}/")
+
+    assert router.resolve("/files/a/b/") is None
+
+
+def test_trie_router_add_route_keeps_previous_trie(sample_func_view):
+    """
+    Given a trie router with routes
+    When I add routes that share segments with the existing ones
+    Then the trie used before the change is not modified.
+    """
+    router = TrieRouter()
+    router.add_route("/users/{id:d}/", sample_func_view)
+    router.add_route("/users/me/", sample_func_view)
+    dynamic = router._table.dynamic  # pylint: disable=protected-access
+
+    router.add_route("/users/{id:d}/posts/", sample_func_view)
+    router.add_route("/users/me/posts/{id:d}/", sample_func_view)
+
+    resolve_dynamic = router._resolve_dynamic  # pylint: disable=protected-access
+    assert resolve_dynamic(dynamic, "/users/1/posts/") is None
+    assert resolve_dynamic(dynamic, "/users/me/posts/1/") is None
+    assert router.resolve("/users/1/posts/").params == {"id": 1}
+    assert router.resolve("/users/me/posts/1/").params == {"id": 1}
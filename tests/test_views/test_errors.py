@@ -1,10 +1,14 @@
+import json
 from unittest.mock import Mock, patch
 
+from ramka.request import BodyTooLargeError
 from ramka.views.errors import (
+    _ERROR_BODIES,
     _error_page,
     default_error_handler,
     http_404_not_found,
     http_405_method_not_allowed,
+    http_413_payload_too_large,
 )
 
 
@@ -20,7 +24,22 @@ def test_error_page():
 
     assert mock_response.status_code == 404
     assert mock_response.content_type == "application/json"
-    assert mock_response.text == '{"error": "Not found."}'
+    assert mock_response.body == b'{"error": "Not found."}'
+    assert mock_response.body is _ERROR_BODIES["Not found."]
+
+
+def test_error_page_with_custom_message():
+    """
+    Given a request
+    When I call the _error_page function with a message of an unhandled error
+    Then the body of the response is encoded for that message.
+    """
+    mock_response = Mock()
+
+    _error_page(mock_response, 500, "Zażółć")
+
+    assert mock_response.status_code == 500
+    assert json.loads(mock_response.body) == {"error": "Zażółć"}
 
 
 @patch("ramka.views.errors._error_page")
@@ -49,6 +68,19 @@ def test_http_405_not_found(mock_error_page):
     mock_error_page.assert_called_once_with(mock_response, 405, "Method not allowed.")
 
 
+@patch("ramka.views.errors._error_page")
+def test_http_413_payload_too_large(mock_error_page):
+    """
+    Given a response object
+    When I call the http_413_payload_too_large function
+    Then the _error_page function should be called with correct parameters.
+    """
+    mock_response = Mock()
+    http_413_payload_too_large(Mock(), mock_response)
+
+    mock_error_page.assert_called_once_with(mock_response, 413, "Payload too large.")
+
+
 @patch("ramka.views.errors._error_page")
 def test_default_error_handler(mock_error_page):
     """
@@ -60,3 +92,16 @@ def test_default_error_handler(mock_error_page):
     default_error_handler(Mock(), mock_response, ValueError("An error occurred."))
 
     mock_error_page.assert_called_once_with(mock_response, 500, "An error occurred.")
+
+
+@patch("ramka.views.errors._error_page")
+def test_default_error_handler_with_too_large_body(mock_error_page):
+    """
+    Given a response object
+    When I call the default_error_handler function with BodyTooLargeError
+    Then the 413 error page should be sent.
+    """
+    mock_response = Mock()
+    default_error_handler(Mock(), mock_response, BodyTooLargeError("Too large."))
+
+    mock_error_page.assert_called_once_with(mock_response, 413, "Payload too large.")